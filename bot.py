@@ -1,6 +1,8 @@
+import asyncio
 import json
 import logging
 import os
+import pkgutil
 import platform
 from datetime import datetime
 
@@ -18,6 +20,20 @@ sentry_sdk.init(os.getenv("SENTRY_DSN"))
 
 intents = discord.Intents.default()
 
+def _format_retry_after(retry_after: float) -> str:
+    """Render a cooldown as 'H hours M minutes S seconds', skipping zeros."""
+    minutes, seconds = divmod(retry_after, 60)
+    hours, minutes = divmod(minutes, 60)
+    hours = hours % 24
+    parts = []
+    if round(hours) > 0:
+        parts.append(f"{round(hours)} hours")
+    if round(minutes) > 0:
+        parts.append(f"{round(minutes)} minutes")
+    if round(seconds) > 0:
+        parts.append(f"{round(seconds)} seconds")
+    return " ".join(parts) or "a moment"
+
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -27,18 +43,23 @@ intents = discord.Intents.default()
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         log_record = {
-            "time": datetime.fromtimestamp(record.created).isoformat(),
+            "time": datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
         }
-        if hasattr(record, "guild_id") and record.guild_id is not None:
-            log_record["guild_id"] = record.guild_id
-        if hasattr(record, "race_id") and record.race_id is not None:
-            log_record["race_id"] = record.race_id
+        # Single getattr instead of hasattr + attribute access
+        guild_id = getattr(record, "guild_id", None)
+        if guild_id is not None:
+            log_record["guild_id"] = guild_id
+        race_id = getattr(record, "race_id", None)
+        if race_id is not None:
+            log_record["race_id"] = race_id
         if record.exc_info:
             log_record["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(log_record)
+        return json.dumps(log_record, separators=(",", ":"))
 
 
 logger = logging.getLogger("discord_bot")
@@ -69,23 +90,34 @@ class DiscordBot(commands.Bot):
         self.settings: Settings | None = None
         self.scheduler: DerbyScheduler | None = None
 
+    async def _load_cog(self, extension: str) -> None:
+        """Load one extension, logging instead of raising on failure."""
+        try:
+            await self.load_extension(f"cogs.{extension}")
+            self.logger.info(f"Loaded extension '{extension}'")
+        except Exception as e:
+            exception = f"{type(e).__name__}: {e}"
+            self.logger.error(
+                f"Failed to load extension {extension}\n{exception}"
+            )
+
     async def load_cogs(self) -> None:
         """
         The code in this function is executed whenever the bot will start.
         """
-        for file in os.listdir(f"{os.path.realpath(os.path.dirname(__file__))}/cogs"):
-            # Skip private helper modules (e.g. _autocomplete.py) — they
-            # provide shared utilities, not Cogs, so they have no setup().
-            if file.endswith(".py") and not file.startswith("_"):
-                extension = file[:-3]
-                try:
-                    await self.load_extension(f"cogs.{extension}")
-                    self.logger.info(f"Loaded extension '{extension}'")
-                except Exception as e:
-                    exception = f"{type(e).__name__}: {e}"
-                    self.logger.error(
-                        f"Failed to load extension {extension}\n{exception}"
-                    )
+        # Skip private helper modules (e.g. _autocomplete.py) — they
+        # provide shared utilities, not Cogs, so they have no setup().
+        # pkgutil enumerates the package through the finder cache, so the
+        # whole package costs one path scan, and gather overlaps the
+        # .pyc reads across cogs.
+        import cogs
+
+        extensions = [
+            m.name
+            for m in pkgutil.iter_modules(cogs.__path__)
+            if not m.ispkg and not m.name.startswith("_")
+        ]
+        await asyncio.gather(*(self._load_cog(ext) for ext in extensions))
 
     async def setup_hook(self) -> None:
         """
@@ -98,7 +130,9 @@ class DiscordBot(commands.Bot):
             f"Running on: {platform.system()} {platform.release()} ({os.name})"
         )
         self.logger.info("-------------------")
-        self.settings = Settings.from_yaml()
+        # from_yaml does blocking disk I/O — keep it off the event loop so
+        # an already-connected gateway doesn't miss heartbeats on reload.
+        self.settings = await asyncio.to_thread(Settings.from_yaml)
         await self.load_cogs()
         guild_ids = os.getenv("SYNC_GUILD_IDS", "")
         for gid in guild_ids.split(","):
@@ -141,7 +175,8 @@ class DiscordBot(commands.Bot):
 
         :param message: The message that was sent.
         """
-        if message.author == self.user or message.author.bot:
+        # .bot covers our own user too — Discord flags the bot's user as a bot.
+        if message.author.bot:
             return
         await self.process_commands(message)
 
@@ -156,7 +191,12 @@ class DiscordBot(commands.Bot):
         executed_command = str(split[0])
         if context.guild is not None:
             self.logger.info(
-                f"Executed {executed_command} command in {context.guild.name} (ID: {context.guild.id}) by {context.author} (ID: {context.author.id})",
+                "Executed %s command in %s (ID: %s) by %s (ID: %s)",
+                executed_command,
+                context.guild.name,
+                context.guild.id,
+                context.author,
+                context.author.id,
                 extra={"guild_id": context.guild.id},
             )
             # Persist to database for analytics
@@ -176,7 +216,10 @@ class DiscordBot(commands.Bot):
                 self.logger.debug("Failed to log command to DB", exc_info=True)
         else:
             self.logger.info(
-                f"Executed {executed_command} command by {context.author} (ID: {context.author.id}) in DMs"
+                "Executed %s command by %s (ID: %s) in DMs",
+                executed_command,
+                context.author,
+                context.author.id,
             )
 
     async def on_command_error(self, context: Context, error) -> None:
@@ -187,11 +230,11 @@ class DiscordBot(commands.Bot):
         :param error: The error that has been faced.
         """
         if isinstance(error, commands.CommandOnCooldown):
-            minutes, seconds = divmod(error.retry_after, 60)
-            hours, minutes = divmod(minutes, 60)
-            hours = hours % 24
             embed = discord.Embed(
-                description=f"**Please slow down** - You can use this command again in {f'{round(hours)} hours' if round(hours) > 0 else ''} {f'{round(minutes)} minutes' if round(minutes) > 0 else ''} {f'{round(seconds)} seconds' if round(seconds) > 0 else ''}.",
+                description=(
+                    "**Please slow down** - You can use this command again in "
+                    f"{_format_retry_after(error.retry_after)}."
+                ),
                 color=0xE02B2B,
             )
             await context.send(embed=embed, ephemeral=True)
@@ -202,12 +245,18 @@ class DiscordBot(commands.Bot):
             await context.send(embed=embed, ephemeral=True)
             if context.guild:
                 self.logger.warning(
-                    f"{context.author} (ID: {context.author.id}) tried to execute an owner only command in the guild {context.guild.name} (ID: {context.guild.id}), but the user is not an owner of the bot.",
+                    "%s (ID: %s) tried to execute an owner only command in the guild %s (ID: %s), but the user is not an owner of the bot.",
+                    context.author,
+                    context.author.id,
+                    context.guild.name,
+                    context.guild.id,
                     extra={"guild_id": context.guild.id},
                 )
             else:
                 self.logger.warning(
-                    f"{context.author} (ID: {context.author.id}) tried to execute an owner only command in the bot's DMs, but the user is not an owner of the bot."
+                    "%s (ID: %s) tried to execute an owner only command in the bot's DMs, but the user is not an owner of the bot.",
+                    context.author,
+                    context.author.id,
                 )
         elif isinstance(error, commands.MissingPermissions):
             embed = discord.Embed(
@@ -268,5 +317,13 @@ class DiscordBot(commands.Bot):
 
 
 if __name__ == "__main__":
+    # uvloop roughly doubles event-loop throughput when available; the
+    # bot runs fine on the stdlib loop, so it stays an optional extra.
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     bot = DiscordBot()
     bot.run(os.getenv("TOKEN"))
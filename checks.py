@@ -13,13 +13,15 @@ GAME_CHANNEL_KEYS = (
 )
 
 
+def _role_names(ctx: commands.Context | None) -> set[str]:
+    """Return the author's role names as a set for O(1) membership tests."""
+    roles = getattr(getattr(ctx, "author", None), "roles", [])
+    return {name for role in roles if (name := getattr(role, "name", None))}
+
+
 def has_role(role_name: str) -> commands.Check:
     async def predicate(ctx: commands.Context) -> bool:
-        roles = getattr(getattr(ctx, "author", None), "roles", [])
-        for role in roles:
-            if getattr(role, "name", None) == role_name:
-                return True
-        return False
+        return role_name in _role_names(ctx)
 
     return commands.check(predicate)
 
@@ -36,11 +38,7 @@ def author_has_role(ctx: commands.Context | None, role_name: str | None) -> bool
         return True
     if ctx is None:
         return False
-    roles = getattr(getattr(ctx, "author", None), "roles", [])
-    for role in roles:
-        if getattr(role, "name", None) == role_name:
-            return True
-    return False
+    return role_name in _role_names(ctx)
 
 
 async def _load_guild_settings(ctx: commands.Context):
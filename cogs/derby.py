@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import random
 import re
+import time
 from datetime import datetime, timedelta
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ext.commands import Context
-from sqlalchemy import select
+from sqlalchemy import and_, bindparam, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+# Rust-backed JSON serializer for the debug dumps; the stdlib module
+# stays as a fallback so a bare install still works.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the install
+    orjson = None
 
 import checks
 from cogs._autocomplete import filter_choices
@@ -18,6 +28,7 @@ from core import repositories as core_repo
 from derby import abilities, appearance, commentary, descriptions, flavor_names, logic, models
 from derby import repositories as repo
 from economy import repositories as wallet_repo
+from economy.models import Wallet
 from rpg import repositories as rpg_repo
 from rpg.logic import get_racial_modifier
 
@@ -39,27 +50,118 @@ STAT_CHOICES = [
 ]
 
 
-async def racer_autocomplete(
-    interaction: discord.Interaction, current: str
-) -> list[app_commands.Choice[int]]:
-    """Autocomplete callback that suggests racers in the next race."""
-    sessionmaker = interaction.client.scheduler.sessionmaker
-    active = interaction.client.scheduler.active_races
-    guild_id = interaction.guild_id or 0
-    async with sessionmaker() as session:
-        race_result = await session.execute(
-            select(models.Race)
+# Built once at import — the hot betting paths all need "the next bettable
+# race plus its participants", and reusing the same statement object lets
+# SQLAlchemy's compiled cache hit on an identical cache key instead of
+# re-hashing a freshly constructed select() per call.
+_NEXT_RACE_STMT = (
+    select(models.Race, models.Racer)
+    .join(models.RaceEntry, models.RaceEntry.race_id == models.Race.id)
+    .join(models.Racer, models.Racer.id == models.RaceEntry.racer_id)
+    .where(
+        models.Race.id
+        == (
+            select(models.Race.id)
             .where(
-                models.Race.guild_id == guild_id,
+                models.Race.guild_id == bindparam("guild_id"),
                 models.Race.finished.is_(False),
+                models.Race.id.not_in(bindparam("active_ids", expanding=True)),
             )
             .order_by(models.Race.id)
+            .limit(1)
+            .scalar_subquery()
         )
-        races = race_result.scalars().all()
-        race = next((r for r in races if r.id not in active), None)
-        if race is None:
-            return []
-        racers = await repo.get_race_participants(session, race.id)
+    )
+)
+
+# The per-bet statements, hoisted for the same reason: every /race bet
+# runs both, and a module-level constant skips rebuilding the Select
+# tree per call on top of the compiled-SQL cache hit.
+_WALLET_BET_STMT = (
+    select(Wallet, models.Bet)
+    .outerjoin(
+        models.Bet,
+        and_(
+            models.Bet.user_id == Wallet.user_id,
+            models.Bet.race_id == bindparam("race_id"),
+            models.Bet.bet_type == bindparam("bet_type"),
+        ),
+    )
+    .where(
+        Wallet.user_id == bindparam("user_id"),
+        Wallet.guild_id == bindparam("guild_id"),
+    )
+)
+
+_FREE_BET_STMT = select(models.Bet).where(
+    models.Bet.race_id == bindparam("race_id"),
+    models.Bet.user_id == bindparam("user_id"),
+    models.Bet.is_free.is_(True),
+)
+
+
+# How long a cached (race, participants) pair stays fresh. Invalidation
+# on race lifecycle changes goes through scheduler.bust_next_race(); the
+# TTL is a safety net for anything that mutates races without busting.
+_NEXT_RACE_TTL = 5.0
+
+# /race info is spammable and racer stats only change through explicit
+# mutations, so cached lookups stay fresh for a minute; the mutating
+# commands pop their racer from the cache eagerly.
+_RACER_INFO_TTL = 60.0
+_RACER_INFO_CACHE_MAX = 1024
+
+
+async def _next_race_with_participants(
+    scheduler, guild_id: int
+) -> tuple[models.Race | None, list[models.Racer]]:
+    """Return (race, racers) for the next bettable race, or (None, []).
+
+    One round trip: the "next bettable race" is a LIMIT-1 scalar subquery
+    joined against the entries, so the race row and its participants come
+    back together. Results are cached per guild for a few seconds —
+    autocomplete alone can fire this several times per keystroke burst.
+    """
+    cache = getattr(scheduler, "_next_race_view_cache", None)
+    if cache is None:
+        cache = scheduler._next_race_view_cache = {}
+    now = time.monotonic()
+    hit = cache.get(guild_id)
+    if hit is not None and now - hit[0] < _NEXT_RACE_TTL:
+        return hit[1], hit[2]
+    # Pure read on a hot path (autocomplete, betting): prefer the
+    # scheduler's read-only pool so it never queues behind an in-flight
+    # write. Test doubles only carry sessionmaker — fall back to it.
+    sm = getattr(scheduler, "read_sessionmaker", None) or scheduler.sessionmaker
+    async with sm() as session:
+        result = await session.execute(
+            _NEXT_RACE_STMT,
+            {
+                "guild_id": guild_id,
+                "active_ids": list(scheduler.active_races),
+            },
+        )
+        rows = result.all()
+    if not rows:
+        race, racers = None, []
+    else:
+        race, racers = rows[0][0], [racer for _, racer in rows]
+    # Sessions here use expire_on_commit=False, so the instances stay
+    # usable after the session closes.
+    cache[guild_id] = (now, race, racers)
+    return race, racers
+
+
+async def racer_autocomplete(
+    interaction: discord.Interaction, current: str
+) -> list[app_commands.Choice[int]]:
+    """Autocomplete callback that suggests racers in the next race."""
+    guild_id = interaction.guild_id or 0
+    race, racers = await _next_race_with_participants(
+        interaction.client.scheduler, guild_id
+    )
+    if race is None:
+        return []
     return filter_choices(
         racers,
         current,
@@ -197,6 +299,12 @@ BET_PICK_COUNTS = {
 
 AMOUNT_PRESETS = [10, 25, 50, 100]
 
+# Serializes concurrent bets from the same user on the same race (e.g. a
+# quick-bet button and a slash command racing each other). Without this,
+# both paths read the same wallet balance and the later commit clobbers
+# the earlier debit.
+_bet_locks: dict[tuple[int, int], asyncio.Lock] = {}
+
 
 async def _execute_bet(
     bot,
@@ -221,7 +329,7 @@ async def _execute_bet(
     if bet_type == "superfecta" and len(racers) < 6:
         raise ValueError("Superfecta requires exactly 6 racers in the field.")
 
-    racer_ids_in_race = [r.id for r in racers]
+    racer_ids_in_race = {r.id for r in racers}
     for pick in picks:
         if pick not in racer_ids_in_race:
             raise ValueError("That racer isn't in the next race.")
@@ -237,8 +345,27 @@ async def _execute_bet(
     ]
     label = BET_TYPE_LABELS.get(bet_type, bet_type)
 
-    async with bot.scheduler.sessionmaker() as session:
-        wallet = await wallet_repo.get_wallet(session, user_id, guild_id)
+    if len(_bet_locks) > 256:
+        # Opportunistic sweep — idle locks from settled races.
+        for key in [k for k, v in _bet_locks.items() if not v.locked()]:
+            _bet_locks.pop(key, None)
+    lock = _bet_locks.setdefault((race.id, user_id), asyncio.Lock())
+    async with lock, bot.scheduler.sessionmaker() as session:
+        # Wallet and any existing bet of this type come back in one
+        # round trip instead of two sequential SELECTs.
+        row = (
+            await session.execute(
+                _WALLET_BET_STMT,
+                {
+                    "race_id": race.id,
+                    "bet_type": bet_type,
+                    "user_id": user_id,
+                    "guild_id": guild_id,
+                },
+            )
+        ).first()
+        wallet = row[0] if row else None
+        existing_bet = row[1] if row else None
         if wallet is None:
             gs = await bot.scheduler.guild_settings.get(guild_id)
             default_bal = resolve_guild_setting(gs, bot.settings, "default_wallet")
@@ -251,11 +378,8 @@ async def _execute_bet(
             if wallet.balance > 0:
                 raise ValueError("You can only place a free bet when your balance is 0.")
             free_check = await session.execute(
-                select(models.Bet).where(
-                    models.Bet.race_id == race.id,
-                    models.Bet.user_id == user_id,
-                    models.Bet.is_free.is_(True),
-                )
+                _FREE_BET_STMT,
+                {"race_id": race.id, "user_id": user_id},
             )
             if free_check.scalars().first() is not None:
                 raise ValueError("You already have a free bet on this race.")
@@ -264,14 +388,6 @@ async def _execute_bet(
 
         payout = int(amount * multiplier)
 
-        bet_result = await session.execute(
-            select(models.Bet).where(
-                models.Bet.race_id == race.id,
-                models.Bet.user_id == user_id,
-                models.Bet.bet_type == bet_type,
-            )
-        )
-        existing_bet = bet_result.scalars().first()
         old_amount = 0
         if existing_bet is not None:
             old_amount = existing_bet.amount
@@ -282,10 +398,16 @@ async def _execute_bet(
             raise ValueError("Insufficient balance.")
         if not is_free:
             wallet.balance -= amount
-        await session.commit()
-        if existing_bet is None:
-            await repo.create_bet(
-                session,
+        # One upsert instead of an insert-or-update branch: the unique
+        # uq_bets_race_user_type index lets the database decide
+        # atomically, so concurrent placements of the same bet type
+        # can't duplicate rows. Committed together with the wallet
+        # debit, so a single transaction (one fsync) covers the whole
+        # logical operation and the balance can never be debited
+        # without the bet being recorded.
+        await session.execute(
+            sqlite_insert(models.Bet)
+            .values(
                 race_id=race.id,
                 user_id=user_id,
                 racer_id=primary_racer_id,
@@ -295,16 +417,18 @@ async def _execute_bet(
                 racer_ids=racer_ids_json,
                 is_free=is_free,
             )
-        else:
-            await repo.update_bet(
-                session,
-                existing_bet.id,
-                racer_id=primary_racer_id,
-                amount=amount,
-                payout_multiplier=multiplier,
-                racer_ids=racer_ids_json,
-                is_free=is_free,
+            .on_conflict_do_update(
+                index_elements=["race_id", "user_id", "bet_type"],
+                set_={
+                    "racer_id": primary_racer_id,
+                    "amount": amount,
+                    "payout_multiplier": multiplier,
+                    "racer_ids": racer_ids_json,
+                    "is_free": is_free,
+                },
             )
+        )
+        await session.commit()
 
     if bet_type in ("win", "place"):
         pick_desc = f"**{pick_names[0]}**"
@@ -467,6 +591,11 @@ class BettingView(discord.ui.View):
         self.racers = racers
         self.odds = odds
         self.guild_id = race.guild_id
+        # Computed once per slip — every state transition rebuilds the
+        # embed and buttons, so don't re-sort or re-scan the field each
+        # time a button is clicked.
+        self._sorted_racers = sorted(racers, key=lambda r: r.name.lower())
+        self._names = {r.id: r.name for r in racers}
 
         self.state = "type_select"
         self.bet_type: str | None = None
@@ -507,7 +636,7 @@ class BettingView(discord.ui.View):
                 color=0xE67E22,
             )
             # Show the field
-            for r in sorted(self.racers, key=lambda r: r.name.lower()):
+            for r in self._sorted_racers:
                 mult = self.odds.get(r.id, 2.0)
                 embed.add_field(
                     name=r.name, value=f"{mult:.1f}x odds", inline=True,
@@ -518,10 +647,7 @@ class BettingView(discord.ui.View):
         needed = BET_PICK_COUNTS.get(self.bet_type, 1)
 
         if self.state == "picking":
-            picked_names = [
-                next((r.name for r in self.racers if r.id == p), "?")
-                for p in self.picks
-            ]
+            picked_names = [self._names.get(p, "?") for p in self.picks]
             lines = []
             ordinals = ["1st", "2nd", "3rd", "4th", "5th", "6th"]
             for i, name in enumerate(picked_names):
@@ -541,10 +667,7 @@ class BettingView(discord.ui.View):
             return embed
 
         if self.state == "amount":
-            picked_names = [
-                next((r.name for r in self.racers if r.id == p), "?")
-                for p in self.picks
-            ]
+            picked_names = [self._names.get(p, "?") for p in self.picks]
             if self.bet_type in ("win", "place"):
                 pick_desc = f"**{picked_names[0]}**"
             else:
@@ -563,10 +686,7 @@ class BettingView(discord.ui.View):
             return embed
 
         if self.state == "confirm":
-            picked_names = [
-                next((r.name for r in self.racers if r.id == p), "?")
-                for p in self.picks
-            ]
+            picked_names = [self._names.get(p, "?") for p in self.picks]
             if self.bet_type in ("win", "place"):
                 pick_desc = f"**{picked_names[0]}**"
             else:
@@ -627,8 +747,7 @@ class BettingView(discord.ui.View):
             self.add_item(cancel)
 
         elif self.state == "picking":
-            sorted_racers = sorted(self.racers, key=lambda r: r.name.lower())
-            for i, r in enumerate(sorted_racers):
+            for i, r in enumerate(self._sorted_racers):
                 disabled = r.id in self.picks
                 style = discord.ButtonStyle.success if disabled else discord.ButtonStyle.blurple
                 btn = discord.ui.Button(
@@ -815,6 +934,8 @@ class BettingView(discord.ui.View):
 class Derby(commands.Cog, name="derby"):
     def __init__(self, bot) -> None:
         self.bot = bot
+        # racer_id -> (cached_at, detached Racer) for /race info reads.
+        self._racer_info_cache: dict[int, tuple[float, models.Racer]] = {}
 
     async def cog_check(self, ctx: Context) -> bool:
         # Guild admins can run derby commands from any channel — useful for
@@ -839,33 +960,20 @@ class Derby(commands.Cog, name="derby"):
     async def race_upcoming(self, context: Context) -> None:
         await context.defer()
         guild_id = context.guild.id if context.guild else 0
-        async with self.bot.scheduler.sessionmaker() as session:
-            race_result = await session.execute(
-                select(models.Race)
-                .where(
-                    models.Race.guild_id == guild_id,
-                    models.Race.finished.is_(False),
-                )
-                .order_by(models.Race.id)
-            )
-            races = race_result.scalars().all()
-            active = self.bot.scheduler.active_races
-            race = next((r for r in races if r.id not in active), None)
-            if race is None:
-                await context.send("No upcoming race.", ephemeral=True)
-                return
-            racers = await repo.get_race_participants(session, race.id)
-            if not racers:
-                await context.send("No upcoming race.", ephemeral=True)
-                return
+        race, racers = await self._find_next_race(guild_id)
+        if race is None or not racers:
+            await context.send("No upcoming race.", ephemeral=True)
+            return
 
-            # Pre-load NPC names for any NPC-owned racers
-            npc_names: dict[int, str] = {}
-            npc_ids = {r.npc_id for r in racers if r.npc_id}
-            for npc_id in npc_ids:
-                npc = await repo.get_npc(session, npc_id)
-                if npc:
-                    npc_names[npc_id] = f"{npc.emoji} {npc.name}".strip() if npc.emoji else npc.name
+        # Pre-load NPC names for any NPC-owned racers
+        npc_names: dict[int, str] = {}
+        npc_ids = {r.npc_id for r in racers if r.npc_id}
+        if npc_ids:
+            async with self.bot.scheduler.sessionmaker() as session:
+                for npc_id in npc_ids:
+                    npc = await repo.get_npc(session, npc_id)
+                    if npc:
+                        npc_names[npc_id] = f"{npc.emoji} {npc.name}".strip() if npc.emoji else npc.name
 
         # Load pre-picked track info
         race_map = None
@@ -909,6 +1017,9 @@ class Derby(commands.Cog, name="derby"):
                 except discord.NotFound:
                     owner_names[pid] = f"Player #{pid}"
 
+        # One joined description instead of a field per racer \u2014 far fewer
+        # embed allocations and a smaller payload to Discord.
+        lines = []
         for r in sorted(racers, key=lambda r: r.name.lower()):
             mult = odds.get(r.id, 0)
             rlabel = logic.rank_label(getattr(r, "rank", None))
@@ -919,32 +1030,41 @@ class Derby(commands.Cog, name="derby"):
                 owner_tag = owner_names.get(r.owner_id, f"Player #{r.owner_id}")
             else:
                 owner_tag = "Unowned"
-            embed.add_field(
-                name=f"{r.name} [{rlabel}] (#{r.id})",
-                value=f"{mult:.1f}x \u2014 bet 100, win {int(100 * mult)}\nOwner: {owner_tag}",
-                inline=False,
+            lines.append(
+                f"**{r.name}** [{rlabel}] (#{r.id})\n"
+                f"{mult:.1f}x \u2014 bet 100, win {int(100 * mult)} \u2014 {owner_tag}"
             )
+        embed.description = "\n".join(lines)
         embed.set_footer(text="Use /race bet to place your bet!")
         await context.send(embed=embed)
 
     async def _find_next_race(self, guild_id: int):
         """Return (race, racers) for the next bettable race, or (None, [])."""
+        return await _next_race_with_participants(self.bot.scheduler, guild_id)
+
+    async def _get_racer_cached(self, racer_id: int) -> models.Racer | None:
+        """Read-through cache for display-only racer lookups.
+
+        The session is closed before the racer is returned, so the cached
+        instance is detached and safe to share across invocations.
+        Mutating commands call :meth:`_bust_racer`; the TTL covers
+        anything that forgets to.
+        """
+        now = time.monotonic()
+        hit = self._racer_info_cache.get(racer_id)
+        if hit is not None and now - hit[0] < _RACER_INFO_TTL:
+            return hit[1]
         async with self.bot.scheduler.sessionmaker() as session:
-            race_result = await session.execute(
-                select(models.Race)
-                .where(
-                    models.Race.guild_id == guild_id,
-                    models.Race.finished.is_(False),
-                )
-                .order_by(models.Race.id)
-            )
-            races = race_result.scalars().all()
-            active = self.bot.scheduler.active_races
-            race = next((r for r in races if r.id not in active), None)
-            if race is None:
-                return None, []
-            racers = await repo.get_race_participants(session, race.id)
-        return race, racers
+            racer = await repo.get_racer(session, racer_id)
+        if racer is not None:
+            if len(self._racer_info_cache) >= _RACER_INFO_CACHE_MAX:
+                self._racer_info_cache.clear()
+            self._racer_info_cache[racer_id] = (now, racer)
+        return racer
+
+    def _bust_racer(self, racer_id: int) -> None:
+        """Drop a racer from the info cache after a mutation."""
+        self._racer_info_cache.pop(racer_id, None)
 
     async def _place_bet(
         self,
@@ -953,9 +1073,15 @@ class Derby(commands.Cog, name="derby"):
         picks: list[int],
         amount: int,
     ) -> None:
-        """Shared logic for all slash-command bet commands."""
+        """Shared logic for all slash-command bet commands.
+
+        Owns the defer so the Discord ack round trip can overlap the
+        next-race lookup instead of running before it.
+        """
         guild_id = context.guild.id if context.guild else 0
-        race, racers = await self._find_next_race(guild_id)
+        _, (race, racers) = await asyncio.gather(
+            context.defer(), self._find_next_race(guild_id),
+        )
         if race is None or not racers:
             await context.send("No race available.", ephemeral=True)
             return
@@ -970,9 +1096,10 @@ class Derby(commands.Cog, name="derby"):
 
     @race.command(name="bet", description="Open the interactive betting slip")
     async def race_bet(self, context: Context) -> None:
-        await context.defer(ephemeral=True)
         guild_id = context.guild.id if context.guild else 0
-        race, racers = await self._find_next_race(guild_id)
+        _, (race, racers) = await asyncio.gather(
+            context.defer(ephemeral=True), self._find_next_race(guild_id),
+        )
         if race is None or not racers:
             await context.send("No race available.", ephemeral=True)
             return
@@ -987,14 +1114,12 @@ class Derby(commands.Cog, name="derby"):
     @app_commands.describe(racer="Racer to bet on", amount="Amount to bet")
     @app_commands.autocomplete(racer=racer_autocomplete)
     async def race_bet_win(self, context: Context, racer: int, amount: int) -> None:
-        await context.defer()
         await self._place_bet(context, "win", [racer], amount)
 
     @race.command(name="bet-place", description="Bet on a racer to place (1st or 2nd)")
     @app_commands.describe(racer="Racer to bet on", amount="Amount to bet")
     @app_commands.autocomplete(racer=racer_autocomplete)
     async def race_bet_place(self, context: Context, racer: int, amount: int) -> None:
-        await context.defer()
         await self._place_bet(context, "place", [racer], amount)
 
     @race.command(name="bet-exacta", description="Bet on exact 1st and 2nd place")
@@ -1006,7 +1131,6 @@ class Derby(commands.Cog, name="derby"):
     async def race_bet_exacta(
         self, context: Context, first: int, second: int, amount: int
     ) -> None:
-        await context.defer()
         await self._place_bet(context, "exacta", [first, second], amount)
 
     @race.command(name="bet-trifecta", description="Bet on exact 1st, 2nd, and 3rd place")
@@ -1021,7 +1145,6 @@ class Derby(commands.Cog, name="derby"):
     async def race_bet_trifecta(
         self, context: Context, first: int, second: int, third: int, amount: int
     ) -> None:
-        await context.defer()
         await self._place_bet(context, "trifecta", [first, second, third], amount)
 
     @race.command(
@@ -1045,7 +1168,6 @@ class Derby(commands.Cog, name="derby"):
         fourth: int, fifth: int, sixth: int,
         amount: int,
     ) -> None:
-        await context.defer()
         await self._place_bet(
             context, "superfecta",
             [first, second, third, fourth, fifth, sixth], amount,
@@ -1087,8 +1209,7 @@ class Derby(commands.Cog, name="derby"):
     @app_commands.autocomplete(racer=racer_autocomplete)
     async def race_info(self, context: Context, racer: int) -> None:
         await context.defer(ephemeral=True)
-        async with self.bot.scheduler.sessionmaker() as session:
-            racer_obj = await repo.get_racer(session, racer)
+        racer_obj = await self._get_racer_cached(racer)
         if racer_obj is None:
             await context.send("Racer not found", ephemeral=True)
             return
@@ -1139,9 +1260,8 @@ class Derby(commands.Cog, name="derby"):
         sire_id = getattr(racer_obj, "sire_id", None)
         dam_id = getattr(racer_obj, "dam_id", None)
         if sire_id or dam_id:
-            async with self.bot.scheduler.sessionmaker() as session:
-                sire = await repo.get_racer(session, sire_id) if sire_id else None
-                dam = await repo.get_racer(session, dam_id) if dam_id else None
+            sire = await self._get_racer_cached(sire_id) if sire_id else None
+            dam = await self._get_racer_cached(dam_id) if dam_id else None
             sire_name = sire.name if sire else "Unknown"
             dam_name = dam.name if dam else "Unknown"
             embed.add_field(
@@ -1443,6 +1563,7 @@ class Derby(commands.Cog, name="derby"):
                     await session.commit()
             else:
                 rank_change = None
+        self._bust_racer(racer)
         embed = discord.Embed(title=f"Racer Updated: {updated.name}")
         for key, new_val in updates.items():
             old_val = old_values[key]
@@ -1502,19 +1623,13 @@ class Derby(commands.Cog, name="derby"):
         await context.defer(ephemeral=True)
         guild_id = context.guild.id if context.guild else 0
         async with self.bot.scheduler.sessionmaker() as session:
-            result = await session.execute(
-                select(models.Race)
-                .where(
-                    models.Race.guild_id == guild_id,
-                    models.Race.finished.is_(False),
-                )
-                .order_by(models.Race.id)
-            )
-            race = result.scalars().first()
+            race = await repo.get_pending_race(session, guild_id)
             if race is None:
                 await context.send("No race to cancel", ephemeral=True)
                 return
             await repo.delete_race(session, race.id)
+        self.bot.scheduler.bust_next_race(guild_id)
+        self.bot.scheduler.cancel_commentary(race.id)
         await context.send(f"Race {race.id} cancelled")
 
     @derby_group.group(name="racer", description="Racer admin commands")
@@ -1533,6 +1648,7 @@ class Derby(commands.Cog, name="derby"):
                 await context.send("Racer not found", ephemeral=True)
                 return
             await repo.delete_racer(session, racer)
+        self._bust_racer(racer)
         await context.send(f"Racer **{racer_obj.name}** (#{racer}) deleted")
 
     @racer_group.command(name="injure", description="Injure a racer (2d4 races recovery)")
@@ -1554,6 +1670,7 @@ class Derby(commands.Cog, name="derby"):
                 injuries=description,
                 injury_races_remaining=recovery,
             )
+        self._bust_racer(racer)
         embed = discord.Embed(
             title=f"\U0001f915 {racer_obj.name} Injured!",
             description=f"**{description}**\nOut for **{recovery} races** (2d4)",
@@ -1579,6 +1696,7 @@ class Derby(commands.Cog, name="derby"):
             await repo.update_racer(
                 session, racer, injuries="", injury_races_remaining=0
             )
+        self._bust_racer(racer)
         embed = discord.Embed(
             title=f"\U0001f489 {racer_obj.name} Healed!",
             description=f"**{racer_obj.name}** has been healed and is ready to race!",
@@ -2009,15 +2127,7 @@ class Derby(commands.Cog, name="derby"):
         guild_id = context.guild.id if context.guild else 0
         async with self.bot.scheduler.sessionmaker() as session:
             if race_id is None:
-                result = await session.execute(
-                    select(models.Race)
-                    .where(
-                        models.Race.guild_id == guild_id,
-                        models.Race.finished.is_(False),
-                    )
-                    .order_by(models.Race.id)
-                )
-                race = result.scalars().first()
+                race = await repo.get_pending_race(session, guild_id)
             else:
                 race = await repo.get_race(session, race_id)
                 if race is not None and race.finished:
@@ -2040,8 +2150,16 @@ class Derby(commands.Cog, name="derby"):
                 await context.send("Not enough racers available", ephemeral=True)
                 return
             race_map = logic.pick_map()
-            result = logic.simulate_race(
-                {"racers": participants}, seed=race.id, race_map=race_map
+            # The sim is pure CPU (per-segment rolls for every racer), so
+            # run it on a worker thread instead of stalling the gateway
+            # heartbeat. The participants are fully loaded and the session
+            # sits idle during the call, so the thread only does plain
+            # attribute reads — no ORM I/O crosses threads.
+            result = await asyncio.to_thread(
+                logic.simulate_race,
+                {"racers": participants},
+                seed=race.id,
+                race_map=race_map,
             )
             winner_id = result.placements[0] if result.placements else None
             placements_json = json.dumps(result.placements)
@@ -2049,6 +2167,7 @@ class Derby(commands.Cog, name="derby"):
                 session, race.id, finished=True, winner_id=winner_id,
                 placements=placements_json,
             )
+            self.bot.scheduler.bust_next_race(guild_id)
             bet_results = await logic.resolve_payouts(
                 session, race.id, result.placements, guild_id=guild_id
             )
@@ -2088,24 +2207,37 @@ class Derby(commands.Cog, name="derby"):
             stat_gains = await logic.apply_placement_stat_gains(
                 session, result.placements, participants, race_map, prize_list,
             )
+            # Collect retirements and successor racers, then flush each as
+            # a single statement instead of two round trips per racer.
+            retire_ids: list[int] = []
+            new_racers: list[dict] = []
             for r in participants:
                 r.races_completed += 1
                 if r.races_completed >= r.career_length:
-                    await repo.update_racer(session, r.id, retired=True)
+                    retire_ids.append(r.id)
                     cl = random.randint(25, 40)
-                    await repo.create_racer(
-                        session,
-                        name=f"{r.name} II",
-                        owner_id=r.owner_id,
-                        guild_id=guild_id,
-                        speed=random.randint(0, 31),
-                        cornering=random.randint(0, 31),
-                        stamina=random.randint(0, 31),
-                        temperament=random.choice(list(logic.TEMPERAMENTS)),
-                        career_length=cl,
-                        peak_end=int(cl * 0.6),
-                    )
+                    new_racers.append({
+                        "name": f"{r.name} II",
+                        "owner_id": r.owner_id,
+                        "guild_id": guild_id,
+                        "speed": random.randint(0, 31),
+                        "cornering": random.randint(0, 31),
+                        "stamina": random.randint(0, 31),
+                        "temperament": random.choice(list(logic.TEMPERAMENTS)),
+                        "career_length": cl,
+                        "peak_end": int(cl * 0.6),
+                    })
+            if retire_ids:
+                await session.execute(
+                    update(models.Racer)
+                    .where(models.Racer.id.in_(retire_ids))
+                    .values(retired=True)
+                )
+                await session.execute(insert(models.Racer), new_racers)
             await session.commit()
+        # Races mutate every participant (mood, career, retirement).
+        for r in participants:
+            self._bust_racer(r.id)
 
         # Reset training counters for all guild racers
         async with self.bot.scheduler.sessionmaker() as session:
@@ -2629,47 +2761,62 @@ class Derby(commands.Cog, name="derby"):
     async def debug_race(self, context: Context, race_id: int) -> None:
         await context.defer()
         async with self.bot.scheduler.sessionmaker() as session:
-            race = await repo.get_race(session, race_id)
-            if race is None:
-                await context.send("Race not found", ephemeral=True)
-                return
-            bets = (
+            # These rows are serialized once and discarded, so query the
+            # Table objects directly (Core, not ORM) and build plain dicts
+            # from the row mappings — no instrumented attributes, no
+            # identity-map bookkeeping.
+            race_row = (
                 (
                     await session.execute(
-                        select(models.Bet).where(models.Bet.race_id == race_id)
+                        select(models.Race.__table__).where(
+                            models.Race.__table__.c.id == race_id
+                        )
                     )
                 )
-                .scalars()
-                .all()
-            )
-            racer_ids = {b.racer_id for b in bets}
-            if racer_ids:
-                racers = (
-                    (
-                        await session.execute(
-                            select(models.Racer).where(models.Racer.id.in_(racer_ids))
+                .mappings()
+                .first()
+            )
+            if race_row is None:
+                await context.send("Race not found", ephemeral=True)
+                return
+            # One outerjoined select instead of bets-then-racers: the bet
+            # rows carry their racer alongside, so there is no second
+            # round trip and no intermediate racer-id set. Keyed by
+            # Column objects because the two tables share column names.
+            bet_t = models.Bet.__table__
+            racer_t = models.Racer.__table__
+            rows = (
+                await session.execute(
+                    select(bet_t, racer_t)
+                    .select_from(
+                        bet_t.outerjoin(
+                            racer_t, racer_t.c.id == bet_t.c.racer_id
                         )
                     )
-                    .scalars()
-                    .all()
+                    .where(bet_t.c.race_id == race_id)
                 )
-            else:
-                racers = []
+            ).all()
+            bets = [
+                {c.key: row._mapping[c] for c in bet_t.c} for row in rows
+            ]
+            seen: dict[int, dict] = {}
+            for row in rows:
+                rid = row._mapping[racer_t.c.id]
+                if rid is not None and rid not in seen:
+                    seen[rid] = {c.key: row._mapping[c] for c in racer_t.c}
+            participants = list(seen.values())
             data = {
-                "race": {c.key: getattr(race, c.key) for c in race.__table__.columns},
-                "bets": [
-                    {c.key: getattr(b, c.key) for c in b.__table__.columns}
-                    for b in bets
-                ],
-                "participants": [
-                    {c.key: getattr(r, c.key) for c in r.__table__.columns}
-                    for r in racers
-                ],
+                "race": dict(race_row),
+                "bets": bets,
+                "participants": participants,
             }
-        await context.send(
-            f"```json\n{json.dumps(data, default=str, indent=2)}\n```",
-            ephemeral=True,
-        )
+        if orjson is not None:
+            payload = orjson.dumps(
+                data, default=str, option=orjson.OPT_INDENT_2
+            ).decode()
+        else:
+            payload = json.dumps(data, default=str, indent=2)
+        await context.send(f"```json\n{payload}\n```", ephemeral=True)
 
 
     # -- Guild settings commands --------------------------------------------
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic_settings import BaseSettings
 
+# libyaml-backed loader when PyYAML was built with it; same parse,
+# done in C instead of interpreted Python.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Settings(BaseSettings):
     race_times: list[str] = ["09:00", "15:00", "21:00"]
@@ -68,10 +76,19 @@ class Settings(BaseSettings):
 
     @classmethod
     def from_yaml(cls, path: str | Path = Path("config.yaml")) -> "Settings":
-        data: dict[str, Any]
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        return cls(**data)
+        # Resolve before caching so "config.yaml" and Path("config.yaml")
+        # share a cache entry.
+        return _load_settings(str(Path(path).resolve()))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_settings(path: str) -> Settings:
+    """Read and parse *path* once per process; tests that rewrite the
+    config can call ``_load_settings.cache_clear()``."""
+    data: dict[str, Any]
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader) or {}
+    return Settings(**data)
 
 
 def resolve_guild_setting(
@@ -6,17 +6,22 @@ import glob
 import os
 import random
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, List, Sequence, Set, Tuple
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Dict, Final, List, Sequence, Set, Tuple
 
 import yaml
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from economy.models import Wallet
 from . import models
 
-TEMPERAMENTS = {
+# Read-only view: game balance data, not runtime state. The proxy makes
+# accidental mutation a TypeError and tells static tooling the table is
+# safe to treat as constant.
+TEMPERAMENTS: Final = MappingProxyType({
     "Agile": {"up": "speed", "down": "stamina"},
     "Reckless": {"up": "speed", "down": "cornering"},
     "Tactical": {"up": "cornering", "down": "speed"},
@@ -24,9 +29,14 @@ TEMPERAMENTS = {
     "Steady": {"up": "stamina", "down": "speed"},
     "Sharpshift": {"up": "cornering", "down": "stamina"},
     "Quirky": {"up": None, "down": None},
-}
+})
+
+TEMPERAMENT_MODIFIER: Final = 0.1
 
-TEMPERAMENT_MODIFIER = 0.1
+# Flat (up, down) tuple per temperament — apply_temperament runs per
+# racer per odds/sim call, so one lookup beats the nested dict walk.
+_TEMP_TABLE = {name: (v["up"], v["down"]) for name, v in TEMPERAMENTS.items()}
+_NO_TEMP = (None, None)
 
 MOOD_LABELS = {
     1: "Awful",
@@ -306,7 +316,8 @@ def generate_pool_racer(guild_id: int, taken_names: Set[str]) -> dict:
         "peak_end": int(career_length * 0.6),
         "gender": random.choice(["M", "F"]),
         "rank": calculate_rank(speed, cornering, stamina),
-        "pool_expires_at": datetime.utcnow() + timedelta(hours=random.uniform(24, 48)),
+        "pool_expires_at": datetime.now(timezone.utc).replace(tzinfo=None)
+        + timedelta(hours=random.uniform(24, 48)),
     }
 
 
@@ -949,12 +960,7 @@ def apply_temperament(
     """
 
     result = stats.copy()
-    t = TEMPERAMENTS.get(temperament)
-    if not t:
-        return result
-
-    up = t.get("up")
-    down = t.get("down")
+    up, down = _TEMP_TABLE.get(temperament, _NO_TEMP)
 
     if up is not None:
         result[up] = int(round(result[up] * (1 + modifier)))
@@ -1153,6 +1159,23 @@ def calculate_bet_odds(
     return round(max(multiplier, MIN_PAYOUT_MULTIPLIER), 2)
 
 
+def _ids(seq: Sequence) -> List[int]:
+    """Racer ids for a homogeneous sequence of Racer-likes or raw ints.
+
+    One dispatch on the first element instead of a hasattr (which is a
+    full getattr plus exception catch) per element.
+    """
+    if seq and hasattr(seq[0], "id"):
+        return [r.id for r in seq]
+    return [int(r) for r in seq]
+
+
+@lru_cache(maxsize=32)
+def _flat_payout(num: int, house_edge: float) -> float:
+    """Uniform payout for stat-less fields — same for every racer."""
+    return (1.0 - house_edge) * num
+
+
 def calculate_odds(
     racers: Sequence[models.Racer] | Sequence[int],
     course_segments: Sequence | None,
@@ -1168,10 +1191,8 @@ def calculate_odds(
         return {}
 
     if not hasattr(racers[0], "speed"):
-        num = len(racers)
-        base_prob = 1.0 / num
-        payout = (1.0 - house_edge) / base_prob
-        return {(r.id if hasattr(r, "id") else int(r)): payout for r in racers}
+        payout = _flat_payout(len(racers), house_edge)
+        return dict.fromkeys(_ids(racers), payout)
 
     probs = _win_probabilities(racers, race_map)
     result: Dict[int, float] = {}
@@ -1435,9 +1456,7 @@ def simulate_race(
         scored.sort(key=lambda x: x[1], reverse=True)
         placements = [rid for rid, _ in scored]
     else:
-        placements = [
-            r.id if hasattr(r, "id") else int(r) for r in raw_racers
-        ]
+        placements = _ids(raw_racers)
         rng.shuffle(placements)
 
     return RaceResult(
@@ -1736,6 +1755,22 @@ def _bet_wins(
     return False
 
 
+# Built once — resolve_payouts runs after every race, and a module-level
+# statement keeps the compiled-SQL cache keyed on one object instead of
+# re-hashing a fresh Select per call. Column tuples, not Bet entities:
+# the rows are read once and then bulk-deleted, so ORM hydration and
+# identity-map bookkeeping would be pure overhead.
+_BETS_BY_RACE_STMT = select(
+    models.Bet.user_id,
+    models.Bet.racer_id,
+    models.Bet.amount,
+    models.Bet.payout_multiplier,
+    models.Bet.bet_type,
+    models.Bet.racer_ids,
+    models.Bet.is_free,
+).where(models.Bet.race_id == bindparam("race_id"))
+
+
 async def resolve_payouts(
     session: AsyncSession,
     race_id: int,
@@ -1749,42 +1784,54 @@ async def resolve_payouts(
     """
 
     bet_rows = await session.execute(
-        select(models.Bet).where(models.Bet.race_id == race_id)
+        _BETS_BY_RACE_STMT, {"race_id": race_id}
     )
-    bets = bet_rows.scalars().all()
+    bets = bet_rows.all()
 
     results: List[Dict] = []
     if not bets:
         return results
 
-    for bet in bets:
-        wallet = (
+    # All wallets for the race's bettors in one IN query; missing ones
+    # are created in the same session and committed with everything else
+    # at the end (no per-wallet commit/refresh round trips).
+    bettor_ids = {bet.user_id for bet in bets}
+    wallets = {
+        w.user_id: w
+        for w in (
             await session.execute(
                 select(Wallet).where(
-                    Wallet.user_id == bet.user_id,
+                    Wallet.user_id.in_(bettor_ids),
                     Wallet.guild_id == guild_id,
                 )
             )
-        ).scalars().first()
-        if wallet is None:
-            wallet = Wallet(user_id=bet.user_id, guild_id=guild_id, balance=0)
-            session.add(wallet)
-            await session.commit()
-            await session.refresh(wallet)
+        ).scalars()
+    }
+    for user_id in bettor_ids - wallets.keys():
+        wallet = Wallet(user_id=user_id, guild_id=guild_id, balance=0)
+        session.add(wallet)
+        wallets[user_id] = wallet
 
+    _bet_mults: Dict[int, float] = {}
+    for bet in bets:
+        wallet = wallets[bet.user_id]
         bet_type = getattr(bet, "bet_type", "win") or "win"
         racer_ids_json = getattr(bet, "racer_ids", "[]") or "[]"
         won = _bet_wins(bet_type, bet.racer_id, racer_ids_json, placements)
         payout = int(bet.amount * bet.payout_multiplier) if won else 0
-        # Halfling bet payout bonus (+15%)
+        # Halfling bet payout bonus (+15%) — profile fetched once per
+        # winning bettor, not once per winning bet.
         if won and payout > 0:
-            from rpg.logic import get_racial_modifier as _get_rm
-            from rpg import repositories as _rpg_repo
-            _profile = await _rpg_repo.get_or_create_profile(
-                session, bet.user_id, guild_id
-            )
-            _bet_mult = _get_rm(_profile.race, "racing.bet_payout_multiplier", 1.0)
-            payout = int(payout * _bet_mult)
+            if bet.user_id not in _bet_mults:
+                from rpg.logic import get_racial_modifier as _get_rm
+                from rpg import repositories as _rpg_repo
+                _profile = await _rpg_repo.get_or_create_profile(
+                    session, bet.user_id, guild_id
+                )
+                _bet_mults[bet.user_id] = _get_rm(
+                    _profile.race, "racing.bet_payout_multiplier", 1.0
+                )
+            payout = int(payout * _bet_mults[bet.user_id])
         if won:
             wallet.balance += payout
 
@@ -1798,7 +1845,11 @@ async def resolve_payouts(
             "racer_ids": racer_ids_json,
             "is_free": getattr(bet, "is_free", False) or False,
         })
-        await session.delete(bet)
+
+    # Settled bets leave in one DELETE instead of one per row.
+    await session.execute(
+        delete(models.Bet).where(models.Bet.race_id == race_id)
+    )
 
     # Persist the biggest winning payout on the Race record for the daily digest
     winning_results = [r for r in results if r["won"] and r["payout"] > 0]
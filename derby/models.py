@@ -1,15 +1,34 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from db_base import Base
 
 
+def _utcnow() -> datetime:
+    """Naive UTC timestamp for column defaults.
+
+    Stored values stay identical to the old ``datetime.utcnow`` (and to
+    ``server_default=func.now()``), without the deprecated call.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Racer(Base):
     __tablename__ = "racers"
+    # Partial index over the live roster — nearly every racer query
+    # filters on guild_id with retired racers excluded, and the retired
+    # majority only grows as careers end.
+    __table_args__ = (
+        Index(
+            "ix_racers_active",
+            "guild_id",
+            sqlite_where=text("retired = 0"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     guild_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -47,10 +66,28 @@ class Racer(Base):
 
 class Race(Base):
     __tablename__ = "races"
+    # The "next race" lookup is WHERE guild_id = ? AND finished = 0
+    # ORDER BY id LIMIT 1; this partial index answers it with a single
+    # seek while staying tiny (at most a handful of pending rows).
+    __table_args__ = (
+        Index(
+            "ix_races_pending",
+            "guild_id",
+            "id",
+            sqlite_where=text("finished = 0"),
+        ),
+        # History and record queries scan finished races per guild in id
+        # order; this lets them run as an index range scan with no sort.
+        Index("ix_races_guild_finished_id", "guild_id", "finished", "id"),
+        # Daily digest pulls yesterday's races as a started_at range scan.
+        Index("ix_races_guild_started_at", "guild_id", "started_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     guild_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime, default=_utcnow, server_default=func.now()
+    )
     finished: Mapped[bool] = mapped_column(Boolean, default=False)
     winner_id: Mapped[int | None] = mapped_column(Integer, nullable=True, default=None)
     placements: Mapped[str | None] = mapped_column(String, nullable=True, default=None)
@@ -66,6 +103,17 @@ class Race(Base):
 
 class Bet(Base):
     __tablename__ = "bets"
+    # One bet per user per race per bet type, enforced by the database
+    # so concurrent bet placements upsert instead of duplicating.
+    __table_args__ = (
+        Index(
+            "uq_bets_race_user_type",
+            "race_id",
+            "user_id",
+            "bet_type",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     race_id: Mapped[int] = mapped_column(ForeignKey("races.id"), nullable=False)
@@ -168,7 +216,9 @@ class NPC(Base):
     loss_quips_used: Mapped[str] = mapped_column(String, default="[]")  # JSON list of indices
     emoji: Mapped[str] = mapped_column(String, default="")
     catchphrase: Mapped[str] = mapped_column(String, default="")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=_utcnow, server_default=func.now()
+    )
 
 
 class RacerBuff(Base):
@@ -182,7 +232,9 @@ class RacerBuff(Base):
     buff_type: Mapped[str] = mapped_column(String, nullable=False)  # speed/cornering/stamina/mood/all_stats
     value: Mapped[int] = mapped_column(Integer, nullable=False)
     races_remaining: Mapped[int] = mapped_column(Integer, default=1)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=_utcnow, server_default=func.now()
+    )
 
 
 class AbilityProcLog(Base):
@@ -200,7 +252,9 @@ class AbilityProcLog(Base):
     guild_id: Mapped[int] = mapped_column(Integer, nullable=False)
     ability_key: Mapped[str] = mapped_column(String, nullable=False)
     segment_index: Mapped[int] = mapped_column(Integer, nullable=False)
-    fired_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    fired_at: Mapped[datetime] = mapped_column(
+        DateTime, default=_utcnow, server_default=func.now()
+    )
     finish_position: Mapped[int | None] = mapped_column(Integer, nullable=True, default=None)
 
 
@@ -4,7 +4,7 @@ from typing import Type, TypeVar
 
 from datetime import datetime
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Integer, bindparam, delete, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.models import CommandLog
@@ -29,13 +29,36 @@ ModelT = TypeVar(
 
 
 async def _create(session: AsyncSession, model: Type[ModelT], **kwargs) -> ModelT:
-    obj = model(**kwargs)
-    session.add(obj)
+    # INSERT ... RETURNING hands back the fully-defaulted row in the
+    # same round trip, instead of add + commit + refresh (two trips and
+    # a unit-of-work flush for a plain single-table insert).
+    result = await session.execute(
+        insert(model).values(**kwargs).returning(model)
+    )
+    obj = result.scalar_one()
     await session.commit()
-    await session.refresh(obj)
     return obj
 
 
+async def create_many(
+    session: AsyncSession, model: Type[ModelT], rows: list[dict]
+) -> list[ModelT]:
+    """Insert *rows* with one executemany statement and a single commit.
+
+    Returns the created entities in input order. Use this instead of
+    calling a ``create_*`` helper in a loop — N rows cost one round trip
+    and one fsync rather than N of each.
+    """
+    if not rows:
+        return []
+    result = await session.execute(
+        insert(model).returning(model, sort_by_parameter_order=True), rows
+    )
+    objs = list(result.scalars())
+    await session.commit()
+    return objs
+
+
 async def _get(
     session: AsyncSession, model: Type[ModelT], obj_id: int
 ) -> ModelT | None:
@@ -46,21 +69,23 @@ async def _get(
 async def _update(
     session: AsyncSession, model: Type[ModelT], obj_id: int, **kwargs
 ) -> ModelT | None:
-    obj = await _get(session, model, obj_id)
-    if obj is None:
-        return None
-    for key, value in kwargs.items():
-        setattr(obj, key, value)
+    # Single UPDATE ... RETURNING instead of SELECT + UPDATE + re-SELECT;
+    # the returned entity comes straight off the statement and any copy
+    # already in the identity map is synchronized by the ORM.
+    result = await session.execute(
+        update(model)
+        .where(model.id == obj_id)
+        .values(**kwargs)
+        .returning(model)
+    )
+    obj = result.scalar_one_or_none()
     await session.commit()
-    await session.refresh(obj)
     return obj
 
 
 async def _delete(session: AsyncSession, model: Type[ModelT], obj_id: int) -> None:
-    obj = await _get(session, model, obj_id)
-    if obj is not None:
-        await session.delete(obj)
-        await session.commit()
+    await session.execute(delete(model).where(model.id == obj_id))
+    await session.commit()
 
 
 # Racer
@@ -151,15 +176,17 @@ async def get_guild_racers(
             Racer.retired.is_(False),
             Racer.injury_races_remaining == 0,
         )
+        if min_training is not None:
+            # Bred racers (have a sire) must meet the training gate.
+            # Filtered in SQL so ineligible foals are never materialised.
+            stmt = stmt.where(
+                or_(
+                    Racer.sire_id.is_(None),
+                    func.coalesce(Racer.training_count, 0) >= min_training,
+                )
+            )
     result = await session.execute(stmt)
-    racers = result.scalars().all()
-    if eligible_only and min_training is not None:
-        # Bred racers (have a sire) must meet the training gate
-        racers = [
-            r for r in racers
-            if r.sire_id is None or (r.training_count or 0) >= min_training
-        ]
-    return racers
+    return result.scalars().all()
 
 
 async def get_unowned_guild_racers(
@@ -251,6 +278,23 @@ async def get_race(session: AsyncSession, race_id: int) -> Race | None:
     return await _get(session, Race, race_id)
 
 
+async def get_pending_race(
+    session: AsyncSession, guild_id: int
+) -> Race | None:
+    """Return the oldest unfinished race for a guild, or None.
+
+    Shared by the admin commands (cancel, force-start) that used to each
+    carry their own copy of this query; LIMIT 1 keeps it a single-row seek.
+    """
+    result = await session.execute(
+        select(Race)
+        .where(Race.guild_id == guild_id, Race.finished.is_(False))
+        .order_by(Race.id)
+        .limit(1)
+    )
+    return result.scalars().first()
+
+
 async def update_race(session: AsyncSession, race_id: int, **kwargs) -> Race | None:
     return await _update(session, Race, race_id, **kwargs)
 
@@ -331,6 +375,22 @@ async def delete_course_segment(session: AsyncSession, segment_id: int) -> None:
 
 
 # History
+#
+# Hoisted with bindparam placeholders — history is paged on every
+# /race history call and the constant statement keeps the compiled-SQL
+# cache keyed on one object instead of a per-call Select rebuild.
+_RACE_HISTORY_STMT = (
+    select(Race)
+    .where(
+        Race.guild_id == bindparam("guild_id"),
+        Race.finished.is_(True),
+        Race.is_test.is_(False),
+    )
+    .order_by(Race.id.desc())
+    .limit(bindparam("limit"))
+)
+
+
 async def get_race_history(
     session: AsyncSession, guild_id: int, limit: int
 ) -> list[tuple[Race, int | None, int]]:
@@ -342,30 +402,32 @@ async def get_race_history(
     """
 
     result = await session.execute(
-        select(Race)
-        .where(
-            Race.guild_id == guild_id,
-            Race.finished.is_(True),
-            Race.is_test.is_(False),
-        )
-        .order_by(Race.id.desc())
-        .limit(limit)
+        _RACE_HISTORY_STMT, {"guild_id": guild_id, "limit": limit}
     )
     races = result.scalars().all()
 
-    history: list[tuple[Race, int | None, int]] = []
-    for race in races:
-        winner = race.winner_id
-        if winner is not None:
-            bet_rows = await session.execute(
-                select(Bet).where(Bet.race_id == race.id, Bet.racer_id == winner)
+    # Winning payouts summed in SQL for the whole page — no Bet objects
+    # are hydrated at all. The per-bet CAST truncates toward zero just
+    # like the old Python int(amount * multiplier).
+    winner_race_ids = [race.id for race in races if race.winner_id is not None]
+    payouts: dict[int, int] = {}
+    if winner_race_ids:
+        payout_rows = await session.execute(
+            select(
+                Bet.race_id,
+                func.sum(func.cast(Bet.amount * Bet.payout_multiplier, Integer)),
             )
-            bets = bet_rows.scalars().all()
-            payout = sum(int(b.amount * b.payout_multiplier) for b in bets)
-        else:
-            payout = 0
-        history.append((race, winner, payout))
-    return history
+            .join(Race, Race.id == Bet.race_id)
+            .where(
+                Bet.race_id.in_(winner_race_ids),
+                Bet.racer_id == Race.winner_id,
+            )
+            .group_by(Bet.race_id)
+        )
+        payouts = {race_id: int(total or 0) for race_id, total in payout_rows}
+    return [
+        (race, race.winner_id, payouts.get(race.id, 0)) for race in races
+    ]
 
 
 async def get_racer_record(
@@ -563,6 +625,18 @@ async def delete_npc(session: AsyncSession, npc_id: int) -> None:
     await _delete(session, NPC, npc_id)
 
 
+async def get_npcs_by_ids(
+    session: AsyncSession, npc_ids: set[int]
+) -> dict[int, NPC]:
+    """Return NPCs keyed by id, fetched in a single query."""
+    if not npc_ids:
+        return {}
+    result = await session.execute(
+        select(NPC).where(NPC.id.in_(npc_ids))
+    )
+    return {npc.id: npc for npc in result.scalars()}
+
+
 async def get_guild_npcs(session: AsyncSession, guild_id: int) -> list[NPC]:
     """Return all NPCs for a guild."""
     result = await session.execute(
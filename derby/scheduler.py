@@ -4,12 +4,13 @@ import asyncio
 import json
 import os
 import random
+import time
 from datetime import datetime, time as dt_time, timezone
 from typing import Any
 
 import discord
 from discord.ext import tasks
-from sqlalchemy import func, inspect, select, text
+from sqlalchemy import bindparam, event, func, inspect, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from config import resolve_guild_setting
@@ -48,20 +49,183 @@ TOURNAMENT_SCHEDULE: list[tuple[int, int, int, str]] = [
 
 TOURNAMENT_FIELD_SIZE = 8
 
+# Bump this whenever _init_db gains a new table, migration, or backfill
+# step. It is stamped into PRAGMA user_version after a successful run, so
+# already-migrated databases skip the whole inspector/ALTER scan on boot.
+SCHEMA_VERSION = 5
+
+# Connection-level SQLite tuning. WAL lets readers proceed during a write
+# (the tick loop reads while bet commands write), synchronous=NORMAL drops
+# the per-commit fsync WAL doesn't need, and the rest keep hot pages and
+# temp tables in memory instead of on disk.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=memory",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Run the tuning PRAGMAs on every new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# Read-only variant for the read engine. A mode=ro connection can't
+# switch journal modes, and query_only makes any accidental write fail
+# loudly instead of silently racing the writer.
+_SQLITE_RO_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=memory",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _apply_sqlite_ro_pragmas(dbapi_connection, connection_record) -> None:
+    """Run the read-only tuning PRAGMAs on every new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_RO_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _inspect_tables(sync_conn: Any) -> set[str]:
+    """Return the table names present in the connected database."""
+    insp = inspect(sync_conn)
+    return set(insp.get_table_names())
+
+
+# Statements the tick loop runs for every guild, hoisted so the Select
+# construction (and SQLAlchemy's compile cache key computation) happens
+# once at import instead of on every tick.
+_RESERVED_POOL_RACERS_STMT = (
+    select(models.RaceEntry.racer_id)
+    .join(models.Race, models.RaceEntry.race_id == models.Race.id)
+    .where(
+        models.Race.guild_id == bindparam("guild_id"),
+        models.Race.finished.is_(False),
+    )
+)
+
+_EXPIRED_POOL_RACERS_STMT = select(models.Racer).where(
+    models.Racer.guild_id == bindparam("guild_id"),
+    models.Racer.owner_id == 0,
+    models.Racer.pool_expires_at <= func.now(),
+)
+
+_TAKEN_NAMES_STMT = select(models.Racer.name).where(
+    models.Racer.guild_id == bindparam("guild_id"),
+    models.Racer.retired.is_(False),
+)
+
+_INJURED_RACERS_STMT = select(models.Racer).where(
+    models.Racer.guild_id == bindparam("guild_id"),
+    models.Racer.retired.is_(False),
+    models.Racer.injury_races_remaining > 0,
+)
+
+_BREED_COOLDOWN_RACERS_STMT = select(models.Racer).where(
+    models.Racer.guild_id == bindparam("guild_id"),
+    models.Racer.breed_cooldown > 0,
+)
+
+
+class _TokenBucket:
+    """Minimal monotonic token bucket for self-pacing Discord sends.
+
+    discord.py only reacts to 429s after the fact; pacing bursts below
+    the global limit up front avoids the multi-second Retry-After sleeps
+    entirely. Bursts up to ``capacity`` pass without waiting, so the
+    bucket is free in the common case.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.capacity),
+                self._tokens + (now - self._updated) * self.rate,
+            )
+            self._updated = now
+            if self._tokens < 1.0:
+                wait = (1.0 - self._tokens) / self.rate
+                await asyncio.sleep(wait)
+                self._updated = time.monotonic()
+                self._tokens = 1.0
+            self._tokens -= 1.0
+
 
 class DerbyScheduler:
     """Background task that runs races at configured times."""
 
     def __init__(self, bot: discord.Client, db_path: str | None = None) -> None:
         self.bot = bot
+        # One RNG instance for all scheduler rolls: method calls on an
+        # instance skip the module-function indirection, and tests can
+        # still pin determinism by seeding or swapping this attribute.
+        self._rng = random.Random()
         root = os.path.realpath(os.path.dirname(os.path.dirname(__file__)))
         self.db_path = db_path or os.path.join(root, "database", "database.db")
-        self.engine = create_async_engine(f"sqlite+aiosqlite:///{self.db_path}")
+        # Keep connections alive for the life of the process: every command
+        # and tick reuses a pooled connection, so SQLite's page cache and the
+        # connect-time PRAGMAs survive instead of being rebuilt per command.
+        self.engine = create_async_engine(
+            f"sqlite+aiosqlite:///{self.db_path}",
+            pool_size=1,
+            max_overflow=4,
+            pool_recycle=-1,
+        )
+        event.listens_for(self.engine.sync_engine, "connect")(_apply_sqlite_pragmas)
         self.sessionmaker = async_sessionmaker(self.engine, expire_on_commit=False)
+        # WAL lets any number of readers run alongside the single writer,
+        # but only on their own connections. Pure read hot paths (the
+        # next-race seek in get_next_race_id, the cog's next-race view
+        # behind betting and autocomplete) go through this read-only
+        # engine so they never queue behind an in-flight write on the
+        # main pool. Connections are lazy, so the mode=ro open only
+        # happens after _init_db has created the file.
+        self.read_engine = create_async_engine(
+            f"sqlite+aiosqlite:///file:{self.db_path}?mode=ro&uri=true",
+            pool_size=os.cpu_count() or 4,
+            max_overflow=2,
+            pool_recycle=-1,
+        )
+        event.listens_for(self.read_engine.sync_engine, "connect")(
+            _apply_sqlite_ro_pragmas
+        )
+        self.read_sessionmaker = async_sessionmaker(
+            self.read_engine, expire_on_commit=False
+        )
         self._initialized = False
         self.task: tasks.Loop | None = None
         self.tournament_task: tasks.Loop | None = None
-        self.commentaries: dict[int, tasks.Loop] = {}
+        # Memo of named-channel lookups keyed by (guild_id, name); see
+        # _get_channel for the revalidation rules.
+        self._channel_cache: dict[tuple[int, str], Any] = {}
+        # Global send pacing. Guild ticks run concurrently, so a busy
+        # schedule can burst DMs + announcement embeds from several races
+        # at once; staying under Discord's ~50/s global limit up front
+        # beats eating Retry-After back-off.
+        self._send_bucket = _TokenBucket(rate=45.0, capacity=45)
+        # Cancellation signals for in-flight commentary streams, keyed by
+        # race id. Whoever deletes a race calls cancel_commentary() —
+        # the stream checks the event instead of polling the database
+        # between paragraphs.
+        self.commentaries: dict[int, asyncio.Event] = {}
         self.active_races: set[int] = set()  # race IDs currently simulating (bets closed)
         self.betting_races: set[int] = set()  # race IDs in bet window (bets open)
         self._last_tournament_tick: str | None = None  # "weekday-hour-minute" debounce
@@ -74,6 +238,13 @@ class DerbyScheduler:
         self.guild_settings = GuildSettingsResolver(
             self.sessionmaker, getattr(bot, "settings", None),
         )
+        # Per-guild memo of the oldest unfinished race id. Filled by
+        # get_next_race_id(); anything that creates, finishes, or deletes a
+        # race must call bust_next_race() for that guild.
+        self._next_race_ids: dict[int, int] = {}
+        # Short-TTL cache of (monotonic ts, Race, [Racer]) used by the
+        # cog's betting/autocomplete paths; busted alongside the id memo.
+        self._next_race_view_cache: dict[int, tuple[float, Any, list]] = {}
 
     def _resolve(
         self,
@@ -89,20 +260,73 @@ class DerbyScheduler:
         """Backwards-compat alias — delegates to the cached resolver."""
         return await self.guild_settings.get(guild_id)
 
+    def bust_next_race(self, guild_id: int) -> None:
+        """Forget the cached next-race lookups after a race lifecycle change."""
+        self._next_race_ids.pop(guild_id, None)
+        self._next_race_view_cache.pop(guild_id, None)
+
+    def cancel_commentary(self, race_id: int) -> None:
+        """Stop an in-flight commentary stream for a deleted race."""
+        event = self.commentaries.get(race_id)
+        if event is not None:
+            event.set()
+
+    async def get_next_race_id(self, guild_id: int) -> int | None:
+        """Return the id of the oldest unfinished race, or ``None``.
+
+        Memoised per guild so the hot paths skip the query entirely
+        between race lifecycle changes; the miss path is a LIMIT-1 seek
+        instead of materialising every unfinished race. The seek runs on
+        the read-only pool so ticks never queue behind an in-flight
+        write for a pure lookup.
+        """
+        race_id = self._next_race_ids.get(guild_id)
+        if race_id is not None:
+            return race_id
+        async with self.read_sessionmaker() as session:
+            result = await session.execute(
+                select(models.Race.id)
+                .where(
+                    models.Race.guild_id == guild_id,
+                    models.Race.finished.is_(False),
+                )
+                .order_by(models.Race.id)
+                .limit(1)
+            )
+            race_id = result.scalar_one_or_none()
+        if race_id is not None:
+            self._next_race_ids[guild_id] = race_id
+        return race_id
+
     def _get_channel(
         self,
         guild: discord.Guild,
         guild_settings: GuildSettings | None = None,
         channel_key: str = "derby_channel",
     ) -> discord.abc.Messageable | None:
-        """Return the configured channel for the guild or a sensible default."""
+        """Return the configured channel for the guild or a sensible default.
+
+        The named-channel scan walks every text channel, and a single
+        race resolves the channel half a dozen times (announce, lineup,
+        commentary, results, reactions), so hits are memoised by channel
+        id. The memo self-invalidates: a renamed or deleted channel
+        misses the verify step and falls back to a fresh scan.
+        """
         # Try per-game channel first, then legacy channel_name fallback
         name = self._resolve(channel_key, guild_settings)
         if not name:
             name = self._resolve("channel_name", guild_settings)
         if name:
+            cached = self._channel_cache.get((guild.id, name))
+            if cached is not None and getattr(cached, "name", None) == name:
+                # O(1) revalidation against the client cache where the
+                # guild supports it (test doubles don't).
+                getter = getattr(guild, "get_channel", None)
+                if getter is None or getter(cached.id) is cached:
+                    return cached
             for channel in guild.text_channels:
                 if getattr(channel, "name", None) == name:
+                    self._channel_cache[(guild.id, name)] = channel
                     return channel
         return guild.system_channel or (
             guild.text_channels[0] if guild.text_channels else None
@@ -202,404 +426,483 @@ class DerbyScheduler:
         for task in list(self._background_tasks):
             if not task.done():
                 task.cancel()
+        await self.read_engine.dispose()
         await self.engine.dispose()
 
     async def _init_db(self) -> None:
         if self._initialized:
             return
+        # Fast path: a database stamped at the current schema version has
+        # already had every migration and backfill below applied.
+        async with self.engine.connect() as conn:
+            version = (
+                await conn.execute(text("PRAGMA user_version"))
+            ).scalar()
+        if version == SCHEMA_VERSION:
+            self._initialized = True
+            return
         async with self.engine.begin() as conn:
-            # Pre-migration: check if wallets table needs rebuild for
-            # composite PK (user_id, guild_id).  Drop it so create_all
-            # recreates it with the correct schema.
-            def _get_tables(sync_conn: Any) -> set[str]:
-                insp = inspect(sync_conn)
-                return set(insp.get_table_names())
+            tables = await conn.run_sync(_inspect_tables)
+            if not tables:
+                # Brand-new database (first boot, and every test run):
+                # create_all emits the complete current schema, indexes
+                # included, so none of the column probes, ALTERs, or
+                # backfills in the migration path have anything to do.
+                await conn.run_sync(Base.metadata.create_all)
+            else:
+                await self._migrate_legacy_db(conn, tables)
 
-            tables = await conn.run_sync(_get_tables)
+        # Seed brewing reference data (ingredients + dangerous triples)
+        async with self.sessionmaker() as session:
+            from brewing.seed_data import seed_if_empty
+
+            await seed_if_empty(session)
+
+        # One-time back-fill of abilities for racers that predate the abilities
+        # system. Idempotent: only touches racers with NULL signature_ability.
+        # Abilities are mechanical — the field must be uniform, so we can't
+        # leave legacy racers without abilities (unlike the appearance system).
+        backfill_ok = True
+        try:
+            from . import abilities as _abilities
+
+            async with self.sessionmaker() as session:
+                result = await session.execute(
+                    select(models.Racer).where(
+                        models.Racer.signature_ability.is_(None)
+                    )
+                )
+                pending = result.scalars().all()
+                if pending:
+                    self.bot.logger.info(
+                        "Back-filling abilities for %d racers", len(pending),
+                    )
+                    for r in pending:
+                        sig, quirk = _abilities.roll_abilities(r)
+                        if sig:
+                            r.signature_ability = sig
+                        if quirk:
+                            r.quirk_ability = quirk
+                    await session.commit()
+        except Exception:
+            backfill_ok = False
+            self.bot.logger.exception("Abilities back-fill failed")
 
-            if "wallets" in tables:
+        # Stamp the schema version only once the seed and back-fill have
+        # completed: stamping earlier would let a failure in that window
+        # hit the fast path on the next boot and never be retried.
+        if backfill_ok:
+            async with self.engine.begin() as conn:
+                await conn.execute(
+                    text(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                )
 
-                def _wallet_has_guild_id(sync_conn: Any) -> bool:
-                    insp = inspect(sync_conn)
-                    cols = {c["name"] for c in insp.get_columns("wallets")}
-                    return "guild_id" in cols
+        self._initialized = True
 
-                has_guild = await conn.run_sync(_wallet_has_guild_id)
-                if not has_guild:
-                    await conn.execute(text("DROP TABLE wallets"))
+    async def _migrate_legacy_db(self, conn: Any, tables: set[str]) -> None:
+        """Bring a pre-existing database up to the current schema.
 
-            # Rebuild guild_settings if it has the old schema (race_frequency
-            # column from the unused initial model).
-            if "guild_settings" in tables:
+        Only runs when the file already has tables but its user_version
+        predates SCHEMA_VERSION: rebuilds legacy table shapes, adds any
+        missing columns, runs the one-time backfills, and creates the
+        hot-path indexes.
+        """
+        # Pre-migration: check if wallets table needs rebuild for
+        # composite PK (user_id, guild_id).  Drop it so create_all
+        # recreates it with the correct schema.
+        if "wallets" in tables:
 
-                def _gs_has_channel_name(sync_conn: Any) -> bool:
-                    insp = inspect(sync_conn)
-                    cols = {c["name"] for c in insp.get_columns("guild_settings")}
-                    return "channel_name" in cols
+            def _wallet_has_guild_id(sync_conn: Any) -> bool:
+                insp = inspect(sync_conn)
+                cols = {c["name"] for c in insp.get_columns("wallets")}
+                return "guild_id" in cols
 
-                if not await conn.run_sync(_gs_has_channel_name):
-                    await conn.execute(text("DROP TABLE guild_settings"))
+            has_guild = await conn.run_sync(_wallet_has_guild_id)
+            if not has_guild:
+                await conn.execute(text("DROP TABLE wallets"))
 
-            await conn.run_sync(Base.metadata.create_all)
+        # Rebuild guild_settings if it has the old schema (race_frequency
+        # column from the unused initial model).
+        if "guild_settings" in tables:
 
-            def get_table_columns(sync_conn: Any, table: str) -> set[str]:
+            def _gs_has_channel_name(sync_conn: Any) -> bool:
                 insp = inspect(sync_conn)
-                return {c["name"] for c in insp.get_columns(table)}
-
-            racer_columns = await conn.run_sync(
-                lambda c: get_table_columns(c, "racers")
-            )
-            racer_migrations = {
-                "speed": ("INTEGER", "0"),
-                "cornering": ("INTEGER", "0"),
-                "stamina": ("INTEGER", "0"),
-                "temperament": ("VARCHAR", "'Quirky'"),
-                "mood": ("INTEGER", "3"),
-                "injuries": ("VARCHAR", "''"),
-                "injury_races_remaining": ("INTEGER", "0"),
-                "races_completed": ("INTEGER", "0"),
-                "career_length": ("INTEGER", "30"),
-                "peak_end": ("INTEGER", "18"),
-                "guild_id": ("INTEGER", "0"),
-                "gender": ("VARCHAR", "'M'"),
-                "sire_id": ("INTEGER", "NULL"),
-                "dam_id": ("INTEGER", "NULL"),
-                "foal_count": ("INTEGER", "0"),
-                "breed_cooldown": ("INTEGER", "0"),
-                "training_count": ("INTEGER", "5"),
-                "trains_since_race": ("INTEGER", "0"),
-                "rested_since_race": ("BOOLEAN", "0"),
-                "rank": ("VARCHAR", "NULL"),
-                "tournament_wins": ("INTEGER", "0"),
-                "tournament_placements": ("INTEGER", "0"),
-                "description": ("TEXT", "NULL"),
-                "appearance": ("TEXT", "NULL"),
-                "signature_ability": ("VARCHAR", "NULL"),
-                "quirk_ability": ("VARCHAR", "NULL"),
-                "pool_expires_at": ("DATETIME", "NULL"),
-                "npc_id": ("INTEGER", "NULL"),
-            }
-            for name, (col_type, default) in racer_migrations.items():
-                if name not in racer_columns:
-                    await conn.execute(
-                        text(
-                            f"ALTER TABLE racers ADD COLUMN {name} {col_type} DEFAULT {default}"
-                        )
-                    )
+                cols = {c["name"] for c in insp.get_columns("guild_settings")}
+                return "channel_name" in cols
 
-            # Backfill rank for existing racers that don't have one yet.
-            await conn.execute(
-                text(
-                    "UPDATE racers SET rank = CASE "
-                    "WHEN (speed + cornering + stamina) >= 81 THEN 'S' "
-                    "WHEN (speed + cornering + stamina) >= 66 THEN 'A' "
-                    "WHEN (speed + cornering + stamina) >= 47 THEN 'B' "
-                    "WHEN (speed + cornering + stamina) >= 24 THEN 'C' "
-                    "ELSE 'D' END "
-                    "WHERE rank IS NULL"
-                )
-            )
+            if not await conn.run_sync(_gs_has_channel_name):
+                await conn.execute(text("DROP TABLE guild_settings"))
 
-            # One-time fix: randomly assign gender to pool racers that all
-            # defaulted to 'M' from the gender migration.  Only runs if
-            # zero females exist (the telltale sign of the default).
-            female_count = (
-                await conn.execute(
-                    text("SELECT COUNT(*) FROM racers WHERE gender = 'F'")
-                )
-            ).scalar()
-            if female_count == 0:
+        await conn.run_sync(Base.metadata.create_all)
+
+        def get_table_columns(sync_conn: Any, table: str) -> set[str]:
+            insp = inspect(sync_conn)
+            return {c["name"] for c in insp.get_columns(table)}
+
+        racer_columns = await conn.run_sync(
+            lambda c: get_table_columns(c, "racers")
+        )
+        racer_migrations = {
+            "speed": ("INTEGER", "0"),
+            "cornering": ("INTEGER", "0"),
+            "stamina": ("INTEGER", "0"),
+            "temperament": ("VARCHAR", "'Quirky'"),
+            "mood": ("INTEGER", "3"),
+            "injuries": ("VARCHAR", "''"),
+            "injury_races_remaining": ("INTEGER", "0"),
+            "races_completed": ("INTEGER", "0"),
+            "career_length": ("INTEGER", "30"),
+            "peak_end": ("INTEGER", "18"),
+            "guild_id": ("INTEGER", "0"),
+            "gender": ("VARCHAR", "'M'"),
+            "sire_id": ("INTEGER", "NULL"),
+            "dam_id": ("INTEGER", "NULL"),
+            "foal_count": ("INTEGER", "0"),
+            "breed_cooldown": ("INTEGER", "0"),
+            "training_count": ("INTEGER", "5"),
+            "trains_since_race": ("INTEGER", "0"),
+            "rested_since_race": ("BOOLEAN", "0"),
+            "rank": ("VARCHAR", "NULL"),
+            "tournament_wins": ("INTEGER", "0"),
+            "tournament_placements": ("INTEGER", "0"),
+            "description": ("TEXT", "NULL"),
+            "appearance": ("TEXT", "NULL"),
+            "signature_ability": ("VARCHAR", "NULL"),
+            "quirk_ability": ("VARCHAR", "NULL"),
+            "pool_expires_at": ("DATETIME", "NULL"),
+            "npc_id": ("INTEGER", "NULL"),
+        }
+        for name, (col_type, default) in racer_migrations.items():
+            if name not in racer_columns:
                 await conn.execute(
                     text(
-                        "UPDATE racers SET gender = 'F' "
-                        "WHERE ABS(RANDOM()) % 2 = 0"
+                        f"ALTER TABLE racers ADD COLUMN {name} {col_type} DEFAULT {default}"
                     )
                 )
 
-            # Backfill pool_expires_at for existing pool racers so they
-            # don't all expire at once — stagger across the next 24-48h.
+        # Backfill rank for existing racers that don't have one yet.
+        await conn.execute(
+            text(
+                "UPDATE racers SET rank = CASE "
+                "WHEN (speed + cornering + stamina) >= 81 THEN 'S' "
+                "WHEN (speed + cornering + stamina) >= 66 THEN 'A' "
+                "WHEN (speed + cornering + stamina) >= 47 THEN 'B' "
+                "WHEN (speed + cornering + stamina) >= 24 THEN 'C' "
+                "ELSE 'D' END "
+                "WHERE rank IS NULL"
+            )
+        )
+
+        # One-time fix: randomly assign gender to pool racers that all
+        # defaulted to 'M' from the gender migration.  Only runs if
+        # zero females exist (the telltale sign of the default).
+        female_count = (
+            await conn.execute(
+                text("SELECT COUNT(*) FROM racers WHERE gender = 'F'")
+            )
+        ).scalar()
+        if female_count == 0:
             await conn.execute(
                 text(
-                    "UPDATE racers SET pool_expires_at = "
-                    "datetime('now', '+' || (ABS(RANDOM()) % 1440 + 1440) || ' minutes') "
-                    "WHERE owner_id = 0 AND pool_expires_at IS NULL AND retired = 0"
+                    "UPDATE racers SET gender = 'F' "
+                    "WHERE ABS(RANDOM()) % 2 = 0"
                 )
             )
 
-            # Migrate guild_id=0 racers: duplicate per guild and fix references
-            if "guild_id" not in racer_columns:
-                guild_rows = await conn.execute(
-                    text("SELECT DISTINCT guild_id FROM races")
-                )
-                guild_ids = [row[0] for row in guild_rows.fetchall()]
+        # Backfill pool_expires_at for existing pool racers so they
+        # don't all expire at once — stagger across the next 24-48h.
+        await conn.execute(
+            text(
+                "UPDATE racers SET pool_expires_at = "
+                "datetime('now', '+' || (ABS(RANDOM()) % 1440 + 1440) || ' minutes') "
+                "WHERE owner_id = 0 AND pool_expires_at IS NULL AND retired = 0"
+            )
+        )
 
-                if guild_ids:
-                    old_racers = (
-                        await conn.execute(
-                            text("SELECT id, guild_id, name, owner_id, retired, "
-                                 "speed, cornering, stamina, temperament, mood, "
-                                 "injuries, injury_races_remaining, "
-                                 "races_completed, career_length, peak_end "
-                                 "FROM racers WHERE guild_id = 0")
-                        )
-                    ).fetchall()
-
-                    for gid in guild_ids:
-                        for row in old_racers:
-                            old_id = row[0]
-                            result = await conn.execute(
-                                text(
-                                    "INSERT INTO racers "
-                                    "(guild_id, name, owner_id, retired, "
-                                    "speed, cornering, stamina, temperament, "
-                                    "mood, injuries, injury_races_remaining, "
-                                    "races_completed, career_length, peak_end) "
-                                    "VALUES (:gid, :name, :owner, :retired, "
-                                    ":spd, :cor, :sta, :temp, "
-                                    ":mood, :inj, :irr, "
-                                    ":rc, :cl, :pe)"
-                                ),
-                                {
-                                    "gid": gid, "name": row[2],
-                                    "owner": row[3], "retired": row[4],
-                                    "spd": row[5], "cor": row[6],
-                                    "sta": row[7], "temp": row[8],
-                                    "mood": row[9], "inj": row[10],
-                                    "irr": row[11], "rc": row[12],
-                                    "cl": row[13], "pe": row[14],
-                                },
-                            )
-                            new_id = result.lastrowid
-                            # Fix race_entries for this guild's races
-                            await conn.execute(
-                                text(
-                                    "UPDATE race_entries SET racer_id = :new "
-                                    "WHERE racer_id = :old AND race_id IN "
-                                    "(SELECT id FROM races WHERE guild_id = :gid)"
-                                ),
-                                {"new": new_id, "old": old_id, "gid": gid},
-                            )
-                            # Fix bets for this guild's races
-                            await conn.execute(
-                                text(
-                                    "UPDATE bets SET racer_id = :new "
-                                    "WHERE racer_id = :old AND race_id IN "
-                                    "(SELECT id FROM races WHERE guild_id = :gid)"
-                                ),
-                                {"new": new_id, "old": old_id, "gid": gid},
-                            )
-                    # Remove the original guild_id=0 racers
+        # Migrate guild_id=0 racers: duplicate per guild and fix references
+        if "guild_id" not in racer_columns:
+            guild_rows = await conn.execute(
+                text("SELECT DISTINCT guild_id FROM races")
+            )
+            guild_ids = [row[0] for row in guild_rows.fetchall()]
+
+            if guild_ids:
+                old_racers = (
                     await conn.execute(
-                        text("DELETE FROM racers WHERE guild_id = 0")
+                        text("SELECT id, guild_id, name, owner_id, retired, "
+                             "speed, cornering, stamina, temperament, mood, "
+                             "injuries, injury_races_remaining, "
+                             "races_completed, career_length, peak_end "
+                             "FROM racers WHERE guild_id = 0")
                     )
-
-            race_columns = await conn.run_sync(
-                lambda c: get_table_columns(c, "races")
-            )
-            if "winner_id" not in race_columns:
+                ).fetchall()
+
+                for gid in guild_ids:
+                    for row in old_racers:
+                        old_id = row[0]
+                        result = await conn.execute(
+                            text(
+                                "INSERT INTO racers "
+                                "(guild_id, name, owner_id, retired, "
+                                "speed, cornering, stamina, temperament, "
+                                "mood, injuries, injury_races_remaining, "
+                                "races_completed, career_length, peak_end) "
+                                "VALUES (:gid, :name, :owner, :retired, "
+                                ":spd, :cor, :sta, :temp, "
+                                ":mood, :inj, :irr, "
+                                ":rc, :cl, :pe)"
+                            ),
+                            {
+                                "gid": gid, "name": row[2],
+                                "owner": row[3], "retired": row[4],
+                                "spd": row[5], "cor": row[6],
+                                "sta": row[7], "temp": row[8],
+                                "mood": row[9], "inj": row[10],
+                                "irr": row[11], "rc": row[12],
+                                "cl": row[13], "pe": row[14],
+                            },
+                        )
+                        new_id = result.lastrowid
+                        # Fix race_entries for this guild's races
+                        await conn.execute(
+                            text(
+                                "UPDATE race_entries SET racer_id = :new "
+                                "WHERE racer_id = :old AND race_id IN "
+                                "(SELECT id FROM races WHERE guild_id = :gid)"
+                            ),
+                            {"new": new_id, "old": old_id, "gid": gid},
+                        )
+                        # Fix bets for this guild's races
+                        await conn.execute(
+                            text(
+                                "UPDATE bets SET racer_id = :new "
+                                "WHERE racer_id = :old AND race_id IN "
+                                "(SELECT id FROM races WHERE guild_id = :gid)"
+                            ),
+                            {"new": new_id, "old": old_id, "gid": gid},
+                        )
+                # Remove the original guild_id=0 racers
                 await conn.execute(
-                    text("ALTER TABLE races ADD COLUMN winner_id INTEGER DEFAULT NULL")
+                    text("DELETE FROM racers WHERE guild_id = 0")
                 )
 
-            bet_columns = await conn.run_sync(
-                lambda c: get_table_columns(c, "bets")
+        race_columns = await conn.run_sync(
+            lambda c: get_table_columns(c, "races")
+        )
+        if "winner_id" not in race_columns:
+            await conn.execute(
+                text("ALTER TABLE races ADD COLUMN winner_id INTEGER DEFAULT NULL")
             )
-            if "payout_multiplier" not in bet_columns:
+
+        bet_columns = await conn.run_sync(
+            lambda c: get_table_columns(c, "bets")
+        )
+        if "payout_multiplier" not in bet_columns:
+            await conn.execute(
+                text(
+                    "ALTER TABLE bets ADD COLUMN payout_multiplier FLOAT DEFAULT 2.0"
+                )
+            )
+        bet_migrations = {
+            "bet_type": ("VARCHAR", "'win'"),
+            "racer_ids": ("VARCHAR", "'[]'"),
+            "is_free": ("BOOLEAN", "0"),
+        }
+        for name, (col_type, default) in bet_migrations.items():
+            if name not in bet_columns:
                 await conn.execute(
                     text(
-                        "ALTER TABLE bets ADD COLUMN payout_multiplier FLOAT DEFAULT 2.0"
+                        f"ALTER TABLE bets ADD COLUMN {name} {col_type} DEFAULT {default}"
                     )
                 )
-            bet_migrations = {
-                "bet_type": ("VARCHAR", "'win'"),
-                "racer_ids": ("VARCHAR", "'[]'"),
-                "is_free": ("BOOLEAN", "0"),
-            }
-            for name, (col_type, default) in bet_migrations.items():
-                if name not in bet_columns:
-                    await conn.execute(
-                        text(
-                            f"ALTER TABLE bets ADD COLUMN {name} {col_type} DEFAULT {default}"
-                        )
-                    )
 
-            race_migrations = {
-                "placements": ("VARCHAR", "NULL"),
-                "map_name": ("VARCHAR", "NULL"),
-                "is_test": ("BOOLEAN", "0"),
-                "biggest_payout": ("INTEGER", "NULL"),
-                "biggest_payout_user_id": ("INTEGER", "NULL"),
-                "biggest_payout_racer_id": ("INTEGER", "NULL"),
-            }
-            for name, (col_type, default) in race_migrations.items():
-                if name not in race_columns:
-                    await conn.execute(
-                        text(
-                            f"ALTER TABLE races ADD COLUMN {name} {col_type} DEFAULT {default}"
-                        )
+        race_migrations = {
+            "placements": ("VARCHAR", "NULL"),
+            "map_name": ("VARCHAR", "NULL"),
+            "is_test": ("BOOLEAN", "0"),
+            "biggest_payout": ("INTEGER", "NULL"),
+            "biggest_payout_user_id": ("INTEGER", "NULL"),
+            "biggest_payout_racer_id": ("INTEGER", "NULL"),
+        }
+        for name, (col_type, default) in race_migrations.items():
+            if name not in race_columns:
+                await conn.execute(
+                    text(
+                        f"ALTER TABLE races ADD COLUMN {name} {col_type} DEFAULT {default}"
                     )
+                )
 
-            # Add ownership/pool columns to guild_settings
-            gs_columns = await conn.run_sync(
-                lambda c: get_table_columns(c, "guild_settings")
-            )
-            gs_migrations = {
-                "racer_buy_base": ("INTEGER", "NULL"),
-                "racer_buy_multiplier": ("INTEGER", "NULL"),
-                "racer_sell_fraction": ("FLOAT", "NULL"),
-                "max_racers_per_owner": ("INTEGER", "NULL"),
-                "min_pool_size": ("INTEGER", "NULL"),
-                "placement_prizes": ("VARCHAR", "NULL"),
-                "training_base": ("INTEGER", "NULL"),
-                "training_multiplier": ("INTEGER", "NULL"),
-                "rest_cost": ("INTEGER", "NULL"),
-                "feed_cost": ("INTEGER", "NULL"),
-                "stable_upgrade_costs": ("VARCHAR", "NULL"),
-                "female_buy_multiplier": ("FLOAT", "NULL"),
-                "retired_sell_penalty": ("FLOAT", "NULL"),
-                "foal_sell_penalty": ("FLOAT", "NULL"),
-                "min_training_to_race": ("INTEGER", "NULL"),
-                "breeding_fee": ("INTEGER", "NULL"),
-                "breeding_cooldown": ("INTEGER", "NULL"),
-                "min_races_to_breed": ("INTEGER", "NULL"),
-                "max_foals_per_female": ("INTEGER", "NULL"),
-                "racer_flavor": ("TEXT", "NULL"),
-                "race_stat_window": ("INTEGER", "NULL"),
-                "daily_min": ("INTEGER", "NULL"),
-                "daily_max": ("INTEGER", "NULL"),
-                "racer_emoji": ("TEXT", "NULL"),
-                "max_trains_per_race": ("INTEGER", "NULL"),
-                # Per-game channel restrictions
-                "derby_channel": ("TEXT", "NULL"),
-                "brewing_channel": ("TEXT", "NULL"),
-                "fishing_channel": ("TEXT", "NULL"),
-                "dungeon_channel": ("TEXT", "NULL"),
-                # NULL = "inherit global default" (matches the rest of this
-                # table's override-semantics pattern). Default is True in
-                # config.Settings.live_standings_chart.
-                "live_standings_chart": ("BOOLEAN", "NULL"),
-                # Fishing (Lazy Lures)
-                "fishing_bait_costs": ("TEXT", "NULL"),
-                "fishing_cast_multiplier": ("REAL", "NULL"),
-            }
-            for col_name, (col_type, default) in gs_migrations.items():
-                if col_name not in gs_columns:
-                    await conn.execute(
-                        text(
-                            f"ALTER TABLE guild_settings ADD COLUMN "
-                            f"{col_name} {col_type} DEFAULT {default}"
-                        )
+        # Add ownership/pool columns to guild_settings
+        gs_columns = await conn.run_sync(
+            lambda c: get_table_columns(c, "guild_settings")
+        )
+        gs_migrations = {
+            "racer_buy_base": ("INTEGER", "NULL"),
+            "racer_buy_multiplier": ("INTEGER", "NULL"),
+            "racer_sell_fraction": ("FLOAT", "NULL"),
+            "max_racers_per_owner": ("INTEGER", "NULL"),
+            "min_pool_size": ("INTEGER", "NULL"),
+            "placement_prizes": ("VARCHAR", "NULL"),
+            "training_base": ("INTEGER", "NULL"),
+            "training_multiplier": ("INTEGER", "NULL"),
+            "rest_cost": ("INTEGER", "NULL"),
+            "feed_cost": ("INTEGER", "NULL"),
+            "stable_upgrade_costs": ("VARCHAR", "NULL"),
+            "female_buy_multiplier": ("FLOAT", "NULL"),
+            "retired_sell_penalty": ("FLOAT", "NULL"),
+            "foal_sell_penalty": ("FLOAT", "NULL"),
+            "min_training_to_race": ("INTEGER", "NULL"),
+            "breeding_fee": ("INTEGER", "NULL"),
+            "breeding_cooldown": ("INTEGER", "NULL"),
+            "min_races_to_breed": ("INTEGER", "NULL"),
+            "max_foals_per_female": ("INTEGER", "NULL"),
+            "racer_flavor": ("TEXT", "NULL"),
+            "race_stat_window": ("INTEGER", "NULL"),
+            "daily_min": ("INTEGER", "NULL"),
+            "daily_max": ("INTEGER", "NULL"),
+            "racer_emoji": ("TEXT", "NULL"),
+            "max_trains_per_race": ("INTEGER", "NULL"),
+            # Per-game channel restrictions
+            "derby_channel": ("TEXT", "NULL"),
+            "brewing_channel": ("TEXT", "NULL"),
+            "fishing_channel": ("TEXT", "NULL"),
+            "dungeon_channel": ("TEXT", "NULL"),
+            # NULL = "inherit global default" (matches the rest of this
+            # table's override-semantics pattern). Default is True in
+            # config.Settings.live_standings_chart.
+            "live_standings_chart": ("BOOLEAN", "NULL"),
+            # Fishing (Lazy Lures)
+            "fishing_bait_costs": ("TEXT", "NULL"),
+            "fishing_cast_multiplier": ("REAL", "NULL"),
+        }
+        for col_name, (col_type, default) in gs_migrations.items():
+            if col_name not in gs_columns:
+                await conn.execute(
+                    text(
+                        f"ALTER TABLE guild_settings ADD COLUMN "
+                        f"{col_name} {col_type} DEFAULT {default}"
                     )
-            # Add fishing_xp column to fishing_players if missing
-            tables = await conn.run_sync(_get_tables)
-            if "fishing_players" in tables:
-                fp_cols = await conn.run_sync(
-                    lambda c: get_table_columns(c, "fishing_players")
                 )
-                if "fishing_xp" not in fp_cols:
-                    await conn.execute(
-                        text(
-                            "ALTER TABLE fishing_players "
-                            "ADD COLUMN fishing_xp INTEGER DEFAULT 0"
-                        )
+        # Add fishing_xp column to fishing_players if missing
+        tables = await conn.run_sync(_inspect_tables)
+        if "fishing_players" in tables:
+            fp_cols = await conn.run_sync(
+                lambda c: get_table_columns(c, "fishing_players")
+            )
+            if "fishing_xp" not in fp_cols:
+                await conn.execute(
+                    text(
+                        "ALTER TABLE fishing_players "
+                        "ADD COLUMN fishing_xp INTEGER DEFAULT 0"
                     )
-
-            # Add mode / thread_id / angler_name columns to fishing_sessions
-            if "fishing_sessions" in tables:
-                fs_cols = await conn.run_sync(
-                    lambda c: get_table_columns(c, "fishing_sessions")
                 )
-                if "mode" not in fs_cols:
-                    await conn.execute(
-                        text(
-                            "ALTER TABLE fishing_sessions "
-                            "ADD COLUMN mode TEXT NOT NULL DEFAULT 'afk'"
-                        )
-                    )
-                if "thread_id" not in fs_cols:
-                    await conn.execute(
-                        text(
-                            "ALTER TABLE fishing_sessions "
-                            "ADD COLUMN thread_id INTEGER DEFAULT NULL"
-                        )
-                    )
-                if "angler_name" not in fs_cols:
-                    await conn.execute(
-                        text(
-                            "ALTER TABLE fishing_sessions "
-                            "ADD COLUMN angler_name TEXT DEFAULT NULL"
-                        )
-                    )
 
-            # Add thread_id column to dungeon_runs if missing
-            if "dungeon_runs" in tables:
-                dr_cols = await conn.run_sync(
-                    lambda c: get_table_columns(c, "dungeon_runs")
+        # Add mode / thread_id / angler_name columns to fishing_sessions
+        if "fishing_sessions" in tables:
+            fs_cols = await conn.run_sync(
+                lambda c: get_table_columns(c, "fishing_sessions")
+            )
+            if "mode" not in fs_cols:
+                await conn.execute(
+                    text(
+                        "ALTER TABLE fishing_sessions "
+                        "ADD COLUMN mode TEXT NOT NULL DEFAULT 'afk'"
+                    )
                 )
-                if "thread_id" not in dr_cols:
-                    await conn.execute(
-                        text(
-                            "ALTER TABLE dungeon_runs "
-                            "ADD COLUMN thread_id INTEGER DEFAULT NULL"
-                        )
+            if "thread_id" not in fs_cols:
+                await conn.execute(
+                    text(
+                        "ALTER TABLE fishing_sessions "
+                        "ADD COLUMN thread_id INTEGER DEFAULT NULL"
                     )
-                if "stoneblood_used" not in dr_cols:
-                    await conn.execute(
-                        text(
-                            "ALTER TABLE dungeon_runs "
-                            "ADD COLUMN stoneblood_used BOOLEAN DEFAULT 0"
-                        )
+                )
+            if "angler_name" not in fs_cols:
+                await conn.execute(
+                    text(
+                        "ALTER TABLE fishing_sessions "
+                        "ADD COLUMN angler_name TEXT DEFAULT NULL"
                     )
-                if "combat_state_json" not in dr_cols:
-                    await conn.execute(
-                        text(
-                            "ALTER TABLE dungeon_runs "
-                            "ADD COLUMN combat_state_json VARCHAR DEFAULT '{}'"
-                        )
+                )
+
+        # Add thread_id column to dungeon_runs if missing
+        if "dungeon_runs" in tables:
+            dr_cols = await conn.run_sync(
+                lambda c: get_table_columns(c, "dungeon_runs")
+            )
+            if "thread_id" not in dr_cols:
+                await conn.execute(
+                    text(
+                        "ALTER TABLE dungeon_runs "
+                        "ADD COLUMN thread_id INTEGER DEFAULT NULL"
                     )
-                if "floor_state_json" not in dr_cols:
-                    await conn.execute(
-                        text(
-                            "ALTER TABLE dungeon_runs "
-                            "ADD COLUMN floor_state_json VARCHAR DEFAULT '{}'"
-                        )
+                )
+            if "stoneblood_used" not in dr_cols:
+                await conn.execute(
+                    text(
+                        "ALTER TABLE dungeon_runs "
+                        "ADD COLUMN stoneblood_used BOOLEAN DEFAULT 0"
                     )
-
-        # Seed brewing reference data (ingredients + dangerous triples)
-        async with self.sessionmaker() as session:
-            from brewing.seed_data import seed_if_empty
-
-            await seed_if_empty(session)
-
-        # One-time back-fill of abilities for racers that predate the abilities
-        # system. Idempotent: only touches racers with NULL signature_ability.
-        # Abilities are mechanical — the field must be uniform, so we can't
-        # leave legacy racers without abilities (unlike the appearance system).
-        try:
-            from . import abilities as _abilities
-
-            async with self.sessionmaker() as session:
-                result = await session.execute(
-                    select(models.Racer).where(
-                        models.Racer.signature_ability.is_(None)
+                )
+            if "combat_state_json" not in dr_cols:
+                await conn.execute(
+                    text(
+                        "ALTER TABLE dungeon_runs "
+                        "ADD COLUMN combat_state_json VARCHAR DEFAULT '{}'"
                     )
                 )
-                pending = result.scalars().all()
-                if pending:
-                    self.bot.logger.info(
-                        "Back-filling abilities for %d racers", len(pending),
+            if "floor_state_json" not in dr_cols:
+                await conn.execute(
+                    text(
+                        "ALTER TABLE dungeon_runs "
+                        "ADD COLUMN floor_state_json VARCHAR DEFAULT '{}'"
                     )
-                    for r in pending:
-                        sig, quirk = _abilities.roll_abilities(r)
-                        if sig:
-                            r.signature_ability = sig
-                        if quirk:
-                            r.quirk_ability = quirk
-                    await session.commit()
-        except Exception:
-            self.bot.logger.exception("Abilities back-fill failed")
+                )
 
-        self._initialized = True
+        # Partial indexes for the hot predicates. create_all only adds
+        # indexes alongside brand-new tables, so databases that predate
+        # them need the explicit idempotent form.
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_racers_active "
+                "ON racers (guild_id) WHERE retired = 0"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_races_pending "
+                "ON races (guild_id, id) WHERE finished = 0"
+            )
+        )
+
+        # Unique bet-per-type index backing the betting upsert. Old
+        # databases may hold duplicates from pre-constraint races;
+        # keep the newest of each group (the bet that was "current"
+        # under the old update-in-place flow) so the index can build.
+        await conn.execute(
+            text(
+                "DELETE FROM bets WHERE id NOT IN ("
+                "SELECT MAX(id) FROM bets "
+                "GROUP BY race_id, user_id, bet_type)"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_bets_race_user_type "
+                "ON bets (race_id, user_id, bet_type)"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_races_guild_finished_id "
+                "ON races (guild_id, finished, id)"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_races_guild_started_at "
+                "ON races (guild_id, started_at)"
+            )
+        )
 
     async def _run(self) -> None:
         await self.tick()
@@ -608,33 +911,49 @@ class DerbyScheduler:
         """Run the pending race for each guild, then create the next one."""
         await self._init_db()
 
-        for guild in self.bot.guilds:
-            await self._expire_pool_racers(guild.id)
-            await self._replenish_pool(guild.id)
-            # Find the pending race (created after the last race finished)
-            async with self.sessionmaker() as session:
-                result = await session.execute(
-                    select(models.Race).where(
-                        models.Race.guild_id == guild.id,
-                        models.Race.finished.is_(False),
-                    ).order_by(models.Race.id)
+        # Guilds tick concurrently: one guild's bet-window sleep (minutes
+        # long) no longer gates every other guild's race. Each coroutine
+        # opens its own short-lived sessions, and the size-1 writer pool
+        # keeps the actual writes serialized underneath.
+        # Pin one snapshot of the guild cache — each access to
+        # bot.guilds materialises a fresh list from the client's dict,
+        # and the error loop below must line up with the gather order.
+        guilds = list(self.bot.guilds)
+        results = await asyncio.gather(
+            *(self._tick_guild(guild.id) for guild in guilds),
+            return_exceptions=True,
+        )
+        for guild, exc in zip(guilds, results):
+            if isinstance(exc, BaseException):
+                self.bot.logger.error(
+                    "Guild tick failed",
+                    extra={"guild_id": guild.id},
+                    exc_info=exc,
                 )
-                race = result.scalars().first()
 
-            if race is None or race.id in self.active_races or race.id in self.betting_races:
-                continue
+    async def _tick_guild(self, guild_id: int) -> None:
+        """Run one guild's slice of the tick: pool upkeep, the pending
+        race (if it has a viable field), then creation of the next race.
+        """
+        await self._expire_pool_racers(guild_id)
+        await self._replenish_pool(guild_id)
+        # Find the pending race (created after the last race finished)
+        race_id = await self.get_next_race_id(guild_id)
 
-            # Load stored participants
-            async with self.sessionmaker() as session:
-                participants = await repo.get_race_participants(session, race.id)
+        if race_id is None or race_id in self.active_races or race_id in self.betting_races:
+            return
 
-            if len(participants) < 2:
-                continue
+        # Load stored participants
+        async with self.sessionmaker() as session:
+            participants = await repo.get_race_participants(session, race_id)
 
-            await self._run_race(race.id, guild.id, participants)
+        if len(participants) < 2:
+            return
 
-            # Create the next race with pre-picked participants
-            await self._create_next_race(guild.id)
+        await self._run_race(race_id, guild_id, participants)
+
+        # Create the next race with pre-picked participants
+        await self._create_next_race(guild_id)
 
     @staticmethod
     def _pick_competitive_field(
@@ -652,9 +971,9 @@ class DerbyScheduler:
         Returns ``None`` if even 2 racers can't be found.
 
         ``rng`` lets tests pin the field for reproducibility. Production
-        leaves it ``None`` and gets a fresh ``random.Random()`` per call —
-        same behavior as before, but no longer reads from the global
-        random state (which could be polluted by other tests).
+        callers pass the scheduler's own ``Random`` instance; ``None``
+        falls back to a fresh ``random.Random()``, still isolated from
+        the global random state (which could be polluted by other tests).
         """
         if rng is None:
             rng = random.Random()
@@ -721,7 +1040,7 @@ class DerbyScheduler:
         max_racers = self._resolve("max_racers_per_race", gs)
         window_size = self._resolve("race_stat_window", gs)
         participants = self._pick_competitive_field(
-            racers, max_racers, window_size
+            racers, max_racers, window_size, rng=self._rng,
         )
 
         if participants is None:
@@ -740,6 +1059,7 @@ class DerbyScheduler:
             await repo.create_race_entries(
                 session, race.id, [r.id for r in participants]
             )
+        self.bust_next_race(guild_id)
 
         self.bot.logger.info(
             "Next race created with %d participants",
@@ -800,7 +1120,7 @@ class DerbyScheduler:
         max_racers = self._resolve("max_racers_per_race", gs)
         window_size = self._resolve("race_stat_window", gs)
         participants = self._pick_competitive_field(
-            racers, max_racers, window_size,
+            racers, max_racers, window_size, rng=self._rng,
         )
         if participants is None:
             return None, []
@@ -819,6 +1139,7 @@ class DerbyScheduler:
             await repo.create_race_entries(
                 session, race.id, [r.id for r in participants]
             )
+        self.bust_next_race(guild_id)
 
         # Build abilities + color context for simulation
         from . import abilities as _abilities
@@ -861,6 +1182,7 @@ class DerbyScheduler:
                         )
                     )
                 await session.commit()
+        self.bust_next_race(guild_id)
 
         self.bot.logger.info(
             "Test race finished",
@@ -1001,8 +1323,8 @@ class DerbyScheduler:
                     rank = npc_data[rank_key]
                     racer_name = npc_data[name_key]
                     stats = npc_generation.generate_racer_stats_for_rank(rank)
-                    temperament = random.choice(npc_generation.TEMPERAMENTS)
-                    gender = random.choice(["M", "F"])
+                    temperament = self._rng.choice(npc_generation.TEMPERAMENTS)
+                    gender = self._rng.choice(["M", "F"])
 
                     racer = await repo.create_racer(
                         session,
@@ -1063,25 +1385,42 @@ class DerbyScheduler:
 
         Called on startup so there's always something for /race upcoming.
         """
-        for guild in self.bot.guilds:
-            await self._ensure_flavor_names(guild.id)
-            await self._ensure_guild_npcs(guild.id)
-            await self._replenish_pool(guild.id)
-
+        # One pass over the races table instead of a pending-race probe
+        # per guild: load every unfinished race up front (at most one or
+        # two per guild), plus the set of race ids that already have
+        # entries, then only the guilds with gaps do any further work.
+        guild_ids = [guild.id for guild in self.bot.guilds]
+        pending_by_guild: dict[int, models.Race] = {}
+        races_with_entries: set[int] = set()
+        if guild_ids:
             async with self.sessionmaker() as session:
                 result = await session.execute(
                     select(models.Race).where(
-                        models.Race.guild_id == guild.id,
+                        models.Race.guild_id.in_(guild_ids),
                         models.Race.finished.is_(False),
                     )
                 )
-                pending = result.scalars().first()
+                for race in result.scalars():
+                    pending_by_guild.setdefault(race.guild_id, race)
+                if pending_by_guild:
+                    entry_rows = await session.execute(
+                        select(models.RaceEntry.race_id.distinct()).where(
+                            models.RaceEntry.race_id.in_(
+                                [r.id for r in pending_by_guild.values()]
+                            )
+                        )
+                    )
+                    races_with_entries = {row[0] for row in entry_rows.all()}
+
+        for guild in self.bot.guilds:
+            await self._ensure_flavor_names(guild.id)
+            await self._ensure_guild_npcs(guild.id)
+            await self._replenish_pool(guild.id)
 
+            pending = pending_by_guild.get(guild.id)
             if pending is not None:
-                # Check if it has participants; backfill if not (legacy race)
-                async with self.sessionmaker() as session:
-                    entries = await repo.get_race_entries(session, pending.id)
-                if not entries:
+                # Backfill participants if it has none (legacy race)
+                if pending.id not in races_with_entries:
                     await self._backfill_race_entries(pending)
                 continue
 
@@ -1129,7 +1468,7 @@ class DerbyScheduler:
                     best = max(racers, key=lambda r: logic._racer_power(r))
                     rank = best.rank or "D"
                     multiplier = logic.daily_rank_multiplier(rank)
-                    base = random.randint(daily_min, daily_max)
+                    base = self._rng.randint(daily_min, daily_max)
                     amount = base * multiplier
 
                     # Generate flavor text
@@ -1179,7 +1518,7 @@ class DerbyScheduler:
                     if existing is not None:
                         continue
 
-                    amount = random.randint(daily_min, daily_max)
+                    amount = self._rng.randint(daily_min, daily_max)
                     from derby.descriptions import get_no_racer_loot
                     snippet = get_no_racer_loot()
                     flavor_text = (
@@ -1424,21 +1763,12 @@ class DerbyScheduler:
         async with self.sessionmaker() as session:
             # Racer IDs currently entered in any unfinished race in this guild
             in_pending = await session.execute(
-                select(models.RaceEntry.racer_id)
-                .join(models.Race, models.RaceEntry.race_id == models.Race.id)
-                .where(
-                    models.Race.guild_id == guild_id,
-                    models.Race.finished.is_(False),
-                )
+                _RESERVED_POOL_RACERS_STMT, {"guild_id": guild_id}
             )
             reserved_ids = {row[0] for row in in_pending.all()}
 
             result = await session.execute(
-                select(models.Racer).where(
-                    models.Racer.guild_id == guild_id,
-                    models.Racer.owner_id == 0,
-                    models.Racer.pool_expires_at <= func.now(),
-                )
+                _EXPIRED_POOL_RACERS_STMT, {"guild_id": guild_id}
             )
             candidates = result.scalars().all()
             expired = [r for r in candidates if r.id not in reserved_ids]
@@ -1475,10 +1805,7 @@ class DerbyScheduler:
         # Gather taken names for uniqueness
         async with self.sessionmaker() as session:
             result = await session.execute(
-                select(models.Racer.name).where(
-                    models.Racer.guild_id == guild_id,
-                    models.Racer.retired.is_(False),
-                )
+                _TAKEN_NAMES_STMT, {"guild_id": guild_id}
             )
             taken = {row[0] for row in result.all()}
 
@@ -1526,7 +1853,7 @@ class DerbyScheduler:
             if len(racers) < 2:
                 return
             participants = self._pick_competitive_field(
-                racers, max_racers, window_size
+                racers, max_racers, window_size, rng=self._rng,
             )
             if participants is None:
                 return
@@ -1579,15 +1906,31 @@ class DerbyScheduler:
         Returns the resolved guild settings and race map for use by the
         simulation phase.
         """
-        gs = await self._load_guild_settings(guild_id)
+        # Settings and the race row have no data dependency — overlap the
+        # two round-trips. Each runs on its own session (the settings
+        # resolver opens one internally), per the no-shared-session rule.
+        async def _load_race() -> models.Race | None:
+            async with self.sessionmaker() as session:
+                return await repo.get_race(session, race_id)
+
+        gs, race_obj = await asyncio.gather(
+            self._load_guild_settings(guild_id), _load_race(),
+        )
         # Use the pre-picked map stored on the race, fall back to a random pick
-        async with self.sessionmaker() as session:
-            race_obj = await repo.get_race(session, race_id)
         race_map = None
         if race_obj and race_obj.map_name:
             race_map = logic.get_map_by_name(race_obj.map_name)
         if race_map is None:
             race_map = logic.pick_map()
+        guild = self.bot.get_guild(guild_id)
+        if guild is None or self._get_channel(guild, gs) is None:
+            # Nobody can see the announcement or place a bet — don't pay
+            # the bet-window sleep for a dead guild. The race still runs
+            # and persists so the schedule advances.
+            self.betting_races.discard(race_id)
+            self.active_races.add(race_id)
+            self.bust_next_race(guild_id)
+            return gs, race_map
         await self._announce_race_start(
             guild_id, race_id, participants, race_map=race_map,
             guild_settings=gs,
@@ -1595,6 +1938,10 @@ class DerbyScheduler:
         await asyncio.sleep(self._resolve("bet_window", gs))
         self.betting_races.discard(race_id)
         self.active_races.add(race_id)
+        # Betting open → active is a lifecycle change too: without a bust
+        # the cog's cached next-race view can keep offering this race to
+        # bettors for up to the cache TTL after the window closed.
+        self.bust_next_race(guild_id)
         self.bot.logger.info(
             "Race starting",
             extra={"guild_id": guild_id, "race_id": race_id},
@@ -1655,10 +2002,19 @@ class DerbyScheduler:
         winner_id = result.placements[0] if result.placements else None
         placements_json = json.dumps(result.placements)
 
+        self.bust_next_race(guild_id)
         async with self.sessionmaker() as session:
-            await repo.update_race(
-                session, race_id, finished=True, winner_id=winner_id,
-                placements=placements_json,
+            # Direct statement-level update, no committed round-trip of
+            # its own: the race row, proc log, and every outcome below
+            # ride the session's single commit.
+            await session.execute(
+                update(models.Race)
+                .where(models.Race.id == race_id)
+                .values(
+                    finished=True,
+                    winner_id=winner_id,
+                    placements=placements_json,
+                )
             )
             # Persist ability proc log with final finish positions
             if result.proc_log:
@@ -1676,7 +2032,6 @@ class DerbyScheduler:
                             finish_position=placement_index.get(rid),
                         )
                     )
-                await session.commit()
             bet_results = await logic.resolve_payouts(
                 session, race_id, result.placements, guild_id=guild_id,
             )
@@ -1775,11 +2130,10 @@ class DerbyScheduler:
         npc_ids = {r.npc_id for r in participants if r.npc_id}
         if npc_ids:
             async with self.sessionmaker() as session:
-                for npc_id in npc_ids:
-                    npc = await repo.get_npc(session, npc_id)
-                    if npc:
-                        prefix = f"{npc.emoji} " if npc.emoji else ""
-                        npc_names[npc_id] = f"{prefix}{npc.name}"
+                npcs = await repo.get_npcs_by_ids(session, npc_ids)
+            for npc_id, npc in npcs.items():
+                prefix = f"{npc.emoji} " if npc.emoji else ""
+                npc_names[npc_id] = f"{prefix}{npc.name}"
 
         owner_names: dict[int, str] = {}
         player_ids = {
@@ -1908,20 +2262,10 @@ class DerbyScheduler:
             channel = self._get_channel(guild)
             if channel is None:
                 return
-        if names is None:
-            async with self.sessionmaker() as session:
-                racers = (
-                    (
-                        await session.execute(
-                            select(models.Racer).where(
-                                models.Racer.id.in_(placements)
-                            )
-                        )
-                    )
-                    .scalars()
-                    .all()
-                )
-            names = {r.id: r.name for r in racers}
+        # Every caller already holds the participants (and passes
+        # result.racer_names), so no session is opened here; a missing
+        # entry falls back to the "Racer {id}" placeholder below.
+        names = names or {}
 
         from . import abilities as _abilities_post
         race_colors_post = _abilities_post.assign_race_colors(list(placements))
@@ -2008,7 +2352,7 @@ class DerbyScheduler:
             # Check last place (40% chance)
             if len(placements) >= 2:
                 last_racer = await repo.get_racer(session, placements[-1])
-                if last_racer and last_racer.npc_id and random.random() < 0.4:
+                if last_racer and last_racer.npc_id and self._rng.random() < 0.4:
                     npc = await repo.get_npc(session, last_racer.npc_id)
                     if npc:
                         quips = npc_quips.parse_quips(npc.loss_quips)
@@ -2155,10 +2499,15 @@ class DerbyScheduler:
         if not bet_results:
             return
         names = names or {}
-        for br in bet_results:
+        # Each DM is an independent HTTP round-trip — fan them out with
+        # bounded concurrency so B bets cost roughly one latency instead
+        # of B of them. The send bucket still paces the aggregate rate.
+        sem = asyncio.Semaphore(10)
+
+        async def _send_one(br: dict) -> None:
             user = self.bot.get_user(br["user_id"])
             if user is None:
-                continue
+                return
             label = self.BET_TYPE_LABELS.get(br["bet_type"], br["bet_type"])
             racer_name = names.get(br["racer_id"], f"Racer {br['racer_id']}")
             free_tag = " (Free)" if br.get("is_free") else ""
@@ -2187,10 +2536,14 @@ class DerbyScheduler:
                     f"\u274c Lost **{br['amount']} coins** "
                     f"on **{racer_name}**"
                 )
-            try:
-                await user.send(msg)
-            except (discord.Forbidden, discord.HTTPException):
-                continue
+            async with sem:
+                await self._send_bucket.acquire()
+                try:
+                    await user.send(msg)
+                except (discord.Forbidden, discord.HTTPException):
+                    pass
+
+        await asyncio.gather(*(_send_one(br) for br in bet_results))
 
     async def _stream_commentary(
         self, race_id: int, guild_id: int, log: list[str], delay: float = 6.0,
@@ -2223,81 +2576,89 @@ class DerbyScheduler:
         # actually has one to remove (iter 0 has no chart by design).
         current_has_chart = False
 
-        for i, event in enumerate(log):
-            is_last = i == len(log) - 1
+        # Cancellation is signalled (cancel_commentary) rather than
+        # polled — the old per-paragraph liveness SELECT cost a database
+        # round-trip for every line of commentary. The try/finally keeps
+        # the signal registry from leaking entries for finished streams.
+        cancel_event = self.commentaries.setdefault(race_id, asyncio.Event())
+        try:
+            for i, event in enumerate(log):
+                is_last = i == len(log) - 1
 
-            # Check if race was cancelled
-            async with self.sessionmaker() as session:
-                if await repo.get_race(session, race_id) is None:
+                # Race was cancelled mid-stream
+                if cancel_event.is_set():
                     return
 
-            # Would appending this event overflow the current message?
-            # +2 accounts for the "\n\n" separator joined between events.
-            projected = "\n\n".join(current_lines + [event])
-            if current_lines and len(projected) > MAX_DESC_CHARS:
-                # Flush: leave the current message's commentary as-is,
-                # but strip the standings field off it — the new message
-                # will carry the fresh chart, and two messages showing
-                # standings side-by-side is visually redundant (the old
-                # one's chart is stale anyway).
-                if current_message is not None and current_has_chart:
-                    try:
-                        stripped = discord.Embed(
-                            description="\n\n".join(current_lines),
-                            color=0x2ECC71,
-                        )
-                        await current_message.edit(embed=stripped)
-                    except (discord.Forbidden, discord.HTTPException):
-                        pass  # Non-fatal: stale chart stays on old msg
-                current_message = None
-                current_lines = [event]
-                current_has_chart = False
-            else:
-                current_lines.append(event)
+                # Would appending this event overflow the current message?
+                # +2 accounts for the "\n\n" separator joined between events.
+                projected = "\n\n".join(current_lines + [event])
+                if current_lines and len(projected) > MAX_DESC_CHARS:
+                    # Flush: leave the current message's commentary as-is,
+                    # but strip the standings field off it — the new message
+                    # will carry the fresh chart, and two messages showing
+                    # standings side-by-side is visually redundant (the old
+                    # one's chart is stale anyway).
+                    if current_message is not None and current_has_chart:
+                        try:
+                            stripped = discord.Embed(
+                                description="\n\n".join(current_lines),
+                                color=0x2ECC71,
+                            )
+                            await current_message.edit(embed=stripped)
+                        except (discord.Forbidden, discord.HTTPException):
+                            pass  # Non-fatal: stale chart stays on old msg
+                    current_message = None
+                    current_lines = [event]
+                    current_has_chart = False
+                else:
+                    current_lines.append(event)
 
-            embed = discord.Embed(
-                description="\n\n".join(current_lines),
-                color=0xF1C40F if is_last else 0x2ECC71,
-            )
-
-            # Live standings bar chart — attached as an embed field (separate
-            # from description, so rollover math above doesn't need to juggle
-            # chart size). Clamp to the last-known chart if the paragraph
-            # stream is longer than the chart list (template fallback can
-            # produce multiple paragraphs per segment).
-            #
-            # Shift chart indexing by 1: paragraph 0 narrates the opening
-            # (starting gun), so we don't want a chart yet — it would show
-            # segment-0's end-state alongside "they're off!" and feel like
-            # the race is already decided. Paragraph 1 narrates segment 1,
-            # so it gets charts[0] (the end-of-segment-0 standings), etc.
-            #
-            # The final paragraph (is_last) also skips the chart: the
-            # winner narration lives here, but the Final Standings chart
-            # is rendered in the subsequent "Race Complete!" embed so
-            # end-of-race info is consolidated into a single final
-            # message rather than duplicated across two.
-            attaching_chart = bool(charts) and i > 0 and not is_last
-            if attaching_chart:
-                chart_idx = min(i - 1, len(charts) - 1)
-                embed.add_field(
-                    name="Current Standings",
-                    value=charts[chart_idx],
-                    inline=False,
+                embed = discord.Embed(
+                    description="\n\n".join(current_lines),
+                    color=0xF1C40F if is_last else 0x2ECC71,
                 )
 
-            try:
-                if current_message is None:
-                    current_message = await channel.send(embed=embed)
-                else:
-                    await current_message.edit(embed=embed)
-            except (discord.Forbidden, discord.HTTPException):
-                return
+                # Live standings bar chart — attached as an embed field (separate
+                # from description, so rollover math above doesn't need to juggle
+                # chart size). Clamp to the last-known chart if the paragraph
+                # stream is longer than the chart list (template fallback can
+                # produce multiple paragraphs per segment).
+                #
+                # Shift chart indexing by 1: paragraph 0 narrates the opening
+                # (starting gun), so we don't want a chart yet — it would show
+                # segment-0's end-state alongside "they're off!" and feel like
+                # the race is already decided. Paragraph 1 narrates segment 1,
+                # so it gets charts[0] (the end-of-segment-0 standings), etc.
+                #
+                # The final paragraph (is_last) also skips the chart: the
+                # winner narration lives here, but the Final Standings chart
+                # is rendered in the subsequent "Race Complete!" embed so
+                # end-of-race info is consolidated into a single final
+                # message rather than duplicated across two.
+                attaching_chart = bool(charts) and i > 0 and not is_last
+                if attaching_chart:
+                    chart_idx = min(i - 1, len(charts) - 1)
+                    embed.add_field(
+                        name="Current Standings",
+                        value=charts[chart_idx],
+                        inline=False,
+                    )
 
-            current_has_chart = attaching_chart
+                await self._send_bucket.acquire()
+                try:
+                    if current_message is None:
+                        current_message = await channel.send(embed=embed)
+                    else:
+                        await current_message.edit(embed=embed)
+                except (discord.Forbidden, discord.HTTPException):
+                    return
 
-            if not is_last:
-                await asyncio.sleep(delay)
+                current_has_chart = attaching_chart
+
+                if not is_last:
+                    await asyncio.sleep(delay)
+        finally:
+            self.commentaries.pop(race_id, None)
 
     async def _increment_careers(
         self, session: AsyncSession, racers: list[models.Racer]
@@ -2320,11 +2681,19 @@ class DerbyScheduler:
         racers: list[models.Racer],
         guild_id: int = 0,
     ) -> list[models.Racer]:
-        """Retire racers that have reached their career_length."""
+        """Retire racers that have reached their career_length.
+
+        Mutates the session-tracked rows instead of issuing a committed
+        UPDATE per racer — the caller's single commit lands every
+        retirement (and the rest of the race outcome) in one fsync.
+        """
         retirements: list[models.Racer] = []
         for racer in racers:
             if racer.races_completed >= racer.career_length:
-                await repo.update_racer(session, racer.id, retired=True)
+                db_racer = await session.get(models.Racer, racer.id)
+                if db_racer is not None:
+                    db_racer.retired = True
+                racer.retired = True
                 retirements.append(racer)
         return retirements
 
@@ -2362,16 +2731,15 @@ class DerbyScheduler:
             title="Race Starting Soon",
             description=desc,
         )
-        # Pre-load NPC names for display
+        # Pre-load NPC names for display — one query for the whole field
         npc_names: dict[int, str] = {}
         npc_ids = {r.npc_id for r in racers if r.npc_id}
         if npc_ids:
             async with self.sessionmaker() as session:
-                for npc_id in npc_ids:
-                    npc = await repo.get_npc(session, npc_id)
-                    if npc:
-                        prefix = f"{npc.emoji} " if npc.emoji else ""
-                        npc_names[npc_id] = f"{prefix}{npc.name}"
+                npcs = await repo.get_npcs_by_ids(session, npc_ids)
+            for npc_id, npc in npcs.items():
+                prefix = f"{npc.emoji} " if npc.emoji else ""
+                npc_names[npc_id] = f"{prefix}{npc.name}"
 
         # Resolve player owner names
         owner_names: dict[int, str] = {}
@@ -2472,10 +2840,7 @@ class DerbyScheduler:
 
             # Get taken names for uniqueness
             result = await session.execute(
-                select(models.Racer.name).where(
-                    models.Racer.guild_id == guild_id,
-                    models.Racer.retired.is_(False),
-                )
+                _TAKEN_NAMES_STMT, {"guild_id": guild_id}
             )
             taken_names = {row[0] for row in result.all()}
 
@@ -2494,8 +2859,8 @@ class DerbyScheduler:
             # Generate stats for the same rank
             rank = racer.rank or "D"
             stats = npc_generation.generate_racer_stats_for_rank(rank)
-            temperament = random.choice(npc_generation.TEMPERAMENTS)
-            gender = random.choice(["M", "F"])
+            temperament = self._rng.choice(npc_generation.TEMPERAMENTS)
+            gender = self._rng.choice(["M", "F"])
 
             new_racer = await repo.create_racer(
                 session,
@@ -2590,11 +2955,7 @@ class DerbyScheduler:
     ) -> list[models.Racer]:
         """Decrement injury counters for all injured racers and auto-heal at 0."""
         result = await session.execute(
-            select(models.Racer).where(
-                models.Racer.guild_id == guild_id,
-                models.Racer.retired.is_(False),
-                models.Racer.injury_races_remaining > 0,
-            )
+            _INJURED_RACERS_STMT, {"guild_id": guild_id}
         )
         injured = result.scalars().all()
         healed: list[models.Racer] = []
@@ -2611,10 +2972,7 @@ class DerbyScheduler:
     ) -> None:
         """Decrement breed_cooldown for all guild racers with cooldown > 0."""
         result = await session.execute(
-            select(models.Racer).where(
-                models.Racer.guild_id == guild_id,
-                models.Racer.breed_cooldown > 0,
-            )
+            _BREED_COOLDOWN_RACERS_STMT, {"guild_id": guild_id}
         )
         for racer in result.scalars().all():
             racer.breed_cooldown = max(0, racer.breed_cooldown - 1)
@@ -2828,14 +3186,11 @@ class DerbyScheduler:
             session, guild_id, rank, unowned_only=True
         )
         available = [r for r in pool if r.id not in registered_ids]
-        random.shuffle(available)
+        self._rng.shuffle(available)
 
         # Gather taken names for generation
         result = await session.execute(
-            select(models.Racer.name).where(
-                models.Racer.guild_id == guild_id,
-                models.Racer.retired.is_(False),
-            )
+            _TAKEN_NAMES_STMT, {"guild_id": guild_id}
         )
         taken_names = {row[0] for row in result.all()}
 
@@ -3023,7 +3378,7 @@ class DerbyScheduler:
                     # Elf Twin Cast: 10% chance to catch two fish
                     twin_catch = None
                     twin_chance = get_racial_modifier(_race, "fishing.double_catch_chance", 0.0)
-                    if twin_chance > 0 and not catch["is_trash"] and random.random() < twin_chance:
+                    if twin_chance > 0 and not catch["is_trash"] and self._rng.random() < twin_chance:
                         twin_catch = fish_logic.select_catch(
                             location_data, rod_data, fs.bait_type,
                             rare_weight_bonus=rare_bonus,
@@ -3112,7 +3467,7 @@ class DerbyScheduler:
 
                     # Halfling bait save: 15% chance to not consume bait
                     bait_save_chance = get_racial_modifier(_race, "fishing.bait_save_chance", 0.0)
-                    bait_saved = bait_save_chance > 0 and random.random() < bait_save_chance
+                    bait_saved = bait_save_chance > 0 and self._rng.random() < bait_save_chance
                     new_remaining = fs.bait_remaining if bait_saved else fs.bait_remaining - 1
 
                     # Orc cast time reduction
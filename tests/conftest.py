@@ -17,6 +17,50 @@ from pathlib import Path
 
 import pytest
 
+from config import Settings
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover — e.g. Windows
+    uvloop = None
+
+# Tests are single-writer and their databases die with the test, so trade
+# every durability guarantee for speed. WAL is pointless on an in-memory
+# database — journal in memory and skip fsyncs entirely instead.
+_TEST_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=memory",
+)
+
+
+def apply_test_pragmas(dbapi_connection, connection_record) -> None:
+    """Run the test-speed PRAGMAs on every new DBAPI connection.
+
+    Register on an engine with
+    ``event.listens_for(engine.sync_engine, "connect")``.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in _TEST_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# Validate the Settings defaults once per process; every test then pays
+# only for a shallow copy with its overrides applied. Settings fields are
+# plain values (no validators), so skipping re-validation changes nothing.
+_BASE_SETTINGS = Settings()
+
+
+def make_settings(**overrides) -> Settings:
+    """Return a Settings instance with *overrides* applied.
+
+    Drop-in for ``Settings(**overrides)`` in tests — ``model_copy`` on a
+    shared validated base instead of full pydantic validation per call.
+    """
+    return _BASE_SETTINGS.model_copy(update=overrides)
+
+
 # Directory name → marker name. Keep in sync with pytest.ini::markers.
 _DIR_MARKERS = {
     "brewing": "brewing",
@@ -28,8 +72,29 @@ _DIR_MARKERS = {
 }
 
 
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run every async test on uvloop — the suite is await-heavy.
+
+        pytest-asyncio builds its loops from this fixture. When uvloop
+        isn't installed (Windows) the default policy applies unchanged.
+        """
+        return uvloop.EventLoopPolicy()
+
+
+# One asyncio loop for the whole session instead of one per test. Loop
+# setup/teardown is pure overhead for ~1000 async tests, and async
+# fixtures stay on the same loop as the tests that use them (see
+# asyncio_default_fixture_loop_scope in pytest.ini, which must match).
+# Tests marked looptime keep their own per-test loops: looptime patches
+# the loop clock, which must not leak into the shared session loop.
+_SESSION_LOOP = pytest.mark.asyncio(loop_scope="session")
+
+
 def pytest_collection_modifyitems(config, items):  # noqa: D401
-    """Auto-apply directory markers to each collected test."""
+    """Auto-apply directory markers and the shared session loop."""
     for item in items:
         path = Path(str(item.fspath))
         for part in path.parts:
@@ -37,3 +102,7 @@ def pytest_collection_modifyitems(config, items):  # noqa: D401
             if marker is not None:
                 item.add_marker(getattr(pytest.mark, marker))
                 break
+        if item.get_closest_marker("asyncio") and not item.get_closest_marker(
+            "looptime"
+        ):
+            item.add_marker(_SESSION_LOOP, append=False)
@@ -0,0 +1,66 @@
+"""Shared fixtures for derby tests.
+
+Provides:
+  - sessionmaker          in-memory sqlite, all imported tables created
+
+Cog-level tests inject ``sessionmaker`` straight into the stub
+scheduler namespace. Scheduler tests are the exception: ``DerbyScheduler``
+builds its own engines from a ``db_path``, so those tests keep their
+per-test ``tmp_path`` database files.
+"""
+
+from __future__ import annotations
+
+import pytest_asyncio
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from db_base import Base
+import core.models  # noqa: F401 — register guild_settings on Base
+import derby.models
+import economy.models
+from tests.conftest import apply_test_pragmas
+
+
+async def seed(session, *, racers=(), wallets=(), bets=()):
+    """Insert seed rows with one executemany per table and one commit.
+
+    Each element is a kwargs dict for the corresponding model; column
+    defaults fill the rest. Returns the created racers in input order —
+    the one table tests routinely need ids back from. Use this instead
+    of calling ``create_*`` helpers in a loop: N rows cost one round
+    trip and one transaction rather than N of each.
+    """
+    created: list[derby.models.Racer] = []
+    if racers:
+        result = await session.execute(
+            insert(derby.models.Racer).returning(
+                derby.models.Racer, sort_by_parameter_order=True
+            ),
+            list(racers),
+        )
+        created = list(result.scalars())
+    if wallets:
+        await session.execute(insert(economy.models.Wallet), list(wallets))
+    if bets:
+        await session.execute(insert(derby.models.Bet), list(bets))
+    await session.commit()
+    return created
+
+
+@pytest_asyncio.fixture
+async def sessionmaker():
+    """Per-test in-memory sqlite sessionmaker with the schema applied.
+
+    ``sqlite+aiosqlite://`` defaults to a ``StaticPool``, so every
+    session shares the single in-memory database. Keeping the engine
+    function-scoped gives each test a fresh schema without touching
+    disk, and keeps connections on the test's own event loop.
+    """
+    engine = create_async_engine("sqlite+aiosqlite://")
+    event.listens_for(engine.sync_engine, "connect")(apply_test_pragmas)
+    sm = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield sm
+    await engine.dispose()
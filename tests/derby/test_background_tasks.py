@@ -10,6 +10,7 @@ import pytest
 
 from config import Settings
 from derby.scheduler import DerbyScheduler
+from tests.conftest import make_settings
 
 
 class _RecordingLogger:
@@ -41,7 +42,7 @@ class _DummyBot:
 
 
 def _make_scheduler(tmp_path: Path, logger=None) -> DerbyScheduler:
-    bot = _DummyBot(Settings(race_times=["12:00"]), logger=logger)
+    bot = _DummyBot(make_settings(race_times=["12:00"]), logger=logger)
     return DerbyScheduler(bot, db_path=str(tmp_path / "db.sqlite"))
 
 
@@ -1,5 +1,4 @@
 import types
-from pathlib import Path
 from unittest.mock import patch
 
 import discord
@@ -22,10 +21,20 @@ from derby import repositories as repo
 from derby.settings_cache import GuildSettingsResolver
 from economy import repositories as wallet_repo
 import economy.models  # noqa: F401
+from tests.conftest import make_settings
+from tests.derby.conftest import seed
 
 
 GUILD_ID = 1
 
+# Built once — 14 read-back sites reuse the same statement instead of
+# paying SQLAlchemy construction/compilation per call.
+_ALL_BETS_STMT = select(models.Bet)
+_ALL_RACERS_STMT = select(models.Racer)
+
+# Intents are immutable flag values; one instance serves every Bot here.
+_INTENTS = discord.Intents.none()
+
 
 class DummyChannel:
     """Minimal channel stub that records sent messages."""
@@ -63,7 +72,7 @@ class DummyContext:
 
 @pytest.mark.asyncio
 async def test_setup_adds_cog():
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
     await derby_cog.setup(bot)
     await stable_cog.setup(bot)
     await tournament_cog.setup(bot)
@@ -72,14 +81,37 @@ async def test_setup_adds_cog():
     assert "tournament_cog" in bot.cogs
 
 
+async def _make_cog_env(sessionmaker, cog_cls=derby_cog.Derby, **settings_kwargs):
+    """Helper: build a bot stub with a scheduler, bind *cog_cls*, return (cog, ctx).
+
+    ``settings_kwargs`` are forwarded to :class:`Settings`; pass
+    ``cog_cls`` for the stable/economy variants. Tests that need the bot
+    itself can reach it via ``ctx.bot``.
+
+    A SimpleNamespace stands in for ``commands.Bot``: these tests invoke
+    commands directly on the cog, so the only ``add_cog`` side effect
+    they need is each command's self-binding — done by hand below,
+    because ``add_cog``'s app-command copying dominates per-test setup.
+    """
+    bot = types.SimpleNamespace(
+        settings=make_settings(race_times=["12:00"], **settings_kwargs)
+    )
+    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
+    cog = cog_cls(bot)
+    for command in cog.walk_commands():
+        command.cog = cog
+    ctx = DummyContext(bot)
+    return cog, ctx
+
+
 async def _make_help_bot():
     """Create a bot with an in-memory DB scheduler for help command tests."""
     engine = create_async_engine("sqlite+aiosqlite://")
     sm = async_sessionmaker(engine, expire_on_commit=False)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings()
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings()
     bot.scheduler = types.SimpleNamespace(
         sessionmaker=sm,
         guild_settings=GuildSettingsResolver(sm, bot.settings),
@@ -142,31 +174,23 @@ async def test_help_brewing():
 
 
 @pytest.mark.asyncio
-async def test_race_upcoming(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_race_upcoming(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         race = await repo.create_race(session, guild_id=GUILD_ID)
-        r1 = await repo.create_racer(
-            session, name="A", owner_id=1, guild_id=GUILD_ID
-        )
-        r2 = await repo.create_racer(
-            session, name="B", owner_id=2, guild_id=GUILD_ID
+        r1, r2 = await seed(
+            session,
+            racers=[
+                {"name": "A", "owner_id": 1, "guild_id": GUILD_ID},
+                {"name": "B", "owner_id": 2, "guild_id": GUILD_ID},
+            ],
         )
         await repo.create_race_entries(session, race.id, [r1.id, r2.id])
 
@@ -177,86 +201,80 @@ async def test_race_upcoming(tmp_path: Path) -> None:
     assert fields[0].name == "Race ID" and fields[0].value == str(race.id)
 
 
-async def _make_bet_env(tmp_path, num_racers=2):
+async def _make_bet_env(sessionmaker, num_racers=2):
     """Helper: create a bot, cog, context, race, and racers for bet tests."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
     ctx.author = types.SimpleNamespace(id=5)
 
-    racers = []
     async with sessionmaker() as session:
         race = await repo.create_race(session, guild_id=GUILD_ID)
-        for i in range(num_racers):
-            r = await repo.create_racer(
-                session, name=chr(65 + i), owner_id=i + 1, guild_id=GUILD_ID,
-                speed=20 - i * 3, cornering=15, stamina=15,
-            )
-            racers.append(r)
+        racers = await seed(
+            session,
+            racers=[
+                {"name": chr(65 + i), "owner_id": i + 1, "guild_id": GUILD_ID,
+                 "speed": 20 - i * 3, "cornering": 15, "stamina": 15}
+                for i in range(num_racers)
+            ],
+        )
         await repo.create_race_entries(session, race.id, [r.id for r in racers])
 
     return cog, ctx, sessionmaker, race, racers
 
 
 @pytest.mark.asyncio
-async def test_race_bet_win(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path)
+async def test_race_bet_win(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker)
 
     await cog.race_bet_win(ctx, racer=racers[0].id, amount=20)
 
+    # One read-only session serves both verification passes; expire_all
+    # drops its cached state so the second pass sees the cog's writes.
     async with sessionmaker() as session:
         wallet = await wallet_repo.get_wallet(session, ctx.author.id, GUILD_ID)
-        bet = (await session.execute(select(models.Bet))).scalars().first()
+        bet = (await session.execute(_ALL_BETS_STMT)).scalars().first()
 
-    assert wallet.balance == 80
-    assert bet.racer_id == racers[0].id and bet.amount == 20
-    assert bet.bet_type == "win"
+        assert wallet.balance == 80
+        assert bet.racer_id == racers[0].id and bet.amount == 20
+        assert bet.bet_type == "win"
 
-    # Replacing a win bet refunds the old one
-    await cog.race_bet_win(ctx, racer=racers[1].id, amount=30)
+        # Replacing a win bet refunds the old one
+        await cog.race_bet_win(ctx, racer=racers[1].id, amount=30)
 
-    async with sessionmaker() as session:
+        session.expire_all()
         wallet = await wallet_repo.get_wallet(session, ctx.author.id, GUILD_ID)
-        bet = (await session.execute(select(models.Bet))).scalars().first()
+        bet = (await session.execute(_ALL_BETS_STMT)).scalars().first()
 
-    assert wallet.balance == 70
-    assert bet.racer_id == racers[1].id and bet.amount == 30
+        assert wallet.balance == 70
+        assert bet.racer_id == racers[1].id and bet.amount == 30
 
 
 @pytest.mark.asyncio
-async def test_race_bet_place(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path)
+async def test_race_bet_place(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker)
 
     await cog.race_bet_place(ctx, racer=racers[0].id, amount=25)
 
     async with sessionmaker() as session:
-        bet = (await session.execute(select(models.Bet))).scalars().first()
+        bet = (await session.execute(_ALL_BETS_STMT)).scalars().first()
 
     assert bet.bet_type == "place"
     assert bet.amount == 25
 
 
 @pytest.mark.asyncio
-async def test_race_bet_exacta(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path)
+async def test_race_bet_exacta(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker)
 
     await cog.race_bet_exacta(ctx, first=racers[0].id, second=racers[1].id, amount=15)
 
     async with sessionmaker() as session:
-        bet = (await session.execute(select(models.Bet))).scalars().first()
+        bet = (await session.execute(_ALL_BETS_STMT)).scalars().first()
 
     assert bet.bet_type == "exacta"
     import json
@@ -265,8 +283,8 @@ async def test_race_bet_exacta(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_race_bet_trifecta(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path, num_racers=4)
+async def test_race_bet_trifecta(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker, num_racers=4)
 
     await cog.race_bet_trifecta(
         ctx, first=racers[0].id, second=racers[1].id,
@@ -274,7 +292,7 @@ async def test_race_bet_trifecta(tmp_path: Path) -> None:
     )
 
     async with sessionmaker() as session:
-        bet = (await session.execute(select(models.Bet))).scalars().first()
+        bet = (await session.execute(_ALL_BETS_STMT)).scalars().first()
 
     assert bet.bet_type == "trifecta"
     import json
@@ -283,8 +301,8 @@ async def test_race_bet_trifecta(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_race_bet_superfecta(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path, num_racers=6)
+async def test_race_bet_superfecta(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker, num_racers=6)
 
     await cog.race_bet_superfecta(
         ctx,
@@ -294,14 +312,14 @@ async def test_race_bet_superfecta(tmp_path: Path) -> None:
     )
 
     async with sessionmaker() as session:
-        bet = (await session.execute(select(models.Bet))).scalars().first()
+        bet = (await session.execute(_ALL_BETS_STMT)).scalars().first()
 
     assert bet.bet_type == "superfecta"
 
 
 @pytest.mark.asyncio
-async def test_race_bet_superfecta_rejected_small_field(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path, num_racers=4)
+async def test_race_bet_superfecta_rejected_small_field(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker, num_racers=4)
 
     await cog.race_bet_superfecta(
         ctx,
@@ -312,35 +330,35 @@ async def test_race_bet_superfecta_rejected_small_field(tmp_path: Path) -> None:
 
     # Field size check fires before pick validation
     async with sessionmaker() as session:
-        bets = (await session.execute(select(models.Bet))).scalars().all()
+        bets = (await session.execute(_ALL_BETS_STMT)).scalars().all()
     assert len(bets) == 0
     assert any("6 racers" in str(m.get("content", "")) for m in ctx.sent)
 
 
 @pytest.mark.asyncio
-async def test_race_bet_duplicate_picks_rejected(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path)
+async def test_race_bet_duplicate_picks_rejected(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker)
 
     await cog.race_bet_exacta(
         ctx, first=racers[0].id, second=racers[0].id, amount=10,
     )
 
     async with sessionmaker() as session:
-        bets = (await session.execute(select(models.Bet))).scalars().all()
+        bets = (await session.execute(_ALL_BETS_STMT)).scalars().all()
     assert len(bets) == 0
     assert any("once" in str(m.get("content", "")).lower() for m in ctx.sent)
 
 
 @pytest.mark.asyncio
-async def test_race_bet_one_per_type_allowed(tmp_path: Path) -> None:
+async def test_race_bet_one_per_type_allowed(sessionmaker) -> None:
     """Players can have a win AND a place bet simultaneously."""
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path)
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker)
 
     await cog.race_bet_win(ctx, racer=racers[0].id, amount=10)
     await cog.race_bet_place(ctx, racer=racers[0].id, amount=10)
 
     async with sessionmaker() as session:
-        bets = (await session.execute(select(models.Bet))).scalars().all()
+        bets = (await session.execute(_ALL_BETS_STMT)).scalars().all()
 
     assert len(bets) == 2
     bet_types = {b.bet_type for b in bets}
@@ -348,15 +366,15 @@ async def test_race_bet_one_per_type_allowed(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_race_bet_same_type_replaces(tmp_path: Path) -> None:
+async def test_race_bet_same_type_replaces(sessionmaker) -> None:
     """Placing a second win bet refunds the first and replaces it."""
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path)
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker)
 
     await cog.race_bet_win(ctx, racer=racers[0].id, amount=20)
     await cog.race_bet_win(ctx, racer=racers[1].id, amount=30)
 
     async with sessionmaker() as session:
-        bets = (await session.execute(select(models.Bet))).scalars().all()
+        bets = (await session.execute(_ALL_BETS_STMT)).scalars().all()
         wallet = await wallet_repo.get_wallet(session, ctx.author.id, GUILD_ID)
 
     assert len(bets) == 1
@@ -367,8 +385,8 @@ async def test_race_bet_same_type_replaces(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_free_bet_when_broke(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path)
+async def test_free_bet_when_broke(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker)
     # Create wallet with 0 balance
     async with sessionmaker() as session:
         await wallet_repo.create_wallet(
@@ -378,7 +396,7 @@ async def test_free_bet_when_broke(tmp_path: Path) -> None:
     await cog.race_bet_win(ctx, racer=racers[0].id, amount=0)
 
     async with sessionmaker() as session:
-        bet = (await session.execute(select(models.Bet))).scalars().first()
+        bet = (await session.execute(_ALL_BETS_STMT)).scalars().first()
         wallet = await wallet_repo.get_wallet(session, ctx.author.id, GUILD_ID)
 
     assert bet is not None
@@ -389,22 +407,22 @@ async def test_free_bet_when_broke(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_free_bet_rejected_with_coins(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path)
+async def test_free_bet_rejected_with_coins(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker)
     # Default wallet has 100 coins
 
     await cog.race_bet_win(ctx, racer=racers[0].id, amount=0)
 
     async with sessionmaker() as session:
-        bets = (await session.execute(select(models.Bet))).scalars().all()
+        bets = (await session.execute(_ALL_BETS_STMT)).scalars().all()
 
     assert len(bets) == 0
     assert any("balance is 0" in str(m.get("content", "")) for m in ctx.sent)
 
 
 @pytest.mark.asyncio
-async def test_free_bet_one_per_race(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path)
+async def test_free_bet_one_per_race(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker)
     async with sessionmaker() as session:
         await wallet_repo.create_wallet(
             session, user_id=ctx.author.id, guild_id=GUILD_ID, balance=0
@@ -417,40 +435,34 @@ async def test_free_bet_one_per_race(tmp_path: Path) -> None:
     await cog.race_bet_place(ctx, racer=racers[0].id, amount=0)
 
     async with sessionmaker() as session:
-        bets = (await session.execute(select(models.Bet))).scalars().all()
+        bets = (await session.execute(_ALL_BETS_STMT)).scalars().all()
 
     assert len(bets) == 1  # Only the first free bet
     assert any("already have a free bet" in str(m.get("content", "")) for m in ctx.sent)
 
 
 @pytest.mark.asyncio
-async def test_negative_amount_rejected(tmp_path: Path) -> None:
-    cog, ctx, sessionmaker, race, racers = await _make_bet_env(tmp_path)
+async def test_negative_amount_rejected(sessionmaker) -> None:
+    cog, ctx, sessionmaker, race, racers = await _make_bet_env(sessionmaker)
 
     await cog.race_bet_win(ctx, racer=racers[0].id, amount=-5)
 
     async with sessionmaker() as session:
-        bets = (await session.execute(select(models.Bet))).scalars().all()
+        bets = (await session.execute(_ALL_BETS_STMT)).scalars().all()
 
     assert len(bets) == 0
     assert any("positive" in str(m.get("content", "")).lower() for m in ctx.sent)
 
 
 @pytest.mark.asyncio
-async def test_give_coins_positive(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=100,
-        retirement_threshold=65, bet_window=0, countdown_total=0,
+async def test_give_coins_positive(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        default_wallet=100,
+        retirement_threshold=65,
+        bet_window=0,
+        countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
     target = types.SimpleNamespace(id=99, mention="@TestTarget")
 
     await cog.give_coins(ctx, user=target, amount=50)
@@ -463,20 +475,14 @@ async def test_give_coins_positive(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_give_coins_negative(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=100,
-        retirement_threshold=65, bet_window=0, countdown_total=0,
+async def test_give_coins_negative(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        default_wallet=100,
+        retirement_threshold=65,
+        bet_window=0,
+        countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
     target = types.SimpleNamespace(id=99, mention="@TestTarget")
 
     await cog.give_coins(ctx, user=target, amount=-30)
@@ -487,20 +493,14 @@ async def test_give_coins_negative(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_give_coins_overdraft_rejected(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=100,
-        retirement_threshold=65, bet_window=0, countdown_total=0,
+async def test_give_coins_overdraft_rejected(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        default_wallet=100,
+        retirement_threshold=65,
+        bet_window=0,
+        countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
     target = types.SimpleNamespace(id=99, mention="@TestTarget")
 
     await cog.give_coins(ctx, user=target, amount=-200)
@@ -513,20 +513,14 @@ async def test_give_coins_overdraft_rejected(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_give_coins_zero_rejected(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=100,
-        retirement_threshold=65, bet_window=0, countdown_total=0,
+async def test_give_coins_zero_rejected(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        default_wallet=100,
+        retirement_threshold=65,
+        bet_window=0,
+        countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
     target = types.SimpleNamespace(id=99, mention="@TestTarget")
 
     await cog.give_coins(ctx, user=target, amount=0)
@@ -550,13 +544,9 @@ async def test_admin_check_requires_role() -> None:
 
 
 @pytest.mark.asyncio
-async def test_wallet_command_creates_and_returns_balance(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
+async def test_wallet_command_creates_and_returns_balance(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=65,
@@ -581,23 +571,14 @@ async def test_wallet_command_creates_and_returns_balance(tmp_path: Path) -> Non
 
 
 @pytest.mark.asyncio
-async def test_racer_delete(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_racer_delete(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -613,13 +594,9 @@ async def test_racer_delete(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_race_force_start(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
+async def test_race_force_start(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -647,6 +624,7 @@ async def test_race_force_start(tmp_path: Path) -> None:
         _dm_payouts=noop,
         _announce_placement_prizes=noop,
         _create_next_race=noop,
+        bust_next_race=lambda guild_id: None,
         active_races=set(),
         betting_races=set(),
         guild_settings=GuildSettingsResolver(sessionmaker, bot.settings),
@@ -655,24 +633,29 @@ async def test_race_force_start(tmp_path: Path) -> None:
     await bot.add_cog(cog)
     ctx = DummyContext(bot)
 
+    # All seed rows ride a single transaction: flush assigns the race and
+    # racer ids mid-transaction so the entries and bet can reference them
+    # without an intermediate commit.
     async with sessionmaker() as session:
-        race = await repo.create_race(session, guild_id=GUILD_ID)
-        racer1 = await repo.create_racer(
-            session, name="A", owner_id=1, guild_id=GUILD_ID,
+        race = models.Race(guild_id=GUILD_ID)
+        racer1 = models.Racer(
+            name="A", owner_id=1, guild_id=GUILD_ID,
             speed=31, cornering=31, stamina=31,
         )
-        racer2 = await repo.create_racer(
-            session, name="B", owner_id=2, guild_id=GUILD_ID,
+        racer2 = models.Racer(
+            name="B", owner_id=2, guild_id=GUILD_ID,
             speed=0, cornering=0, stamina=0,
         )
-        await repo.create_race_entries(session, race.id, [racer1.id, racer2.id])
-        await wallet_repo.create_wallet(
-            session, user_id=5, guild_id=GUILD_ID, balance=50
-        )
-        await repo.create_bet(
-            session, race_id=race.id, user_id=5, racer_id=racer1.id, amount=10,
-            payout_multiplier=3.5,
-        )
+        session.add_all([race, racer1, racer2])
+        await session.flush()
+        session.add_all([
+            models.RaceEntry(race_id=race.id, racer_id=racer1.id),
+            models.RaceEntry(race_id=race.id, racer_id=racer2.id),
+            economy.models.Wallet(user_id=5, guild_id=GUILD_ID, balance=50),
+            models.Bet(race_id=race.id, user_id=5, racer_id=racer1.id,
+                       amount=10, payout_multiplier=3.5),
+        ])
+        await session.commit()
 
     await cog.race_force_start(ctx, race_id=race.id)
 
@@ -707,23 +690,14 @@ async def test_race_force_start(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_debug_race(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_debug_race(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         race = await repo.create_race(session, guild_id=GUILD_ID)
@@ -741,23 +715,14 @@ async def test_debug_race(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_race_history(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_race_history(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
     ctx.guild = types.SimpleNamespace(id=GUILD_ID)
 
     async with sessionmaker() as session:
@@ -793,23 +758,14 @@ async def test_on_command_error_check_failure() -> None:
 
 
 @pytest.mark.asyncio
-async def test_add_racer_with_stats(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_add_racer_with_stats(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
     owner = types.SimpleNamespace(id=42)
 
     await cog.add_racer(
@@ -823,7 +779,7 @@ async def test_add_racer_with_stats(tmp_path: Path) -> None:
     )
 
     async with sessionmaker() as session:
-        racer = (await session.execute(select(models.Racer))).scalars().first()
+        racer = (await session.execute(_ALL_RACERS_STMT)).scalars().first()
 
     assert racer.speed == 20 and racer.cornering == 21
     assert racer.stamina == 22 and racer.temperament == "Agile"
@@ -831,23 +787,14 @@ async def test_add_racer_with_stats(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_add_racer_random_stats(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_add_racer_random_stats(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
     owner = types.SimpleNamespace(id=99)
 
     # side_effect: career_length(25,40), speed(0,31), cornering(0,31), stamina(0,31)
@@ -857,7 +804,7 @@ async def test_add_racer_random_stats(tmp_path: Path) -> None:
         await cog.add_racer(ctx, name="Lucky", owner=owner, random_stats=True)
 
     async with sessionmaker() as session:
-        racer = (await session.execute(select(models.Racer))).scalars().first()
+        racer = (await session.execute(_ALL_RACERS_STMT)).scalars().first()
 
     assert [racer.speed, racer.cornering, racer.stamina, racer.temperament] == [
         1,
@@ -871,29 +818,20 @@ async def test_add_racer_random_stats(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_add_racer_default_name(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_add_racer_default_name(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
     owner = types.SimpleNamespace(id=42)
 
     await cog.add_racer(ctx, owner=owner, random_stats=True)
 
     async with sessionmaker() as session:
-        racer = (await session.execute(select(models.Racer))).scalars().first()
+        racer = (await session.execute(_ALL_RACERS_STMT)).scalars().first()
 
     assert racer is not None
     assert racer.name  # got a name from the pool
@@ -902,13 +840,9 @@ async def test_add_racer_default_name(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_add_racer_default_name_avoids_taken(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
+async def test_add_racer_default_name_avoids_taken(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=65,
@@ -928,30 +862,21 @@ async def test_add_racer_default_name_avoids_taken(tmp_path: Path) -> None:
     await cog.add_racer(ctx2, owner=owner, random_stats=True)
 
     async with sessionmaker() as session:
-        racers = (await session.execute(select(models.Racer))).scalars().all()
+        racers = (await session.execute(_ALL_RACERS_STMT)).scalars().all()
 
     assert len(racers) == 2
     assert racers[0].name != racers[1].name
 
 
 @pytest.mark.asyncio
-async def test_edit_racer_stats(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_edit_racer_stats(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -967,23 +892,14 @@ async def test_edit_racer_stats(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_edit_racer_owner(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_edit_racer_owner(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -1001,23 +917,14 @@ async def test_edit_racer_owner(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_race_info_bands(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_race_info_bands(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -1039,23 +946,14 @@ async def test_race_info_bands(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_race_info_mood_label(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_race_info_mood_label(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -1069,24 +967,16 @@ async def test_race_info_mood_label(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_guild_settings_override_default_wallet(tmp_path: Path) -> None:
+async def test_guild_settings_override_default_wallet(sessionmaker) -> None:
     """Per-guild default_wallet override should apply when creating wallets."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=economy_cog.Economy,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = economy_cog.Economy(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
     ctx.author = types.SimpleNamespace(id=42)
 
     # Set a per-guild override for default_wallet
@@ -1104,24 +994,15 @@ async def test_guild_settings_override_default_wallet(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_settings_show(tmp_path: Path) -> None:
+async def test_settings_show(sessionmaker) -> None:
     """The settings group should display current values."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    await bot.add_cog(cog)
-    ctx = DummyContext(bot)
 
     await cog._show_settings(ctx)
 
@@ -1139,22 +1020,15 @@ async def test_settings_show(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_buy(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_stable_buy(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
         default_wallet=200,
         racer_buy_base=20,
         racer_buy_multiplier=2,
         max_racers_per_owner=3,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     # Create an unowned racer and give user a wallet
     async with sessionmaker() as session:
@@ -1183,22 +1057,15 @@ async def test_stable_buy(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_buy_insufficient_funds(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_stable_buy_insufficient_funds(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
         default_wallet=5,
         racer_buy_base=20,
         racer_buy_multiplier=2,
         max_racers_per_owner=3,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -1221,22 +1088,15 @@ async def test_stable_buy_insufficient_funds(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_sell(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_stable_sell(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
         default_wallet=100,
         racer_buy_base=20,
         racer_buy_multiplier=2,
         racer_sell_fraction=0.5,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -1261,13 +1121,9 @@ async def test_stable_sell(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_sell_not_owner(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=100)
+async def test_stable_sell_not_owner(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=100)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1284,13 +1140,9 @@ async def test_stable_sell_not_owner(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_rename(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=100)
+async def test_stable_rename(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=100)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1311,13 +1163,9 @@ async def test_stable_rename(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_rename_taken(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=100)
+async def test_stable_rename_taken(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=100)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1342,21 +1190,14 @@ async def test_stable_rename_taken(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_train_success(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_stable_train_success(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
         default_wallet=200,
         training_base=10,
         training_multiplier=2,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -1386,13 +1227,9 @@ async def test_stable_train_success(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_train_not_owner(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=200, training_base=10, training_multiplier=2)
+async def test_stable_train_not_owner(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=200, training_base=10, training_multiplier=2)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1410,19 +1247,14 @@ async def test_stable_train_not_owner(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_train_insufficient_funds(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=5,
-        training_base=10, training_multiplier=2,
+async def test_stable_train_insufficient_funds(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=5,
+        training_base=10,
+        training_multiplier=2,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -1445,13 +1277,9 @@ async def test_stable_train_insufficient_funds(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_train_max_stat(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=200, training_base=10, training_multiplier=2)
+async def test_stable_train_max_stat(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=200, training_base=10, training_multiplier=2)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1469,13 +1297,9 @@ async def test_stable_train_max_stat(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_train_retired(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=200, training_base=10, training_multiplier=2)
+async def test_stable_train_retired(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=200, training_base=10, training_multiplier=2)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1493,20 +1317,15 @@ async def test_stable_train_retired(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_train_failure(tmp_path: Path) -> None:
+async def test_stable_train_failure(sessionmaker) -> None:
     """When training fails, coins are spent and mood drops but stat is unchanged."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=200,
-        training_base=10, training_multiplier=2,
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=200,
+        training_base=10,
+        training_multiplier=2,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -1543,20 +1362,15 @@ async def test_stable_train_failure(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_train_mood_floor(tmp_path: Path) -> None:
+async def test_stable_train_mood_floor(sessionmaker) -> None:
     """Mood at 1 stays at 1 after training (doesn't go below)."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=200,
-        training_base=10, training_multiplier=2,
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=200,
+        training_base=10,
+        training_multiplier=2,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -1583,13 +1397,9 @@ async def test_stable_train_mood_floor(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_rest_success(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=200, rest_cost=15)
+async def test_stable_rest_success(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=200, rest_cost=15)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1618,13 +1428,9 @@ async def test_stable_rest_success(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_rest_not_owner(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=200, rest_cost=15)
+async def test_stable_rest_not_owner(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=200, rest_cost=15)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1642,13 +1448,9 @@ async def test_stable_rest_not_owner(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_rest_already_max(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=200, rest_cost=15)
+async def test_stable_rest_already_max(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=200, rest_cost=15)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1666,13 +1468,9 @@ async def test_stable_rest_already_max(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_rest_insufficient_funds(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=5, rest_cost=15)
+async def test_stable_rest_insufficient_funds(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=5, rest_cost=15)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1698,13 +1496,9 @@ async def test_stable_rest_insufficient_funds(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_feed_success(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=200, feed_cost=30)
+async def test_stable_feed_success(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=200, feed_cost=30)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1733,13 +1527,9 @@ async def test_stable_feed_success(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_feed_caps_at_5(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=200, feed_cost=30)
+async def test_stable_feed_caps_at_5(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=200, feed_cost=30)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1763,13 +1553,9 @@ async def test_stable_feed_caps_at_5(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_feed_retired(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(race_times=["12:00"], default_wallet=200, feed_cost=30)
+async def test_stable_feed_retired(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(race_times=["12:00"], default_wallet=200, feed_cost=30)
     bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
     cog = stable_cog.Stable(bot)
     ctx = DummyContext(bot)
@@ -1792,19 +1578,14 @@ async def test_stable_feed_retired(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_upgrade_success(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=200,
-        max_racers_per_owner=3, stable_upgrade_costs="500,1000,2000",
+async def test_stable_upgrade_success(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=200,
+        max_racers_per_owner=3,
+        stable_upgrade_costs="500,1000,2000",
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         await wallet_repo.create_wallet(
@@ -1827,19 +1608,14 @@ async def test_stable_upgrade_success(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_upgrade_at_max(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=200,
-        max_racers_per_owner=3, stable_upgrade_costs="500,1000,2000",
+async def test_stable_upgrade_at_max(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=200,
+        max_racers_per_owner=3,
+        stable_upgrade_costs="500,1000,2000",
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     # Already fully upgraded
     async with sessionmaker() as session:
@@ -1854,19 +1630,14 @@ async def test_stable_upgrade_at_max(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_upgrade_insufficient_funds(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=50,
-        max_racers_per_owner=3, stable_upgrade_costs="500,1000,2000",
+async def test_stable_upgrade_insufficient_funds(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=50,
+        max_racers_per_owner=3,
+        stable_upgrade_costs="500,1000,2000",
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         await wallet_repo.create_wallet(
@@ -1880,21 +1651,17 @@ async def test_stable_upgrade_insufficient_funds(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_buy_respects_upgraded_slots(tmp_path: Path) -> None:
+async def test_buy_respects_upgraded_slots(sessionmaker) -> None:
     """After upgrading, a player can buy a 4th racer."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=2000,
-        racer_buy_base=20, racer_buy_multiplier=2,
-        max_racers_per_owner=3, stable_upgrade_costs="500,1000,2000",
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=2000,
+        racer_buy_base=20,
+        racer_buy_multiplier=2,
+        max_racers_per_owner=3,
+        stable_upgrade_costs="500,1000,2000",
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         # Player owns 3 racers (at base limit)
@@ -1925,21 +1692,17 @@ async def test_buy_respects_upgraded_slots(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_counts_retired_toward_limit(tmp_path: Path) -> None:
+async def test_stable_counts_retired_toward_limit(sessionmaker) -> None:
     """Retired racers count toward the stable slot limit."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=2000,
-        racer_buy_base=20, racer_buy_multiplier=2,
-        max_racers_per_owner=3, stable_upgrade_costs="500,1000,2000",
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=2000,
+        racer_buy_base=20,
+        racer_buy_multiplier=2,
+        max_racers_per_owner=3,
+        stable_upgrade_costs="500,1000,2000",
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         # 2 active + 1 retired = 3 total (at limit)
@@ -1979,21 +1742,17 @@ async def test_stable_counts_retired_toward_limit(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_breed_success(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=200,
-        max_racers_per_owner=6, breeding_fee=25,
-        breeding_cooldown=6, min_races_to_breed=5,
+async def test_stable_breed_success(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=200,
+        max_racers_per_owner=6,
+        breeding_fee=25,
+        breeding_cooldown=6,
+        min_races_to_breed=5,
         max_foals_per_female=3,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         sire = await repo.create_racer(
@@ -2044,20 +1803,16 @@ async def test_stable_breed_success(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_breed_insufficient_funds(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=10,
-        max_racers_per_owner=6, breeding_fee=25,
-        min_races_to_breed=5, max_foals_per_female=3,
+async def test_stable_breed_insufficient_funds(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=10,
+        max_racers_per_owner=6,
+        breeding_fee=25,
+        min_races_to_breed=5,
+        max_foals_per_female=3,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         sire = await repo.create_racer(
@@ -2081,19 +1836,14 @@ async def test_stable_breed_insufficient_funds(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_breed_same_racer_rejected(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=200,
-        max_racers_per_owner=6, breeding_fee=25,
+async def test_stable_breed_same_racer_rejected(sessionmaker) -> None:
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=200,
+        max_racers_per_owner=6,
+        breeding_fee=25,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         racer = await repo.create_racer(
@@ -2109,21 +1859,17 @@ async def test_stable_breed_same_racer_rejected(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_breed_validation_error(tmp_path: Path) -> None:
+async def test_stable_breed_validation_error(sessionmaker) -> None:
     """Breeding two males should be rejected by validation."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"], default_wallet=200,
-        max_racers_per_owner=6, breeding_fee=25,
-        min_races_to_breed=5, max_foals_per_female=3,
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
+        default_wallet=200,
+        max_racers_per_owner=6,
+        breeding_fee=25,
+        min_races_to_breed=5,
+        max_foals_per_female=3,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         r1 = await repo.create_racer(
@@ -2151,23 +1897,16 @@ async def test_stable_breed_validation_error(tmp_path: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def _make_view_env(tmp_path, **racer_kwargs):
+async def _make_view_env(sessionmaker, **racer_kwargs):
     """Set up bot, cog, session, racer for view tests."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     defaults = dict(
         name="Thunderhoof", owner_id=ctx.author.id, guild_id=GUILD_ID,
@@ -2180,8 +1919,8 @@ async def _make_view_env(tmp_path, **racer_kwargs):
 
 
 @pytest.mark.asyncio
-async def test_stable_view_own_racer(tmp_path):
-    cog, ctx, racer, _ = await _make_view_env(tmp_path)
+async def test_stable_view_own_racer(sessionmaker):
+    cog, ctx, racer, _ = await _make_view_env(sessionmaker)
 
     await cog.stable_view.callback(cog, ctx, racer.id)
 
@@ -2206,9 +1945,9 @@ async def test_stable_view_own_racer(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_stable_view_retired_no_training_costs(tmp_path):
+async def test_stable_view_retired_no_training_costs(sessionmaker):
     """Retired racer should not show training cost lines."""
-    cog, ctx, racer, sessionmaker = await _make_view_env(tmp_path)
+    cog, ctx, racer, sessionmaker = await _make_view_env(sessionmaker)
 
     async with sessionmaker() as session:
         await repo.update_racer(
@@ -2223,9 +1962,9 @@ async def test_stable_view_retired_no_training_costs(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_stable_view_other_racer(tmp_path):
+async def test_stable_view_other_racer(sessionmaker):
     """Non-owner should be able to view any guild racer."""
-    cog, ctx, racer, _ = await _make_view_env(tmp_path, owner_id=999)
+    cog, ctx, racer, _ = await _make_view_env(sessionmaker, owner_id=999)
 
     await cog.stable_view.callback(cog, ctx, racer.id)
 
@@ -2236,8 +1975,8 @@ async def test_stable_view_other_racer(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_stable_view_not_found(tmp_path):
-    cog, ctx, _, _ = await _make_view_env(tmp_path)
+async def test_stable_view_not_found(sessionmaker):
+    cog, ctx, _, _ = await _make_view_env(sessionmaker)
 
     await cog.stable_view.callback(cog, ctx, 99999)
 
@@ -2247,8 +1986,8 @@ async def test_stable_view_not_found(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_stable_view_injured_racer(tmp_path):
-    cog, ctx, racer, sessionmaker = await _make_view_env(tmp_path)
+async def test_stable_view_injured_racer(sessionmaker):
+    cog, ctx, racer, sessionmaker = await _make_view_env(sessionmaker)
 
     async with sessionmaker() as session:
         await repo.update_racer(
@@ -2269,8 +2008,8 @@ async def test_stable_view_injured_racer(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_stable_view_retired_racer(tmp_path):
-    cog, ctx, racer, sessionmaker = await _make_view_env(tmp_path)
+async def test_stable_view_retired_racer(sessionmaker):
+    cog, ctx, racer, sessionmaker = await _make_view_env(sessionmaker)
 
     async with sessionmaker() as session:
         await repo.update_racer(
@@ -2288,22 +2027,15 @@ async def test_stable_view_retired_racer(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_stable_view_with_lineage(tmp_path):
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_stable_view_with_lineage(sessionmaker):
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         sire = await repo.create_racer(
@@ -2333,22 +2065,14 @@ async def test_stable_view_with_lineage(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_set_flavor(tmp_path):
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_set_flavor(sessionmaker):
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    ctx = DummyContext(bot)
 
     await cog.settings_set.callback(cog, ctx, "racer_flavor", "cyberpunk racing lizards")
 
@@ -2365,22 +2089,14 @@ async def test_set_flavor(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_flavor_shows_in_settings(tmp_path):
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+async def test_flavor_shows_in_settings(sessionmaker):
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    ctx = DummyContext(bot)
 
     # Set the flavor first
     await cog.settings_set.callback(cog, ctx, "racer_flavor", "enchanted warhorses")
@@ -2402,14 +2118,10 @@ async def test_flavor_shows_in_settings(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-async def _make_view_env_with_flavor(tmp_path, flavor="cyberpunk lizards", **racer_kwargs):
+async def _make_view_env_with_flavor(sessionmaker, flavor="cyberpunk lizards", **racer_kwargs):
     """Set up env with flavor set for description tests."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=65,
@@ -2435,9 +2147,9 @@ async def _make_view_env_with_flavor(tmp_path, flavor="cyberpunk lizards", **rac
 
 
 @pytest.mark.asyncio
-async def test_stable_view_triggers_description_gen(tmp_path):
+async def test_stable_view_triggers_description_gen(sessionmaker):
     """View racer with no desc + flavor → generates description."""
-    cog, _, ctx, racer, sessionmaker = await _make_view_env_with_flavor(tmp_path)
+    cog, _, ctx, racer, sessionmaker = await _make_view_env_with_flavor(sessionmaker)
 
     with patch("cogs.stable.descriptions.generate_description", return_value="A sleek blue lizard.") as mock_gen:
         await cog.stable_view.callback(cog, ctx, racer.id)
@@ -2454,9 +2166,9 @@ async def test_stable_view_triggers_description_gen(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_stable_view_no_flavor_no_gen(tmp_path):
+async def test_stable_view_no_flavor_no_gen(sessionmaker):
     """No flavor set → no LLM call, shows hint."""
-    cog, _, ctx, racer, _ = await _make_view_env_with_flavor(tmp_path, flavor=None)
+    cog, _, ctx, racer, _ = await _make_view_env_with_flavor(sessionmaker, flavor=None)
 
     with patch("cogs.stable.descriptions.generate_description") as mock_gen:
         await cog.stable_view.callback(cog, ctx, racer.id)
@@ -2468,10 +2180,10 @@ async def test_stable_view_no_flavor_no_gen(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_stable_view_existing_description_no_regen(tmp_path):
+async def test_stable_view_existing_description_no_regen(sessionmaker):
     """Racer already has description → no LLM call."""
     cog, _, ctx, racer, _ = await _make_view_env_with_flavor(
-        tmp_path, description="Already described."
+        sessionmaker, description="Already described."
     )
 
     with patch("cogs.stable.descriptions.generate_description") as mock_gen:
@@ -2484,9 +2196,9 @@ async def test_stable_view_existing_description_no_regen(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_stable_view_gen_failure_graceful(tmp_path):
+async def test_stable_view_gen_failure_graceful(sessionmaker):
     """LLM fails → racer still shown, desc says 'No description yet.'"""
-    cog, _, ctx, racer, _ = await _make_view_env_with_flavor(tmp_path)
+    cog, _, ctx, racer, _ = await _make_view_env_with_flavor(sessionmaker)
 
     with patch("cogs.stable.descriptions.generate_description", return_value=None):
         await cog.stable_view.callback(cog, ctx, racer.id)
@@ -2498,23 +2210,15 @@ async def test_stable_view_gen_failure_graceful(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_add_racer_generates_description(tmp_path):
+async def test_add_racer_generates_description(sessionmaker):
     """Admin add_racer with flavor set → description generated."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    ctx = DummyContext(bot)
     owner = types.SimpleNamespace(id=42, mention="@TestUser")
 
     async with sessionmaker() as session:
@@ -2536,23 +2240,15 @@ async def test_add_racer_generates_description(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_add_racer_no_flavor_no_description(tmp_path):
+async def test_add_racer_no_flavor_no_description(sessionmaker):
     """Admin add_racer without flavor → no description generated."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = derby_cog.Derby(bot)
-    ctx = DummyContext(bot)
     owner = types.SimpleNamespace(id=42, mention="@TestUser")
 
     with patch("cogs.derby.descriptions.generate_description") as mock_gen:
@@ -2562,23 +2258,16 @@ async def test_add_racer_no_flavor_no_description(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_breed_generates_foal_description(tmp_path):
+async def test_breed_generates_foal_description(sessionmaker):
     """Breeding with parent descriptions + flavor → foal gets blended description."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         await core_repo.create_guild_settings(session, guild_id=GUILD_ID, racer_flavor="racing lizards")
@@ -2610,23 +2299,16 @@ async def test_breed_generates_foal_description(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_breed_no_parent_desc_no_foal_desc(tmp_path):
+async def test_breed_no_parent_desc_no_foal_desc(sessionmaker):
     """Parents lack descriptions → no foal description generated."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     async with sessionmaker() as session:
         await core_repo.create_guild_settings(session, guild_id=GUILD_ID, racer_flavor="racing lizards")
@@ -2656,23 +2338,16 @@ async def test_breed_no_parent_desc_no_foal_desc(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_training_recalculates_rank(tmp_path):
+async def test_training_recalculates_rank(sessionmaker):
     """Training a stat past a rank threshold should promote the racer."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     # Create a racer right at the C/B boundary: total=46 (C-Rank), training +1 → 47 (B-Rank)
     async with sessionmaker() as session:
@@ -2702,23 +2377,16 @@ async def test_training_recalculates_rank(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_training_no_rank_change(tmp_path):
+async def test_training_no_rank_change(sessionmaker):
     """Training that doesn't cross a threshold shouldn't show rank change."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
-        race_times=["12:00"],
+    cog, ctx = await _make_cog_env(
+        sessionmaker,
+        cog_cls=stable_cog.Stable,
         default_wallet=100,
         retirement_threshold=65,
         bet_window=0,
         countdown_total=0,
     )
-    bot.scheduler = types.SimpleNamespace(sessionmaker=sessionmaker, active_races=set(), betting_races=set(), guild_settings=GuildSettingsResolver(sessionmaker, bot.settings))
-    cog = stable_cog.Stable(bot)
-    ctx = DummyContext(bot)
 
     # Total=30 (C-Rank), training +1 → 31 still C-Rank
     async with sessionmaker() as session:
@@ -2740,13 +2408,9 @@ async def test_training_no_rank_change(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_stable_browse_rank_filter(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
+async def test_stable_browse_rank_filter(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=65,
@@ -2777,13 +2441,9 @@ async def test_stable_browse_rank_filter(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_browse_gender_filter(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
+async def test_stable_browse_gender_filter(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=65,
@@ -2814,13 +2474,9 @@ async def test_stable_browse_gender_filter(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_stable_browse_no_filters(tmp_path: Path) -> None:
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path/'db.sqlite'}")
-    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
-    bot.settings = Settings(
+async def test_stable_browse_no_filters(sessionmaker) -> None:
+    bot = commands.Bot(command_prefix="!", intents=_INTENTS, help_command=None)
+    bot.settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=65,
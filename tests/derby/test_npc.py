@@ -18,6 +18,7 @@ from derby.models import NPC, Race, RaceEntry, Racer
 from derby.npc_quips import parse_quips, parse_used, pick_quip, should_regenerate
 from derby.npc_generation import generate_racer_stats_for_rank, RANK_STAT_RANGES
 from derby.scheduler import DerbyScheduler
+from tests.conftest import make_settings
 
 
 GUILD_ID = 1
@@ -48,7 +49,6 @@ class DummyBot:
         self.settings = settings
         self.guilds: list[DummyGuild] = []
         self.users: dict = {}
-        self.loop = asyncio.get_event_loop()
         self.logger = logging.getLogger("test")
 
     def get_guild(self, gid: int):
@@ -62,7 +62,7 @@ class DummyBot:
 
 
 def _make_bot() -> DummyBot:
-    settings = Settings(
+    settings = make_settings(
         race_times=["09:00"],
         default_wallet=100,
         retirement_threshold=101,
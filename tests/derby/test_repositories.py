@@ -50,6 +50,27 @@ async def test_racer_crud(session: AsyncSession):
     assert await repo.get_racer(session, racer.id) is None
 
 
+@pytest.mark.asyncio
+async def test_create_many(session: AsyncSession):
+    from derby.models import Racer
+
+    racers = await repo.create_many(
+        session,
+        Racer,
+        [
+            {"name": "One", "owner_id": 1},
+            {"name": "Two", "owner_id": 2, "speed": 9},
+        ],
+    )
+    assert [r.name for r in racers] == ["One", "Two"]
+    assert all(r.id is not None for r in racers)
+    assert racers[1].speed == 9
+    # Column defaults still apply through the bulk path
+    assert racers[0].temperament == "Quirky"
+
+    assert await repo.create_many(session, Racer, []) == []
+
+
 @pytest.mark.asyncio
 async def test_race_crud(session: AsyncSession):
     race = await repo.create_race(session, guild_id=123)
@@ -13,10 +13,22 @@ from derby import repositories as repo
 from derby.models import Race, RaceEntry, Racer
 from derby.scheduler import DerbyScheduler
 from economy import repositories as wallet_repo
+from tests.conftest import make_settings
 
 
 GUILD_ID = 1
 
+# The scheduler paces races with wall-clock sleeps (post-start pause,
+# commentary delays); looptime fast-forwards them so these tests don't
+# pay real seconds per race. looptime can only patch the stock asyncio
+# loop, so this module opts back out of the suite-wide uvloop policy.
+pytestmark = pytest.mark.looptime
+
+
+@pytest.fixture(scope="module")
+def event_loop_policy():
+    return asyncio.DefaultEventLoopPolicy()
+
 
 class DummyMessage:
     """Minimal message stub that supports edit."""
@@ -85,16 +97,19 @@ class DummyGuild:
 class DummyBot:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        # List mirrors discord.py's bot.guilds (the scheduler iterates
+        # it); the dict gives get_guild an O(1) lookup per tick.
         self.guilds: list[DummyGuild] = []
+        self._guilds_by_id: dict[int, DummyGuild] = {}
         self.users: dict[int, DummyUser] = {}
-        self.loop = asyncio.get_event_loop()
         self.logger = logging.getLogger("test")
 
+    def add_guild(self, guild: DummyGuild) -> None:
+        self.guilds.append(guild)
+        self._guilds_by_id[guild.id] = guild
+
     def get_guild(self, gid: int) -> DummyGuild | None:
-        for g in self.guilds:
-            if g.id == gid:
-                return g
-        return None
+        return self._guilds_by_id.get(gid)
 
     def get_user(self, uid: int) -> "DummyUser | None":
         return self.users.get(uid)
@@ -112,7 +127,7 @@ class DummyUser:
 @pytest.mark.asyncio
 async def test_scheduler_creates_and_runs_race(tmp_path: Path) -> None:
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -124,7 +139,7 @@ async def test_scheduler_creates_and_runs_race(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -171,7 +186,7 @@ async def test_scheduler_creates_and_runs_race(tmp_path: Path) -> None:
 @pytest.mark.asyncio
 async def test_retirement(tmp_path: Path) -> None:
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -182,7 +197,7 @@ async def test_retirement(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -217,7 +232,7 @@ async def test_retirement(tmp_path: Path) -> None:
 @pytest.mark.asyncio
 async def test_stream_commentary(tmp_path: Path) -> None:
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -228,7 +243,7 @@ async def test_stream_commentary(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -255,7 +270,7 @@ async def test_stream_commentary_renders_standings_field_when_charts_passed(
     """When charts are provided, every embed update attaches a
     'Current Standings' field with the correct per-event chart content."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -266,7 +281,7 @@ async def test_stream_commentary_renders_standings_field_when_charts_passed(
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -298,7 +313,7 @@ async def test_stream_commentary_clamps_chart_index_when_log_longer(
     """If the log has more paragraphs than charts (template fallback
     case), trailing paragraphs should re-use the last chart."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -309,7 +324,7 @@ async def test_stream_commentary_clamps_chart_index_when_log_longer(
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -340,7 +355,7 @@ async def test_stream_commentary_strips_chart_from_old_msg_on_rollover(
     the fresh chart — so only one standings field is visible at a time
     across the whole conversation."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -351,7 +366,7 @@ async def test_stream_commentary_strips_chart_from_old_msg_on_rollover(
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -395,7 +410,7 @@ async def test_post_results_includes_final_chart_when_provided(
     when final_chart is supplied — consolidates end-of-race info into
     one message instead of duplicating across commentary + results."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -406,7 +421,7 @@ async def test_post_results_includes_final_chart_when_provided(
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -439,7 +454,7 @@ async def test_stream_commentary_rolls_over_when_description_overflows(
     limit, we flush to a new message so the final paragraph always fits
     instead of getting clipped by Discord."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -450,7 +465,7 @@ async def test_stream_commentary_rolls_over_when_description_overflows(
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -485,9 +500,10 @@ async def test_stream_commentary_rolls_over_when_description_overflows(
 
 
 @pytest.mark.asyncio
+@pytest.mark.looptime(False)  # real interleaving: cancel mid-stream, not after fast-forward
 async def test_commentary_stops_when_cancelled(tmp_path: Path) -> None:
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -498,7 +514,7 @@ async def test_commentary_stops_when_cancelled(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -511,6 +527,7 @@ async def test_commentary_stops_when_cancelled(tmp_path: Path) -> None:
         await asyncio.sleep(0.01)
         async with scheduler.sessionmaker() as session:
             await repo.delete_race(session, race.id)
+        scheduler.cancel_commentary(race.id)
 
     cancel_task = asyncio.create_task(cancel())
     await scheduler._stream_commentary(race.id, guild.id, events, delay=0.05)
@@ -522,7 +539,7 @@ async def test_commentary_stops_when_cancelled(tmp_path: Path) -> None:
 @pytest.mark.asyncio
 async def test_payout_dm_sent(tmp_path: Path) -> None:
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -533,7 +550,7 @@ async def test_payout_dm_sent(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     user1 = DummyUser(10)
     user2 = DummyUser(11)
@@ -582,7 +599,7 @@ async def test_race_uses_max_six_racers(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -593,7 +610,7 @@ async def test_race_uses_max_six_racers(
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -640,7 +657,7 @@ async def test_race_uses_max_six_racers(
 @pytest.mark.asyncio
 async def test_config_channel_used(tmp_path: Path) -> None:
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -653,7 +670,7 @@ async def test_config_channel_used(tmp_path: Path) -> None:
     guild = DummyGuild(GUILD_ID)
     special = DummyChannel("special")
     guild.text_channels.append(special)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -670,7 +687,7 @@ async def test_config_channel_used(tmp_path: Path) -> None:
 async def test_ensure_pending_races_creates_race(tmp_path: Path) -> None:
     """On startup, _ensure_pending_races should create a race if none exists."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -681,7 +698,7 @@ async def test_ensure_pending_races_creates_race(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -707,7 +724,7 @@ async def test_ensure_pending_races_creates_race(tmp_path: Path) -> None:
 async def test_guild_isolation(tmp_path: Path) -> None:
     """Racers from one guild should not appear in another guild's races."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -760,7 +777,7 @@ async def test_guild_isolation(tmp_path: Path) -> None:
 async def test_guild_settings_channel_override(tmp_path: Path) -> None:
     """Guild-specific derby_channel should be used when set."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -773,7 +790,7 @@ async def test_guild_settings_channel_override(tmp_path: Path) -> None:
     guild = DummyGuild(GUILD_ID)
     arena = DummyChannel("arena")
     guild.text_channels.append(arena)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -798,7 +815,7 @@ async def test_guild_settings_channel_override(tmp_path: Path) -> None:
 async def test_guild_settings_max_racers_override(tmp_path: Path) -> None:
     """Per-guild max_racers_per_race should limit participants."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -810,7 +827,7 @@ async def test_guild_settings_max_racers_override(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -837,7 +854,7 @@ async def test_guild_settings_max_racers_override(tmp_path: Path) -> None:
 async def test_replenish_pool(tmp_path: Path) -> None:
     """Pool replenishment creates racers up to min_pool_size, capped at 5 per call."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -848,7 +865,7 @@ async def test_replenish_pool(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -886,7 +903,7 @@ async def test_replenish_pool_sets_abilities_on_new_racers(tmp_path: Path) -> No
     bot restart would silently back-fill them, spamming the log with
     "Back-filling abilities for N racers" every boot."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -897,7 +914,7 @@ async def test_replenish_pool_sets_abilities_on_new_racers(tmp_path: Path) -> No
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -923,7 +940,7 @@ async def test_replenish_pool_sets_abilities_on_new_racers(tmp_path: Path) -> No
 async def test_replenish_pool_disabled(tmp_path: Path) -> None:
     """When min_pool_size=0, no racers are created."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -934,7 +951,7 @@ async def test_replenish_pool_disabled(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -949,7 +966,7 @@ async def test_placement_prizes_credited(tmp_path: Path) -> None:
     from economy import repositories as wallet_repo
 
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -961,7 +978,7 @@ async def test_placement_prizes_credited(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -997,7 +1014,7 @@ async def test_placement_prizes_credited(tmp_path: Path) -> None:
 async def test_breed_cooldown_ticks_down(tmp_path: Path) -> None:
     """After a race, breed_cooldown decrements for all guild racers."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -1008,7 +1025,7 @@ async def test_breed_cooldown_ticks_down(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -1047,7 +1064,7 @@ async def test_breed_cooldown_ticks_down(tmp_path: Path) -> None:
 async def test_breed_cooldown_stops_at_zero(tmp_path: Path) -> None:
     """Breed cooldown doesn't go negative."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -1058,7 +1075,7 @@ async def test_breed_cooldown_stops_at_zero(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -1088,7 +1105,7 @@ async def test_breed_cooldown_stops_at_zero(tmp_path: Path) -> None:
 async def test_expire_pool_racers(tmp_path: Path) -> None:
     """Expired pool racers are deleted; non-expired ones survive."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -1099,7 +1116,7 @@ async def test_expire_pool_racers(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -1136,7 +1153,7 @@ async def test_expire_pool_racers_defers_racer_in_pending_race(tmp_path: Path) -
     must NOT be deleted — otherwise the race starts with missing racers
     and players see 'Racer <id>' placeholder names."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -1147,7 +1164,7 @@ async def test_expire_pool_racers_defers_racer_in_pending_race(tmp_path: Path) -
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -1196,7 +1213,7 @@ async def test_expire_pool_racers_defers_racer_in_pending_race(tmp_path: Path) -
 async def test_replenish_replaces_expired(tmp_path: Path) -> None:
     """After expiry, replenish fills the gap back to min_pool_size."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -1207,7 +1224,7 @@ async def test_replenish_replaces_expired(tmp_path: Path) -> None:
     )
     bot = DummyBot(settings)
     guild = DummyGuild(GUILD_ID)
-    bot.guilds.append(guild)
+    bot.add_guild(guild)
 
     scheduler = DerbyScheduler(bot, db_path=str(db_path))
     await scheduler._init_db()
@@ -1239,7 +1256,7 @@ async def test_replenish_replaces_expired(tmp_path: Path) -> None:
 async def test_competitive_window_picks_within_range(tmp_path: Path) -> None:
     """Racers picked for a race should all be within the stat window."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -1281,7 +1298,7 @@ async def test_competitive_window_picks_within_range(tmp_path: Path) -> None:
 async def test_competitive_window_owned_auto_included(tmp_path: Path) -> None:
     """Owned racers in the window should be auto-included."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -1321,7 +1338,7 @@ async def test_competitive_window_owned_auto_included(tmp_path: Path) -> None:
 async def test_competitive_window_one_per_owner(tmp_path: Path) -> None:
     """Each owner should have at most 1 racer in a race."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -1369,7 +1386,7 @@ async def test_competitive_window_one_per_owner(tmp_path: Path) -> None:
 async def test_competitive_window_fallback(tmp_path: Path) -> None:
     """When not enough racers for 6, should fall back to 4, then 2."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -1407,7 +1424,7 @@ async def test_competitive_window_returns_none_when_impossible(
 ) -> None:
     """Returns None when fewer than 2 racers exist."""
     db_path = tmp_path / "db.sqlite"
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         retirement_threshold=101,
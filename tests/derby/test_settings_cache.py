@@ -3,25 +3,24 @@
 from __future__ import annotations
 
 import time
-from pathlib import Path
 
 import pytest
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from config import Settings
 from db_base import Base
 from core import repositories as repo  # all repo calls below are core fns
 from derby.settings_cache import GuildSettingsResolver
+from tests.conftest import make_settings
 
 GUILD_ID = 1
 
 
-async def _setup(tmp_path: Path):
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+async def _setup():
+    engine = create_async_engine("sqlite+aiosqlite://")
     sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    settings = Settings(
+    settings = make_settings(
         race_times=["12:00"],
         default_wallet=100,
         bet_window=120,
@@ -30,8 +29,8 @@ async def _setup(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_get_returns_none_when_no_row(tmp_path: Path) -> None:
-    _, sessionmaker, settings = await _setup(tmp_path)
+async def test_get_returns_none_when_no_row() -> None:
+    _, sessionmaker, settings = await _setup()
     resolver = GuildSettingsResolver(sessionmaker, settings)
 
     gs = await resolver.get(GUILD_ID)
@@ -39,8 +38,8 @@ async def test_get_returns_none_when_no_row(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_get_returns_row_when_present(tmp_path: Path) -> None:
-    _, sessionmaker, settings = await _setup(tmp_path)
+async def test_get_returns_row_when_present() -> None:
+    _, sessionmaker, settings = await _setup()
     async with sessionmaker() as session:
         await repo.create_guild_settings(session, guild_id=GUILD_ID, bet_window=999)
 
@@ -51,8 +50,8 @@ async def test_get_returns_row_when_present(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_resolve_falls_back_to_global_when_no_row(tmp_path: Path) -> None:
-    _, sessionmaker, settings = await _setup(tmp_path)
+async def test_resolve_falls_back_to_global_when_no_row() -> None:
+    _, sessionmaker, settings = await _setup()
     resolver = GuildSettingsResolver(sessionmaker, settings)
 
     val = await resolver.resolve(GUILD_ID, "bet_window")
@@ -60,8 +59,8 @@ async def test_resolve_falls_back_to_global_when_no_row(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_resolve_uses_guild_override(tmp_path: Path) -> None:
-    _, sessionmaker, settings = await _setup(tmp_path)
+async def test_resolve_uses_guild_override() -> None:
+    _, sessionmaker, settings = await _setup()
     async with sessionmaker() as session:
         await repo.create_guild_settings(session, guild_id=GUILD_ID, bet_window=42)
 
@@ -71,8 +70,8 @@ async def test_resolve_uses_guild_override(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_cache_hit_skips_db(tmp_path: Path) -> None:
-    _, sessionmaker, settings = await _setup(tmp_path)
+async def test_cache_hit_skips_db() -> None:
+    _, sessionmaker, settings = await _setup()
     async with sessionmaker() as session:
         await repo.create_guild_settings(session, guild_id=GUILD_ID, bet_window=42)
 
@@ -89,8 +88,8 @@ async def test_cache_hit_skips_db(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_bust_invalidates_cache(tmp_path: Path) -> None:
-    _, sessionmaker, settings = await _setup(tmp_path)
+async def test_bust_invalidates_cache() -> None:
+    _, sessionmaker, settings = await _setup()
     async with sessionmaker() as session:
         await repo.create_guild_settings(session, guild_id=GUILD_ID, bet_window=42)
 
@@ -105,8 +104,8 @@ async def test_bust_invalidates_cache(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_cache_expires_after_max_age(tmp_path: Path) -> None:
-    _, sessionmaker, settings = await _setup(tmp_path)
+async def test_cache_expires_after_max_age() -> None:
+    _, sessionmaker, settings = await _setup()
     async with sessionmaker() as session:
         await repo.create_guild_settings(session, guild_id=GUILD_ID, bet_window=42)
 
@@ -122,8 +121,8 @@ async def test_cache_expires_after_max_age(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_bust_unknown_guild_is_noop(tmp_path: Path) -> None:
-    _, sessionmaker, settings = await _setup(tmp_path)
+async def test_bust_unknown_guild_is_noop() -> None:
+    _, sessionmaker, settings = await _setup()
     resolver = GuildSettingsResolver(sessionmaker, settings)
 
     # Should not raise
@@ -132,8 +131,8 @@ async def test_bust_unknown_guild_is_noop(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_independent_guild_caches(tmp_path: Path) -> None:
-    _, sessionmaker, settings = await _setup(tmp_path)
+async def test_independent_guild_caches() -> None:
+    _, sessionmaker, settings = await _setup()
     async with sessionmaker() as session:
         await repo.create_guild_settings(session, guild_id=1, bet_window=10)
         await repo.create_guild_settings(session, guild_id=2, bet_window=20)
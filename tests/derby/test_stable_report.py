@@ -15,6 +15,7 @@ from config import Settings
 from derby import logic, repositories as repo
 from derby.models import Racer, Tournament, TournamentEntry
 from derby.scheduler import DerbyScheduler
+from tests.conftest import make_settings
 
 
 GUILD_ID = 1
@@ -44,7 +45,6 @@ class DummyBot:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self.guilds: list[DummyGuild] = []
-        self.loop = asyncio.get_event_loop()
         self.logger = logging.getLogger("test")
 
     def get_guild(self, gid: int):
@@ -71,7 +71,7 @@ class DummyContext:
 
 
 def _make_bot() -> DummyBot:
-    settings = Settings(
+    settings = make_settings(
         race_times=["09:00"],
         default_wallet=100,
         retirement_threshold=101,
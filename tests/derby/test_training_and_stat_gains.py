@@ -1,5 +1,4 @@
 """Tests for training limits and placement stat gains."""
-from pathlib import Path
 
 import pytest
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
@@ -12,8 +11,8 @@ from derby import repositories as repo
 GUILD = 1
 
 
-async def _make_db(tmp_path: Path):
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+async def _make_db():
+    engine = create_async_engine("sqlite+aiosqlite://")
     sm = async_sessionmaker(engine, expire_on_commit=False)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -36,8 +35,8 @@ def _make_map(segments: list[tuple[str, int]]) -> logic.RaceMap:
 
 
 @pytest.mark.asyncio
-async def test_trains_since_race_defaults_to_zero(tmp_path: Path):
-    sm = await _make_db(tmp_path)
+async def test_trains_since_race_defaults_to_zero():
+    sm = await _make_db()
     async with sm() as session:
         r = await repo.create_racer(
             session, name="A", owner_id=1, guild_id=GUILD, speed=10,
@@ -46,8 +45,8 @@ async def test_trains_since_race_defaults_to_zero(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_trains_since_race_increments(tmp_path: Path):
-    sm = await _make_db(tmp_path)
+async def test_trains_since_race_increments():
+    sm = await _make_db()
     async with sm() as session:
         r = await repo.create_racer(
             session, name="A", owner_id=1, guild_id=GUILD, speed=10,
@@ -64,9 +63,9 @@ async def test_trains_since_race_increments(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_stat_gain_weighted_by_track(tmp_path: Path):
+async def test_stat_gain_weighted_by_track():
     """An all-climb track with maxed speed/cornering must give stamina."""
-    sm = await _make_db(tmp_path)
+    sm = await _make_db()
     race_map = _make_map([("climb", 10)])
     async with sm() as session:
         # Max out speed and cornering so only stamina is eligible
@@ -90,9 +89,9 @@ async def test_stat_gain_weighted_by_track(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_stat_gain_skips_maxed_stat(tmp_path: Path):
+async def test_stat_gain_skips_maxed_stat():
     """If the dominant stat is maxed, a different stat should be chosen."""
-    sm = await _make_db(tmp_path)
+    sm = await _make_db()
     race_map = _make_map([("climb", 10)])  # heavily stamina-weighted
     async with sm() as session:
         r = await repo.create_racer(
@@ -114,9 +113,9 @@ async def test_stat_gain_skips_maxed_stat(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_stat_gain_skipped_when_all_maxed(tmp_path: Path):
+async def test_stat_gain_skipped_when_all_maxed():
     """Racer with all stats at MAX_STAT gets no gain."""
-    sm = await _make_db(tmp_path)
+    sm = await _make_db()
     race_map = _make_map([("straight", 5)])
     async with sm() as session:
         r = await repo.create_racer(
@@ -136,9 +135,9 @@ async def test_stat_gain_skipped_when_all_maxed(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_stat_gain_skips_npc_racers(tmp_path: Path):
+async def test_stat_gain_skips_npc_racers():
     """NPC-owned racers should not receive stat gains."""
-    sm = await _make_db(tmp_path)
+    sm = await _make_db()
     race_map = _make_map([("straight", 5)])
     async with sm() as session:
         r = await repo.create_racer(
@@ -161,9 +160,9 @@ async def test_stat_gain_skips_npc_racers(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_stat_gain_skips_non_placing(tmp_path: Path):
+async def test_stat_gain_skips_non_placing():
     """Only racers in prize positions get stat gains."""
-    sm = await _make_db(tmp_path)
+    sm = await _make_db()
     race_map = _make_map([("straight", 5)])
     async with sm() as session:
         r1 = await repo.create_racer(
@@ -187,9 +186,9 @@ async def test_stat_gain_skips_non_placing(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_stat_gain_none_without_map(tmp_path: Path):
+async def test_stat_gain_none_without_map():
     """No stat gains when race_map is None."""
-    sm = await _make_db(tmp_path)
+    sm = await _make_db()
     async with sm() as session:
         r = await repo.create_racer(
             session, name="A", owner_id=42, guild_id=GUILD,
@@ -203,9 +202,9 @@ async def test_stat_gain_none_without_map(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_stat_gain_triggers_rank_recalc(tmp_path: Path):
+async def test_stat_gain_triggers_rank_recalc():
     """Stat gain should recalculate rank when crossing a threshold."""
-    sm = await _make_db(tmp_path)
+    sm = await _make_db()
     # B-rank threshold is 47. Give racer total 46 so +1 pushes to B.
     race_map = _make_map([("straight", 10)])
     async with sm() as session:
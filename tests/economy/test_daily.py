@@ -18,6 +18,7 @@ from derby import logic, repositories as repo
 from derby.models import DailyReward, Racer
 from derby.scheduler import DerbyScheduler
 from economy import repositories as wallet_repo
+from tests.conftest import make_settings
 
 
 GUILD_ID = 1
@@ -56,7 +57,6 @@ class DummyBot:
         self.settings = settings
         self.guilds: list[DummyGuild] = []
         self.users: dict[int, DummyUser] = {}
-        self.loop = asyncio.get_event_loop()
         self.logger = logging.getLogger("test")
 
     def get_guild(self, gid: int):
@@ -85,7 +85,7 @@ class DummyContext:
 
 
 def _make_bot() -> DummyBot:
-    settings = Settings(
+    settings = make_settings(
         race_times=["09:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -160,7 +160,7 @@ async def test_generate_dailies_creates_reward(tmp_path: Path) -> None:
             session, user_id=USER_ID, guild_id=GUILD_ID, balance=100,
         )
 
-    with patch("random.randint", return_value=20):
+    with patch.object(sched._rng, "randint", return_value=20):
         await sched._generate_dailies()
 
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -189,7 +189,7 @@ async def test_generate_dailies_rank_multiplier(tmp_path: Path) -> None:
             session, user_id=USER_ID, guild_id=GUILD_ID, balance=100,
         )
 
-    with patch("random.randint", return_value=25):
+    with patch.object(sched._rng, "randint", return_value=25):
         await sched._generate_dailies()
 
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -220,7 +220,7 @@ async def test_generate_dailies_picks_best_racer(tmp_path: Path) -> None:
             session, user_id=USER_ID, guild_id=GUILD_ID, balance=100,
         )
 
-    with patch("random.randint", return_value=20):
+    with patch.object(sched._rng, "randint", return_value=20):
         await sched._generate_dailies()
 
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -272,7 +272,7 @@ async def test_generate_dailies_no_racer_player(tmp_path: Path) -> None:
             session, user_id=USER_ID, guild_id=GUILD_ID, balance=50,
         )
 
-    with patch("random.randint", return_value=22):
+    with patch.object(sched._rng, "randint", return_value=22):
         await sched._generate_dailies()
 
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -303,7 +303,7 @@ async def test_generate_dailies_with_flavor(tmp_path: Path) -> None:
             session, user_id=USER_ID, guild_id=GUILD_ID, balance=100,
         )
 
-    with patch("random.randint", return_value=20), \
+    with patch.object(sched._rng, "randint", return_value=20), \
          patch("derby.descriptions.generate_daily_flavor", new_callable=AsyncMock) as mock_llm:
         mock_llm.return_value = "NeonScale dug up a corroded circuit board behind a dumpster."
         await sched._generate_dailies()
@@ -332,7 +332,7 @@ async def test_generate_dailies_no_flavor(tmp_path: Path) -> None:
             session, user_id=USER_ID, guild_id=GUILD_ID, balance=100,
         )
 
-    with patch("random.randint", return_value=20), \
+    with patch.object(sched._rng, "randint", return_value=20), \
          patch("derby.descriptions.generate_daily_flavor", new_callable=AsyncMock) as mock_llm:
         await sched._generate_dailies()
 
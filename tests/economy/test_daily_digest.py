@@ -24,6 +24,7 @@ from derby.models import (
 from derby.scheduler import DerbyScheduler
 from economy import repositories as wallet_repo
 from economy.models import Wallet
+from tests.conftest import make_settings
 
 
 GUILD_ID = 1
@@ -54,7 +55,6 @@ class DummyBot:
         self.settings = settings
         self.guilds: list[DummyGuild] = []
         self.users: dict = {}
-        self.loop = asyncio.get_event_loop()
         self.logger = logging.getLogger("test")
 
     def get_guild(self, gid: int):
@@ -68,7 +68,7 @@ class DummyBot:
 
 
 def _make_bot() -> DummyBot:
-    settings = Settings(
+    settings = make_settings(
         race_times=["09:00"],
         default_wallet=100,
         retirement_threshold=101,
@@ -9,24 +9,26 @@ Provides:
 
 from __future__ import annotations
 
-from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from db_base import Base
 import fishing.models  # noqa: F401 — register fishing tables on Base
 from fishing.active import ActiveFishingRunner
+from tests.conftest import apply_test_pragmas
 
 
 @pytest_asyncio.fixture
-async def sessionmaker(tmp_path: Path):
+async def sessionmaker():
     """Per-test in-memory sqlite sessionmaker with the schema applied."""
-    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    engine = create_async_engine("sqlite+aiosqlite://")
+    event.listens_for(engine.sync_engine, "connect")(apply_test_pragmas)
     sm = async_sessionmaker(engine, expire_on_commit=False)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
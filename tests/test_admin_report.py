@@ -16,6 +16,7 @@ from core import repositories as core_repo
 from core.models import CommandLog
 from derby import repositories as repo
 from derby.scheduler import DerbyScheduler
+from tests.conftest import make_settings
 
 # Admin reporting is cross-cutting (touches every game's tables) but lives
 # at the top level rather than under tests/derby/. Mark explicitly so
@@ -51,7 +52,6 @@ class DummyBot:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self.guilds: list[DummyGuild] = []
-        self.loop = asyncio.get_event_loop()
         self.logger = logging.getLogger("test")
 
     def get_guild(self, gid: int):
@@ -78,7 +78,7 @@ class DummyContext:
 
 
 def _make_bot() -> DummyBot:
-    settings = Settings(
+    settings = make_settings(
         race_times=["09:00"],
         default_wallet=100,
         retirement_threshold=101,